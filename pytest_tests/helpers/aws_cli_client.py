@@ -1,17 +1,48 @@
+import atexit
 import json
 import logging
 import os
+import select
+import shlex
+import shutil
+import subprocess
+import threading
 from datetime import datetime
+from time import time
 from typing import Optional
 
 import allure
-from cli_helpers import _cmd_run
+from cli_helpers import COLOR_GREEN, COLOR_OFF, _attach_allure_log, _cmd_run
 from common import ASSETS_DIR
 
 logger = logging.getLogger("NeoLogger")
 REGULAR_TIMEOUT = 90
 LONG_TIMEOUT = 240
 
+# Script of the worker process that AwsCliPersistentClient keeps running. The worker imports
+# awscli once and then executes commands that it receives on stdin as JSON-encoded lists of
+# arguments. Output of every command is captured and sent back as a single JSON line, the
+# worker runs one command at a time, so swapping of sys.stdout affects nobody else
+AWS_CLI_WORKER_SCRIPT = """
+import io, json, sys
+from contextlib import redirect_stderr, redirect_stdout
+from awscli.clidriver import create_clidriver
+
+channel = sys.stdout
+for line in sys.stdin:
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding="utf-8", errors="replace", write_through=True)
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            return_code = create_clidriver().main(json.loads(line))
+        except SystemExit as exc:
+            return_code = exc.code if isinstance(exc.code, int) else 1
+    output.flush()
+    result = {"rc": return_code, "output": buffer.getvalue().decode("utf-8", "replace")}
+    channel.write(json.dumps(result) + "\\n")
+    channel.flush()
+"""
+
 
 class AwsCliClient:
     # Flags that we use for all S3 commands: disable SSL verification (as we use self-signed
@@ -52,11 +83,11 @@ class AwsCliClient:
             cmd += f" --grant-read {GrantRead}"
         if CreateBucketConfiguration:
             cmd += f" --create-bucket-configuration LocationConstraint={CreateBucketConfiguration['LocationConstraint']}"
-        _cmd_run(cmd, REGULAR_TIMEOUT)
+        self._run(cmd, REGULAR_TIMEOUT)
 
     def list_buckets(self) -> dict:
         cmd = f"aws {self.common_flags} s3api list-buckets --endpoint {self.s3gate_endpoint}"
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_bucket_acl(self, Bucket: str) -> dict:
@@ -64,7 +95,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-acl --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def get_bucket_versioning(self, Bucket: str) -> dict:
@@ -72,7 +103,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-versioning --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def get_bucket_location(self, Bucket: str) -> dict:
@@ -80,7 +111,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-location --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def put_bucket_versioning(self, Bucket: str, VersioningConfiguration: dict) -> dict:
@@ -89,7 +120,7 @@ class AwsCliClient:
             f'--versioning-configuration Status={VersioningConfiguration.get("Status")} '
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def list_objects(self, Bucket: str) -> dict:
@@ -97,7 +128,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api list-objects --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def list_objects_v2(self, Bucket: str) -> dict:
@@ -105,7 +136,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api list-objects-v2 --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def list_object_versions(self, Bucket: str) -> dict:
@@ -113,7 +144,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api list-object-versions --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def copy_object(
@@ -143,12 +174,12 @@ class AwsCliClient:
             cmd += f" --tagging-directive {TaggingDirective}"
         if Tagging:
             cmd += f" --tagging {Tagging}"
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def head_bucket(self, Bucket: str) -> dict:
         cmd = f"aws {self.common_flags} s3api head-bucket --bucket {Bucket} --endpoint {self.s3gate_endpoint}"
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object(
@@ -187,7 +218,7 @@ class AwsCliClient:
             cmd += f" --grant-full-control '{GrantFullControl}'"
         if GrantRead:
             cmd += f" --grant-read {GrantRead}"
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def head_object(self, Bucket: str, Key: str, VersionId: str = None) -> dict:
@@ -196,7 +227,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api head-object --bucket {Bucket} --key {Key} "
             f"{version} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_object(
@@ -214,7 +245,7 @@ class AwsCliClient:
         )
         if Range:
             cmd += f" --range {Range}"
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def get_object_acl(self, Bucket: str, Key: str, VersionId: Optional[str] = None) -> dict:
@@ -223,7 +254,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-object-acl --bucket {Bucket} --key {Key} "
             f"{version} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def put_object_acl(
@@ -244,7 +275,7 @@ class AwsCliClient:
             cmd += f" --grant-write {GrantWrite}"
         if GrantRead:
             cmd += f" --grant-read {GrantRead}"
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def put_bucket_acl(
@@ -264,7 +295,7 @@ class AwsCliClient:
             cmd += f" --grant-write {GrantWrite}"
         if GrantRead:
             cmd += f" --grant-read {GrantRead}"
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def delete_objects(self, Bucket: str, Delete: dict) -> dict:
@@ -277,7 +308,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api delete-objects --bucket {Bucket} "
             f"--delete file://{file_path} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def delete_object(self, Bucket: str, Key: str, VersionId: str = None) -> dict:
@@ -286,7 +317,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api delete-object --bucket {Bucket} "
             f"--key {Key} {version} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def get_object_attributes(
@@ -307,12 +338,12 @@ class AwsCliClient:
             f"--key {key} {version} {parts} {part_number} --object-attributes {attrs} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def delete_bucket(self, Bucket: str) -> dict:
         cmd = f"aws {self.common_flags} s3api delete-bucket --bucket {Bucket} --endpoint {self.s3gate_endpoint}"
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def get_bucket_tagging(self, Bucket: str) -> dict:
@@ -320,7 +351,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-tagging --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_bucket_policy(self, Bucket: str) -> dict:
@@ -328,7 +359,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-policy --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_bucket_policy(self, Bucket: str, Policy: dict) -> dict:
@@ -336,7 +367,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-bucket-policy --bucket {Bucket} "
             f"--policy {json.dumps(Policy)} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_bucket_cors(self, Bucket: str) -> dict:
@@ -344,7 +375,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-bucket-cors --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_bucket_cors(self, Bucket: str, CORSConfiguration: dict) -> dict:
@@ -352,7 +383,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-bucket-cors --bucket {Bucket} "
             f"--cors-configuration '{json.dumps(CORSConfiguration)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def delete_bucket_cors(self, Bucket: str) -> dict:
@@ -360,7 +391,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api delete-bucket-cors --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_bucket_tagging(self, Bucket: str, Tagging: dict) -> dict:
@@ -368,7 +399,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-bucket-tagging --bucket {Bucket} "
             f"--tagging '{json.dumps(Tagging)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def delete_bucket_tagging(self, Bucket: str) -> dict:
@@ -376,7 +407,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api delete-bucket-tagging --bucket {Bucket} "
             f"--endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_retention(
@@ -387,7 +418,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-object-retention --bucket {Bucket} --key {Key} "
             f"{version} --retention '{json.dumps(Retention, indent=4, sort_keys=True, default=str)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_legal_hold(
@@ -398,7 +429,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api  put-object-legal-hold --bucket {Bucket} --key {Key} "
             f"{version} --legal-hold '{json.dumps(LegalHold)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_retention(
@@ -416,7 +447,7 @@ class AwsCliClient:
         )
         if not BypassGovernanceRetention is None:
             cmd += " --bypass-governance-retention"
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_legal_hold(
@@ -427,7 +458,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api  put-object-legal-hold --bucket {Bucket} --key {Key} "
             f"{version} --legal-hold '{json.dumps(LegalHold)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_tagging(self, Bucket: str, Key: str, Tagging: dict) -> dict:
@@ -435,7 +466,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-object-tagging --bucket {Bucket} --key {Key} "
             f"--tagging '{json.dumps(Tagging)}' --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_object_tagging(self, Bucket: str, Key: str, VersionId: Optional[str] = None) -> dict:
@@ -444,7 +475,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-object-tagging --bucket {Bucket} --key {Key} "
             f"{version}  --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, REGULAR_TIMEOUT)
+        output = self._run(cmd, REGULAR_TIMEOUT)
         return self._to_json(output)
 
     def delete_object_tagging(self, Bucket: str, Key: str) -> dict:
@@ -452,7 +483,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api delete-object-tagging --bucket {Bucket} "
             f"--key {Key} --endpoint {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     @allure.step("Sync directory S3")
@@ -473,7 +504,7 @@ class AwsCliClient:
                 cmd += f" {key}={value}"
         if ACL:
             cmd += f" --acl {ACL}"
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     @allure.step("CP directory S3")
@@ -494,7 +525,7 @@ class AwsCliClient:
                 cmd += f" {key}={value}"
         if ACL:
             cmd += f" --acl {ACL}"
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def create_multipart_upload(self, Bucket: str, Key: str) -> dict:
@@ -502,7 +533,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api create-multipart-upload --bucket {Bucket} "
             f"--key {Key} --endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def list_multipart_uploads(self, Bucket: str) -> dict:
@@ -510,7 +541,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api list-multipart-uploads --bucket {Bucket} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict:
@@ -518,7 +549,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api abort-multipart-upload  --bucket {Bucket} "
             f"--key {Key} --upload-id {UploadId} --endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def upload_part(self, UploadId: str, Bucket: str, Key: str, PartNumber: int, Body: str) -> dict:
@@ -527,7 +558,7 @@ class AwsCliClient:
             f"--upload-id {UploadId} --part-number {PartNumber} --body {Body} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def upload_part_copy(
@@ -538,7 +569,7 @@ class AwsCliClient:
             f"--upload-id {UploadId} --part-number {PartNumber} --copy-source {CopySource} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd, LONG_TIMEOUT)
+        output = self._run(cmd, LONG_TIMEOUT)
         return self._to_json(output)
 
     def list_parts(self, UploadId: str, Bucket: str, Key: str) -> dict:
@@ -546,7 +577,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api list-parts --bucket {Bucket} --key {Key} "
             f"--upload-id {UploadId} --endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def complete_multipart_upload(
@@ -562,7 +593,7 @@ class AwsCliClient:
             f"--key {Key}  --upload-id {UploadId} --multipart-upload file://{file_path} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def put_object_lock_configuration(self, Bucket, ObjectLockConfiguration):
@@ -570,7 +601,7 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api put-object-lock-configuration --bucket {Bucket} "
             f"--object-lock-configuration '{json.dumps(ObjectLockConfiguration)}' --endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
     def get_object_lock_configuration(self, Bucket):
@@ -578,9 +609,12 @@ class AwsCliClient:
             f"aws {self.common_flags} s3api get-object-lock-configuration --bucket {Bucket} "
             f"--endpoint-url {self.s3gate_endpoint}"
         )
-        output = _cmd_run(cmd)
+        output = self._run(cmd)
         return self._to_json(output)
 
+    def _run(self, cmd: str, timeout: int = 30) -> str:
+        return _cmd_run(cmd, timeout)
+
     @staticmethod
     def _to_json(output: str) -> dict:
         json_output = {}
@@ -593,3 +627,99 @@ class AwsCliClient:
             json_output = json.loads(output[output.index("{") :])
 
         return json_output
+
+
+class AwsCliPersistentClient(AwsCliClient):
+    """
+    AWS CLI client that keeps a single warm awscli process instead of spawning a new `aws`
+    process (and Python interpreter that imports botocore) for every command.
+    Commands and their output are exactly the same as for AwsCliClient.
+    """
+
+    def __init__(self, s3gate_endpoint) -> None:
+        super().__init__(s3gate_endpoint)
+        self._interpreter = self._get_aws_cli_interpreter()
+        self._worker: Optional[subprocess.Popen] = None
+        # Worker executes one command at a time, so requests and responses must not interleave
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_worker()
+
+    def _run(self, cmd: str, timeout: int = 30) -> str:
+        args = shlex.split(cmd)
+        assert args[0] == "aws", f"Expected aws command, got: {cmd}"
+
+        logger.info(f"{COLOR_GREEN}Executing command in awscli worker: {cmd}{COLOR_OFF}")
+        start_time = datetime.utcnow()
+        with self._lock:
+            return_code, output = self._execute(cmd, args[1:], timeout)
+        end_time = datetime.utcnow()
+        _attach_allure_log(cmd, output, return_code, start_time, end_time)
+
+        if return_code != 0:
+            logger.info(f"Command: {cmd}\nError:\nreturn code: {return_code} \nOutput: {output}")
+            raise RuntimeError(
+                f"Command: {cmd}\nError:\nreturn code: {return_code}\nOutput: {output}"
+            )
+        logger.info(f"{COLOR_GREEN}Output: {output}{COLOR_OFF}")
+        return output
+
+    def _execute(self, cmd: str, args: list[str], timeout: int) -> tuple[int, str]:
+        worker = self._get_worker()
+        worker.stdin.write(json.dumps(args) + "\n")
+        worker.stdin.flush()
+
+        deadline = time() + timeout
+        while True:
+            ready, _, _ = select.select([worker.stdout], [], [], max(deadline - time(), 0))
+            if ready:
+                break
+            if time() >= deadline:
+                # State of the worker is unknown after timeout, so next command gets a new one
+                self._stop_worker()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+        line = worker.stdout.readline()
+        if not line:
+            self._stop_worker()
+            raise RuntimeError(f"Command: {cmd}\nOutput: awscli worker process has exited")
+        result = json.loads(line)
+        return result["rc"], result["output"]
+
+    def _get_worker(self) -> subprocess.Popen:
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [self._interpreter, "-c", AWS_CLI_WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+            )
+        return self._worker
+
+    def _stop_worker(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.kill()
+        self._worker.wait()
+        self._worker = None
+
+    @staticmethod
+    def _get_aws_cli_interpreter() -> str:
+        """
+        Returns Python interpreter that `aws` executable runs with, so that the worker can
+        import the same awscli package.
+        """
+        aws_path = shutil.which("aws")
+        if aws_path:
+            with open(aws_path, "rb") as aws_file:
+                first_line = aws_file.readline().decode("utf-8", "ignore").strip()
+            if first_line.startswith("#!") and "python" in first_line:
+                interpreter = first_line[2:].split()
+                return (
+                    interpreter[1] if os.path.basename(interpreter[0]) == "env" else interpreter[0]
+                )
+        raise RuntimeError("AWS CLI is not a Python script, persistent worker is not supported")
@@ -1,8 +1,9 @@
 import logging
 import re
 
-from common import NEOFS_ADM_EXEC, NEOFS_CLI_EXEC, WALLET_CONFIG
-from neofs_testlib.cli import NeofsAdm, NeofsCli
+from cli_helpers import get_neofs_cli
+from common import NEOFS_ADM_EXEC
+from neofs_testlib.cli import NeofsAdm
 from neofs_testlib.hosting import Hosting
 from neofs_testlib.shell import Shell
 
@@ -16,7 +17,7 @@ def get_local_binaries_versions(shell: Shell) -> dict[str, str]:
         out = shell.exec(f"{binary} --version").stdout
         versions[binary] = _parse_version(out)
 
-    neofs_cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    neofs_cli = get_neofs_cli(shell)
     versions["neofs-cli"] = _parse_version(neofs_cli.version.get().stdout)
 
     try:
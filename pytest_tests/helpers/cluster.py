@@ -1,3 +1,4 @@
+import os
 import random
 import re
 from dataclasses import dataclass
@@ -221,6 +222,10 @@ class Cluster:
 
     def __init__(self, hosting: Hosting) -> None:
         self._hosting = hosting
+        # Topology index: nodes are built from hosting config once and reused until
+        # invalidate_topology is called
+        self._nodes_by_service: dict[str, list[NodeBase]] = {}
+        self._nodes_by_name: dict[str, NodeBase] = {}
         self.default_rpc_endpoint = self.storage_nodes[0].get_rpc_endpoint()
         self.default_s3_gate_endpoint = self.s3gates[0].get_endpoint()
         self.default_http_gate_endpoint = self.http_gates[0].get_endpoint()
@@ -239,8 +244,12 @@ class Cluster:
     def _create_wallet_config(self, service: ServiceConfig) -> None:
         wallet_path = service.attributes[_ConfigAttributes.LOCAL_WALLET_CONFIG]
         wallet_password = service.attributes[_ConfigAttributes.WALLET_PASSWORD]
-        with open(wallet_path, "w") as file:
+        # Config is written to a temporary file first, so that parallel test processes never
+        # read a partially written config
+        tmp_wallet_path = f"{wallet_path}.{os.getpid()}"
+        with open(tmp_wallet_path, "w") as file:
             yaml.dump({"password": wallet_password}, file)
+        os.replace(tmp_wallet_path, wallet_path)
 
     def create_wallet_configs(self, hosting: Hosting) -> None:
         configs = hosting.find_service_configs(".*")
@@ -297,7 +306,45 @@ class Cluster:
         """
         return self._get_nodes(_ServicesNames.INNER_RING)
 
+    def get_node_by_name(self, name: str) -> NodeBase:
+        """
+        Returns node of any service type by its name (e.g. "s01", "s3-gate01")
+        """
+        if name not in self._nodes_by_name:
+            for service_name in _ServicesNames.ALL:
+                self._get_nodes(service_name)
+        node = self._nodes_by_name.get(name)
+        if node is None:
+            raise KeyError(f"No node with name {name} found in hosting config")
+        return node
+
+    def get_storage_node_by_id(self, node_id: int) -> StorageNode:
+        """
+        Returns storage node by its numeric id (e.g. 1 for "s01")
+        """
+        for node in self.storage_nodes:
+            if node.id == node_id:
+                return node
+        raise KeyError(f"No storage node with id {node_id} found in hosting config")
+
+    def invalidate_topology(self) -> None:
+        """
+        Drops cached nodes, so that they are re-created from hosting config on next access.
+        Should be called by tests that modify hosting config.
+        """
+        self._nodes_by_service.clear()
+        self._nodes_by_name.clear()
+
     def _get_nodes(self, service_name) -> list[StorageNode]:
+        nodes = self._nodes_by_service.get(service_name)
+        if nodes is None:
+            nodes = self._create_nodes(service_name)
+            self._nodes_by_service[service_name] = nodes
+            self._nodes_by_name.update({node.name: node for node in nodes})
+        # Return a copy, so that callers are free to modify the list
+        return list(nodes)
+
+    def _create_nodes(self, service_name) -> list[NodeBase]:
         configs = self.hosting.find_service_configs(f"{service_name}\d*$")
 
         class_mapping: dict[str, Any] = {
@@ -352,6 +399,7 @@ class _ServicesNames:
     MORPH_CHAIN = "morph-chain"
     INNER_RING = "ir"
     MAIN_CHAIN = "main-chain"
+    ALL = [STORAGE, S3_GATE, HTTP_GATE, MORPH_CHAIN, INNER_RING, MAIN_CHAIN]
 
 
 class _ConfigAttributes:
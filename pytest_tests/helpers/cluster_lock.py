@@ -0,0 +1,60 @@
+import fcntl
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger("NeoLogger")
+
+
+class ClusterLock:
+    """
+    Cross-process readers-writer lock that serializes tests mutating the cluster.
+
+    Regular tests hold the lock in shared mode and may run concurrently in different processes,
+    tests that stop nodes or change network map hold it in exclusive mode and run alone.
+    The lock is based on flock, so it is released automatically if process dies.
+
+    To prevent exclusive holders from starvation, every acquirer passes through a gate (turnstile)
+    file first: exclusive holder keeps the gate closed, so no new shared holders can come in while
+    it waits for the current ones to finish.
+    """
+
+    def __init__(self, lock_file_path: str) -> None:
+        self.lock_file_path = lock_file_path
+        self.gate_file_path = f"{lock_file_path}.gate"
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._flock(self.gate_file_path, fcntl.LOCK_EX):
+            lock_file = self._acquire(self.lock_file_path, fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            self._release(lock_file)
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._flock(self.gate_file_path, fcntl.LOCK_EX):
+            with self._flock(self.lock_file_path, fcntl.LOCK_EX):
+                yield
+
+    @contextmanager
+    def _flock(self, path: str, operation: int) -> Iterator[None]:
+        lock_file = self._acquire(path, operation)
+        try:
+            yield
+        finally:
+            self._release(lock_file)
+
+    def _acquire(self, path: str, operation: int):
+        lock_file = open(path, "a")
+        try:
+            fcntl.flock(lock_file, operation)
+        except BaseException:
+            lock_file.close()
+            raise
+        return lock_file
+
+    def _release(self, lock_file) -> None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
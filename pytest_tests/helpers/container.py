@@ -1,14 +1,21 @@
-from dataclasses import dataclass
-from typing import Optional
+import logging
+from dataclasses import dataclass, field
+from time import time
+from typing import Callable, Optional, Union
 
 import allure
 from cluster import Cluster
-from file_helper import generate_file, get_file_hash
+from file_helper import generate_file_and_hash
 from neofs_testlib.shell import Shell
 from neofs_verbs import put_object, put_object_to_random_node
+from parallel import fan_out
 from storage_object import StorageObjectInfo
 from wallet import WalletFile
 
+logger = logging.getLogger("NeoLogger")
+
+DEFAULT_SEEDING_CONCURRENCY = 8
+
 
 @dataclass
 class StorageContainerInfo:
@@ -16,6 +23,31 @@ class StorageContainerInfo:
     wallet_file: WalletFile
 
 
+@dataclass
+class SeedingReport:
+    """
+    Progress of bulk objects upload
+    """
+
+    total_count: int
+    uploaded_count: int = 0
+    uploaded_size: int = 0
+    started_at: float = field(default_factory=time)
+    finished_at: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at or time()) - self.started_at
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.uploaded_count / self.duration if self.duration else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.uploaded_size / self.duration if self.duration else 0.0
+
+
 class StorageContainer:
     def __init__(
         self,
@@ -45,8 +77,7 @@ class StorageContainer:
         endpoint: Optional[str] = None,
     ) -> StorageObjectInfo:
         with allure.step(f"Generate object with size {size}"):
-            file_path = generate_file(size)
-            file_hash = get_file_hash(file_path)
+            file_path, file_hash = generate_file_and_hash(size)
 
         container_id = self.get_id()
         wallet_path = self.get_wallet_path()
@@ -85,3 +116,79 @@ class StorageContainer:
             )
 
         return storage_object
+
+    @allure.step("Generate {count} objects and put them in container")
+    def generate_objects(
+        self,
+        count: int,
+        size: int,
+        concurrency: int = DEFAULT_SEEDING_CONCURRENCY,
+        attributes: Optional[Union[dict, Callable[[int], dict]]] = None,
+        expire_at: Optional[int] = None,
+        bearer_token: Optional[str] = None,
+        progress: Optional[Callable[[SeedingReport], None]] = None,
+    ) -> list[StorageObjectInfo]:
+        """
+        Generates objects and puts them to container concurrently. Objects are put through
+        all storage nodes of the cluster in turn to spread the load.
+
+        Args:
+            count: number of objects to generate
+            size: size of every object
+            concurrency: maximum number of objects being uploaded at the same time
+            attributes: attributes to set on every object, or callable that receives index
+                of the object and returns its attributes
+            expire_at: last epoch in the life of objects
+            bearer_token: path to bearer token file
+            progress: callable that is invoked with the current report every time an object
+                has been uploaded
+        Returns:
+            Uploaded objects in order of their indexes.
+        """
+        container_id = self.get_id()
+        wallet_path = self.get_wallet_path()
+        wallet_config = self.get_wallet_config_path()
+        endpoints = [node.get_rpc_endpoint() for node in self.cluster.storage_nodes]
+
+        def generate(index: int) -> StorageObjectInfo:
+            object_attributes = attributes(index) if callable(attributes) else attributes
+            file_path, file_hash = generate_file_and_hash(size)
+            object_id = put_object(
+                wallet=wallet_path,
+                path=file_path,
+                cid=container_id,
+                shell=self.shell,
+                endpoint=endpoints[index % len(endpoints)],
+                bearer=bearer_token,
+                attributes=object_attributes,
+                wallet_config=wallet_config,
+                expire_at=expire_at,
+            )
+            return StorageObjectInfo(
+                container_id,
+                object_id,
+                size=size,
+                wallet_file_path=wallet_path,
+                file_path=file_path,
+                file_hash=file_hash,
+                attributes=object_attributes,
+            )
+
+        report = SeedingReport(count)
+        storage_objects: list[Optional[StorageObjectInfo]] = [None] * count
+        for task in fan_out(generate, range(count), max_workers=concurrency):
+            if not task.ok:
+                raise RuntimeError(f"Failed to put object #{task.item}") from task.error
+            storage_objects[task.item] = task.result
+            report.uploaded_count += 1
+            report.uploaded_size += size
+            if progress:
+                progress(report)
+        report.finished_at = time()
+
+        logger.info(
+            f"Put {report.uploaded_count} objects to container {container_id} "
+            f"in {report.duration:.1f}s: {report.objects_per_second:.1f} objects/s, "
+            f"{report.bytes_per_second / 1024 / 1024:.2f} MiB/s"
+        )
+        return storage_objects
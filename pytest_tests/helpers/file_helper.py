@@ -1,14 +1,21 @@
 import hashlib
 import logging
 import os
+import shutil
+import threading
 import uuid
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
 
 import allure
 from common import ASSETS_DIR
 
 logger = logging.getLogger("NeoLogger")
 
+# Size of buffer that is used to generate, copy and hash file content, so that large
+# payloads are never loaded into memory as a whole
+FILE_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def generate_file(size: int) -> str:
     """Generates a binary file with the specified size in bytes.
@@ -21,12 +28,33 @@ def generate_file(size: int) -> str:
     """
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
     with open(file_path, "wb") as file:
-        file.write(os.urandom(size))
+        for chunk in _generate_content(int(size)):
+            file.write(chunk)
     logger.info(f"File with size {size} bytes has been generated: {file_path}")
 
     return file_path
 
 
+def generate_file_and_hash(size: int) -> tuple[str, str]:
+    """Generates a binary file with the specified size in bytes and computes its hash on the fly.
+
+    Args:
+        size: Size in bytes, can be declared as 6e+6 for example.
+
+    Returns:
+        Tuple of the path to the generated file and its hash as hex-encoded string.
+    """
+    file_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
+    file_hash = hashlib.sha256()
+    with open(file_path, "wb") as file:
+        for chunk in _generate_content(int(size)):
+            file.write(chunk)
+            file_hash.update(chunk)
+    logger.info(f"File with size {size} bytes has been generated: {file_path}")
+
+    return file_path, file_hash.hexdigest()
+
+
 def generate_file_with_content(
     size: int,
     file_path: Optional[str] = None,
@@ -43,23 +71,70 @@ def generate_file_with_content(
     Returns:
         Path to the generated file.
     """
-    mode = "w+"
-    if content is None:
-        content = os.urandom(size)
-        mode = "wb"
-
     if not file_path:
         file_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
     else:
         if not os.path.exists(os.path.dirname(file_path)):
             os.makedirs(os.path.dirname(file_path))
 
-    with open(file_path, mode) as file:
-        file.write(content)
+    if content is None:
+        with open(file_path, "wb") as file:
+            for chunk in _generate_content(int(size)):
+                file.write(chunk)
+    else:
+        with open(file_path, "w+") as file:
+            file.write(content)
 
     return file_path
 
 
+class PayloadPool:
+    """
+    Pool of pre-generated payload files that can be shared between tests.
+
+    Payloads are stored in pool directory under the name of their hash and are generated once
+    per size. Every consumer receives its own copy of the pooled file, so it is free to modify,
+    rename or delete it without affecting other consumers.
+    """
+
+    def __init__(self, pool_dir: Optional[str] = None) -> None:
+        self.pool_dir = pool_dir or os.path.join(os.getcwd(), ASSETS_DIR, "payload_pool")
+        os.makedirs(self.pool_dir, exist_ok=True)
+        self._payloads: dict[int, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, size: int, unique: bool = False) -> tuple[str, str]:
+        """Returns payload file of the specified size.
+
+        Args:
+            size: Size of payload in bytes.
+            unique: If True, fresh payload with content that has never been handed out
+                before is generated.
+
+        Returns:
+            Tuple of the path to payload file and its hash as hex-encoded string.
+        """
+        if unique:
+            return generate_file_and_hash(size)
+
+        size = int(size)
+        with self._lock:
+            if size not in self._payloads:
+                self._payloads[size] = self._add_payload(size)
+            pooled_path, file_hash = self._payloads[size]
+
+        file_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
+        shutil.copyfile(pooled_path, file_path)
+        return file_path, file_hash
+
+    def _add_payload(self, size: int) -> tuple[str, str]:
+        generated_path, file_hash = generate_file_and_hash(size)
+        pooled_path = os.path.join(self.pool_dir, file_hash)
+        os.replace(generated_path, pooled_path)
+        logger.info(f"Payload with size {size} bytes has been added to pool: {pooled_path}")
+        return pooled_path, file_hash
+
+
 @allure.step("Get File Hash")
 def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[int] = None) -> str:
     """Generates hash for the specified file.
@@ -72,19 +147,48 @@ def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[in
     Returns:
         Hash of the file as hex-encoded string.
     """
-    file_hash = hashlib.sha256()
     with open(file_path, "rb") as out:
-        if len and not offset:
-            file_hash.update(out.read(len))
-        elif len and offset:
+        if offset:
             out.seek(offset, 0)
-            file_hash.update(out.read(len))
-        elif offset and not len:
-            out.seek(offset, 0)
-            file_hash.update(out.read())
-        else:
-            file_hash.update(out.read())
-    return file_hash.hexdigest()
+        return _hash_chunks(_read_chunks(out, len or None))
+
+
+@dataclass
+class StreamDigest:
+    """
+    Result of reading a payload stream: its hash, size and path of the file it has been saved to
+    (None if payload has not been saved)
+    """
+
+    hash: str
+    size: int
+    file_path: Optional[str] = None
+
+
+def save_stream(stream: BinaryIO, file_path: Optional[str] = None) -> StreamDigest:
+    """Reads the stream to the end in large chunks and hashes its content on the fly.
+
+    Args:
+        stream: Stream to read, e.g. body of HTTP response.
+        file_path: Path to the file to save content to; if omitted, content is not saved
+            to disk at all.
+
+    Returns:
+        Hash, size and path to the file of the content.
+    """
+    file_hash = hashlib.sha256()
+    size = 0
+    file = open(file_path, "wb") if file_path else None
+    try:
+        for chunk in _read_chunks(stream):
+            file_hash.update(chunk)
+            size += len(chunk)
+            if file:
+                file.write(chunk)
+    finally:
+        if file:
+            file.close()
+    return StreamDigest(file_hash.hexdigest(), size, file_path)
 
 
 @allure.step("Concatenation set of files to one file")
@@ -103,7 +207,7 @@ def concat_files(file_paths: list, resulting_file_path: Optional[str] = None) ->
     with open(resulting_file_path, "wb") as f:
         for file in file_paths:
             with open(file, "rb") as part_file:
-                f.write(part_file.read())
+                shutil.copyfileobj(part_file, f, FILE_CHUNK_SIZE)
     return resulting_file_path
 
 
@@ -119,20 +223,18 @@ def split_file(file_path: str, parts: int) -> list[str]:
     Returns:
         Paths to the part files.
     """
-    with open(file_path, "rb") as file:
-        content = file.read()
-
-    content_size = len(content)
+    content_size = os.path.getsize(file_path)
     chunk_size = int((content_size + parts) / parts)
 
     part_id = 1
     part_file_paths = []
-    for content_offset in range(0, content_size + 1, chunk_size):
-        part_file_name = f"{file_path}_part_{part_id}"
-        part_file_paths.append(part_file_name)
-        with open(part_file_name, "wb") as out_file:
-            out_file.write(content[content_offset : content_offset + chunk_size])
-        part_id += 1
+    with open(file_path, "rb") as file:
+        for _ in range(0, content_size + 1, chunk_size):
+            part_file_name = f"{file_path}_part_{part_id}"
+            part_file_paths.append(part_file_name)
+            with open(part_file_name, "wb") as out_file:
+                _copy_stream(file, out_file, chunk_size)
+            part_id += 1
 
     return part_file_paths
 
@@ -165,3 +267,35 @@ def get_file_content(
             content = file.read()
 
     return content
+
+
+def _generate_content(size: int) -> Iterator[bytes]:
+    remaining = size
+    while remaining > 0:
+        chunk_size = min(remaining, FILE_CHUNK_SIZE)
+        yield os.urandom(chunk_size)
+        remaining -= chunk_size
+
+
+def _hash_chunks(chunks: Iterable[bytes]) -> str:
+    file_hash = hashlib.sha256()
+    for chunk in chunks:
+        file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _copy_stream(source: BinaryIO, destination: BinaryIO, length: int) -> None:
+    for chunk in _read_chunks(source, length):
+        destination.write(chunk)
+
+
+def _read_chunks(stream: BinaryIO, length: Optional[int] = None) -> Iterator[bytes]:
+    remaining = length
+    while remaining is None or remaining > 0:
+        chunk_size = FILE_CHUNK_SIZE if remaining is None else min(remaining, FILE_CHUNK_SIZE)
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+        if remaining is not None:
+            remaining -= len(chunk)
@@ -1,25 +1,77 @@
-import re
+import json
+import logging
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from time import sleep
 from typing import Optional
 
 import allure
-from neofs_testlib.shell import Shell
+from neofs_testlib.shell import CommandOptions, Shell
 from remote_process import RemoteProcess
 
+logger = logging.getLogger("NeoLogger")
+
 EXIT_RESULT_CODE = 0
-LOAD_RESULTS_PATTERNS = {
-    "grpc": {
-        "write_ops": r"neofs_obj_put_total\W*\d*\W*(?P<write_ops>\d*\.\d*)",
-        "read_ops": r"neofs_obj_get_total\W*\d*\W*(?P<read_ops>\d*\.\d*)",
-    },
-    "s3": {
-        "write_ops": r"aws_obj_put_total\W*\d*\W*(?P<write_ops>\d*\.\d*)",
-        "read_ops": r"aws_obj_get_total\W*\d*\W*(?P<write_ops>\d*\.\d*)",
-    },
-    "http": {"total_ops": r"http_reqs\W*\d*\W*(?P<total_ops>\d*\.\d*)"},
+# Summary of the run is exported by k6 to this file in the process directory
+K6_SUMMARY_FILE = "summary.json"
+K6_SUMMARY_TREND_STATS = "avg,min,med,max,p(90),p(95),p(99)"
+
+# Raw k6 metrics are written to this file in the process directory (k6 compresses it by extension);
+# it grows with every sample, so it is removed from load node as soon as the run is over
+K6_METRICS_FILE = "metrics.csv.gz"
+# Ratio between upper bounds of adjacent latency histogram buckets, i.e. relative accuracy
+# of percentiles is 1%
+LATENCY_BUCKET_BASE = 1.01
+LATENCY_PERCENTILES = (50, 95, 99)
+# Aggregates raw k6 metrics on load node, so that only compact summary is transferred:
+#   T <first timestamp> <last timestamp>
+#   H <trend metric> <bucket> <count>  - logarithmic histogram of latency (in microseconds)
+#   C <metric> <sum>                   - sum of values of every other metric
+K6_METRICS_AGGREGATION_SCRIPT = """
+BEGIN { n = split(trends, names, ","); for (i = 1; i <= n; i++) trend[names[i]] = 1 }
+NR > 1 {
+    if (first == "" || $2 < first) first = $2
+    if ($2 > last) last = $2
+    if ($1 in trend) {
+        us = $3 * 1000
+        hist[$1 " " (us >= 1 ? int(log(us) / log(base)) : 0)]++
+    } else {
+        sums[$1] += $3
+    }
+}
+END {
+    print "T", first, last
+    for (key in hist) print "H", key, hist[key]
+    for (name in sums) printf "C %s %.3f\\n", name, sums[name]
+}
+"""
+# Aggregates raw k6 metrics written since the given offset (of uncompressed data) by seconds:
+#   H <timestamp> <trend metric> <bucket> <count>
+#   S <timestamp> <metric> <sum>
+#   O <number of bytes consumed>
+# Input is terminated with \001 byte marker, so the last record is either the marker alone or an
+# incomplete line followed by the marker; incomplete line is read again on the next call
+K6_LIVE_METRICS_SCRIPT = """
+BEGIN { n = split(trends, names, ","); for (i = 1; i <= n; i++) trend[names[i]] = 1 }
+function add(line,    values, us) {
+    split(line, values, ",")
+    if (values[1] == "metric_name") return
+    if (values[1] in trend) {
+        us = values[3] * 1000
+        hist[values[2] " " values[1] " " (us >= 1 ? int(log(us) / log(base)) : 0)]++
+    } else {
+        sums[values[2] " " values[1]] += values[3]
+    }
+}
+NR > 1 { add(previous); consumed += length(previous) + 1 }
+{ previous = $0 }
+END {
+    for (key in hist) print "H", key, hist[key]
+    for (key in sums) printf "S %s %.3f\\n", key, sums[key]
+    print "O", consumed + 0
 }
+"""
 
 
 @dataclass
@@ -38,13 +90,375 @@ class LoadParams:
     registry_file: Optional[str] = None
 
 
+@dataclass
+class CounterMetric:
+    count: float = 0.0
+    rate: float = 0.0
+
+
+@dataclass
+class RateMetric:
+    passes: int = 0
+    fails: int = 0
+    value: float = 0.0
+
+
+@dataclass
+class TrendMetric:
+    """
+    Statistics of a k6 trend metric; durations are in milliseconds
+    """
+
+    avg: float = 0.0
+    min: float = 0.0
+    med: float = 0.0
+    max: float = 0.0
+    p90: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+
+
+# Load operations that are reported in scalar fields of LoadResults
+OPERATION_RESULTS_PREFIXES = {"put": "write", "get": "read", "delete": "delete"}
+
+
 @dataclass
 class LoadResults:
+    """
+    Results of a k6 run. Scalar fields hold throughput (per second) and share of failed
+    operations; all metrics exported by k6 are kept in counters, rates and trends by metric name.
+    """
+
     data_sent: float = 0.0
     data_received: float = 0.0
     read_ops: float = 0.0
     write_ops: float = 0.0
+    delete_ops: float = 0.0
     total_ops: float = 0.0
+    read_errors: float = 0.0
+    write_errors: float = 0.0
+    delete_errors: float = 0.0
+    counters: dict[str, CounterMetric] = field(default_factory=dict)
+    rates: dict[str, RateMetric] = field(default_factory=dict)
+    trends: dict[str, TrendMetric] = field(default_factory=dict)
+
+    @classmethod
+    def from_summary(cls, summary: dict, load_type: str) -> "LoadResults":
+        """
+        Parses JSON summary exported by k6 with --summary-export.
+        """
+        results = cls()
+        for name, values in summary.get("metrics", {}).items():
+            if "count" in values and "rate" in values:
+                results.counters[name] = CounterMetric(values["count"], values["rate"])
+            elif "passes" in values:
+                results.rates[name] = RateMetric(values["passes"], values["fails"], values["value"])
+            elif "avg" in values:
+                results.trends[name] = TrendMetric(
+                    avg=values["avg"],
+                    min=values["min"],
+                    med=values["med"],
+                    max=values["max"],
+                    p90=values.get("p(90)", 0.0),
+                    p95=values.get("p(95)", 0.0),
+                    p99=values.get("p(99)", 0.0),
+                )
+        results._fill_totals(load_type)
+        return results
+
+    @classmethod
+    def merge(cls, results: list["LoadResults"], load_type: str) -> "LoadResults":
+        """
+        Sums results of k6 runs that were executed at the same time. Trends can not be merged
+        from their statistics, so they are not included.
+        """
+        merged = cls()
+        for result in results:
+            for name, counter in result.counters.items():
+                total = merged.counters.setdefault(name, CounterMetric())
+                total.count += counter.count
+                total.rate += counter.rate
+            for name, rate in result.rates.items():
+                total = merged.rates.setdefault(name, RateMetric())
+                total.passes += rate.passes
+                total.fails += rate.fails
+        for rate in merged.rates.values():
+            checked = rate.passes + rate.fails
+            rate.value = rate.passes / checked if checked else 0.0
+        merged._fill_totals(load_type)
+        return merged
+
+    def count(self, metric: str) -> float:
+        """
+        Returns number of events of counter metric or number of passes of rate metric.
+        """
+        if metric in self.counters:
+            return self.counters[metric].count
+        if metric in self.rates:
+            return self.rates[metric].passes
+        return 0.0
+
+    def _fill_totals(self, load_type: str) -> None:
+        self.data_sent = self.counters.get("data_sent", CounterMetric()).rate
+        self.data_received = self.counters.get("data_received", CounterMetric()).rate
+        self.total_ops = 0.0
+        for operation, metrics in LOAD_OPERATIONS_METRICS.get(load_type, {}).items():
+            total = self.counters.get(metrics.total, CounterMetric())
+            self.total_ops += total.rate
+            prefix = OPERATION_RESULTS_PREFIXES.get(operation)
+            if prefix:
+                setattr(self, f"{prefix}_ops", total.rate)
+                errors = self.count(metrics.fails) / total.count if total.count else 0.0
+                setattr(self, f"{prefix}_errors", errors)
+
+
+@dataclass(frozen=True)
+class OperationMetrics:
+    """
+    Names of k6 metrics that describe a single load operation
+    """
+
+    total: str
+    fails: str
+    duration: str
+
+
+def _operation_metrics(prefix: str) -> dict[str, OperationMetrics]:
+    return {
+        operation: OperationMetrics(
+            f"{prefix}_{operation}_total",
+            f"{prefix}_{operation}_fails",
+            f"{prefix}_{operation}_duration",
+        )
+        for operation in ("put", "get", "delete")
+    }
+
+
+LOAD_OPERATIONS_METRICS = {
+    "grpc": _operation_metrics("neofs_obj"),
+    "s3": _operation_metrics("aws_obj"),
+    # HTTP scenario writes and reads objects with plain k6 requests that can not be told apart
+    "http": {"request": OperationMetrics("http_reqs", "http_req_failed", "http_req_duration")},
+}
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies with logarithmic buckets: bucket N holds values (in
+    microseconds) in range [base^N, base^(N+1)). Histograms of different load nodes are merged
+    by adding bucket counters, so percentiles stay exact up to the bucket accuracy.
+    """
+
+    buckets: dict[int, int] = field(default_factory=dict)
+    base: float = LATENCY_BUCKET_BASE
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, bucket: int, count: int) -> None:
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        assert self.base == other.base, "Histograms with different buckets can not be merged"
+        for bucket, count in other.buckets.items():
+            self.add(bucket, count)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns upper bound (in milliseconds) of latencies of the given percent of requests.
+        """
+        threshold = self.count * percent / 100
+        passed = 0
+        for bucket in sorted(self.buckets):
+            passed += self.buckets[bucket]
+            if passed >= threshold:
+                return self.base ** (bucket + 1) / 1000
+        return 0.0
+
+
+@dataclass
+class K6MetricsSummary:
+    """
+    Metrics of a single k6 run aggregated on load node
+    """
+
+    started_at: int = 0
+    finished_at: int = 0
+    sums: dict[str, float] = field(default_factory=dict)
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> int:
+        # Timestamps have one second resolution, so the last second counts too
+        return self.finished_at - self.started_at + 1
+
+    def merge(self, other: "K6MetricsSummary") -> None:
+        for metric, value in other.sums.items():
+            self.sums[metric] = self.sums.get(metric, 0.0) + value
+        for metric, histogram in other.histograms.items():
+            self.histograms.setdefault(metric, LatencyHistogram()).merge(histogram)
+
+    @classmethod
+    def parse(cls, output: str) -> "K6MetricsSummary":
+        summary = cls()
+        for line in output.splitlines():
+            kind, *values = line.split()
+            if kind == "T" and len(values) == 2:
+                summary.started_at, summary.finished_at = int(values[0]), int(values[1])
+            elif kind == "H":
+                metric, bucket, count = values
+                summary.histograms.setdefault(metric, LatencyHistogram()).add(
+                    int(bucket), int(count)
+                )
+            elif kind == "C":
+                metric, value = values
+                summary.sums[metric] = float(value)
+        return summary
+
+
+@dataclass
+class OperationLoadResults:
+    """
+    Cluster-wide results of a single load operation; latencies are in milliseconds
+    """
+
+    count: float = 0.0
+    failures: float = 0.0
+    ops_per_second: float = 0.0
+    bytes_per_second: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+
+
+@dataclass
+class ClusterLoadResults:
+    """
+    Results of load executed on several load nodes at once
+    """
+
+    load_nodes: int
+    duration: int
+    totals: LoadResults
+    operations: dict[str, OperationLoadResults]
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Flat view of the results: total throughput and per-operation throughput and latencies.
+        """
+        metrics = {
+            name: getattr(self.totals, name)
+            for name in ("write_ops", "read_ops", "delete_ops", "total_ops")
+        }
+        metrics["data_sent"] = self.totals.data_sent
+        metrics["data_received"] = self.totals.data_received
+        for operation, results in self.operations.items():
+            metrics[f"{operation}_ops_per_second"] = results.ops_per_second
+            metrics[f"{operation}_p50"] = results.p50
+            metrics[f"{operation}_p95"] = results.p95
+            metrics[f"{operation}_p99"] = results.p99
+        return metrics
+
+    def report(self) -> str:
+        lines = [
+            f"Load nodes: {self.load_nodes}, duration: {self.duration}s",
+            f"Total: {self.totals.total_ops:.2f} ops/s "
+            f"(write {self.totals.write_ops:.2f}, read {self.totals.read_ops:.2f}, "
+            f"delete {self.totals.delete_ops:.2f}), "
+            f"data sent {self.totals.data_sent:.0f} bytes/s, "
+            f"data received {self.totals.data_received:.0f} bytes/s",
+        ]
+        for operation, results in self.operations.items():
+            lines.append(
+                f"{operation}: {results.ops_per_second:.2f} ops/s, "
+                f"{results.bytes_per_second:.0f} bytes/s, "
+                f"count {results.count:.0f}, failures {results.failures:.0f}, "
+                f"p50 {results.p50:.2f}ms, p95 {results.p95:.2f}ms, p99 {results.p99:.2f}ms"
+            )
+        return "\n".join(lines)
+
+
+def aggregate_load_results(
+    load_params: LoadParams, node_results: list[tuple[LoadResults, K6MetricsSummary]]
+) -> ClusterLoadResults:
+    """
+    Combines results of load nodes that were running the same load at the same time.
+
+    Counters and throughput are summed over load nodes, latency histograms are merged
+    before percentiles are calculated.
+
+    Args:
+        load_params: parameters of the load
+        node_results: parsed k6 output and aggregated metrics of every load node
+
+    Returns:
+        Cluster-wide load results.
+    """
+    summaries = [summary for _, summary in node_results]
+    totals = LoadResults.merge([results for results, _ in node_results], load_params.load_type)
+    started_at = min((summary.started_at for summary in summaries), default=0)
+    finished_at = max((summary.finished_at for summary in summaries), default=0)
+    return ClusterLoadResults(
+        load_nodes=len(node_results),
+        duration=finished_at - started_at + 1,
+        totals=totals,
+        operations=summarize_operations(load_params, summaries),
+    )
+
+
+def summarize_operations(
+    load_params: LoadParams, summaries: list[K6MetricsSummary]
+) -> dict[str, OperationLoadResults]:
+    """
+    Calculates results of every load operation from metrics collected at the same time.
+
+    Args:
+        load_params: parameters of the load
+        summaries: aggregated metrics, e.g. of different load nodes
+
+    Returns:
+        Results of operations that were executed at least once.
+    """
+    object_size = (load_params.obj_size or 0) * 1024
+
+    operations = {}
+    for operation, metrics in LOAD_OPERATIONS_METRICS.get(load_params.load_type, {}).items():
+        histogram = LatencyHistogram()
+        for summary in summaries:
+            histogram.merge(summary.histograms.get(metrics.duration, LatencyHistogram()))
+        if not histogram.count:
+            continue
+        ops_per_second = sum(
+            summary.sums.get(metrics.total, 0) / summary.duration for summary in summaries
+        )
+        p50, p95, p99 = (histogram.percentile(percent) for percent in LATENCY_PERCENTILES)
+        operations[operation] = OperationLoadResults(
+            count=sum(summary.sums.get(metrics.total, 0) for summary in summaries),
+            failures=sum(summary.sums.get(metrics.fails, 0) for summary in summaries),
+            ops_per_second=ops_per_second,
+            bytes_per_second=ops_per_second * object_size if operation in ("put", "get") else 0.0,
+            p50=p50,
+            p95=p95,
+            p99=p99,
+        )
+    return operations
+
+
+def merge_pregen_jsons(parts: list[dict]) -> dict:
+    """
+    Merges pregen JSONs written by preset scripts on different load nodes into one dataset.
+    Lists (containers, buckets, objects) are concatenated, other values are the same in all parts.
+    """
+    merged = {}
+    for part in parts:
+        for key, value in part.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    return merged
 
 
 class K6:
@@ -72,15 +486,30 @@ class K6:
             ).stdout.strip("\n")
         return self._k6_dir
 
+    @property
+    def pregen_json(self) -> str:
+        return f"{self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file}"
+
     @allure.step("Prepare containers and objects")
-    def prepare(self) -> str:
+    def prepare(
+        self, containers_count: Optional[int] = None, out_file: Optional[str] = None
+    ) -> str:
+        """
+        Creates containers (buckets) and preloads objects into them with preset script.
+
+        Args:
+            containers_count: number of containers to create instead of the one from load params
+            out_file: path to write pregen JSON to instead of the one k6 reads objects from
+        """
         self._k6_dir = self.k6_dir
+        containers_count = containers_count or self.load_params.containers_count
+        out_file = out_file or self.pregen_json
         if self.load_params.load_type == "http" or self.load_params.load_type == "grpc":
             command = (
                 f"{self.k6_dir}/scenarios/preset/preset_grpc.py "
                 f"--size {self.load_params.obj_size}  "
-                f"--containers {self.load_params.containers_count} "
-                f"--out {self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file} "
+                f"--containers {containers_count} "
+                f"--out {out_file} "
                 f"--endpoint {self.load_params.endpoint.split(',')[0]} "
                 f"--preload_obj {self.load_params.obj_count} "
             )
@@ -89,8 +518,8 @@ class K6:
         elif self.load_params.load_type == "s3":
             command = (
                 f"{self.k6_dir}/scenarios/preset/preset_s3.py --size {self.load_params.obj_size} "
-                f"--buckets {self.load_params.containers_count} "
-                f"--out {self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file} "
+                f"--buckets {containers_count} "
+                f"--out {out_file} "
                 f"--endpoint {self.load_params.endpoint.split(',')[0]} "
                 f"--preload_obj {self.load_params.obj_count} "
                 f"--location load-1-1"
@@ -111,9 +540,7 @@ class K6:
             "REGISTRY_FILE": load_params.registry_file or None,
             "CLIENTS": load_params.clients or None,
             f"{self.load_params.load_type.upper()}_ENDPOINTS": self.load_params.endpoint,
-            "PREGEN_JSON": f"{self.k6_dir}/{self.load_params.load_type}_{self.load_params.out_file}"
-            if load_params.out_file
-            else None,
+            "PREGEN_JSON": self.pregen_json if load_params.out_file else None,
         }
         allure.attach(
             "\n".join(f"{param}: {value}" for param, value in env_vars.items()),
@@ -125,14 +552,16 @@ class K6:
         )
 
     @allure.step("Start K6 on initiator")
-    def start(self) -> None:
+    def start(self, start_barrier: Optional[threading.Barrier] = None) -> None:
 
         self._k6_dir = self.k6_dir
         command = (
             f"{self.k6_dir}/k6 run {self._generate_env_variables(self.load_params, self.k6_dir)} "
+            f"--summary-export={K6_SUMMARY_FILE} --summary-trend-stats='{K6_SUMMARY_TREND_STATS}' "
+            f"--out csv={K6_METRICS_FILE} "
             f"{self.k6_dir}/scenarios/{self.load_params.load_type}.js"
         )
-        self._k6_process = RemoteProcess.create(command, self.shell)
+        self._k6_process = RemoteProcess.create(command, self.shell, start_barrier)
 
     @allure.step("Wait until K6 is finished")
     def wait_until_finished(self, timeout: int = 0, k6_should_be_running: bool = False) -> None:
@@ -200,22 +629,33 @@ class K6:
     def is_finished(self) -> bool:
         return not self._k6_process.running()
 
+    @allure.step("Parse K6 results")
     def parsing_results(self) -> LoadResults:
-        output = self._k6_process.stdout(full=True).replace("\n", "")
-        metric_regex_map = {
-            "data_received": r"data_received\W*\d*.\d*.\w*\W*(?P<data_received>\d*)",
-            "data_sent": r"data_sent\W*\d*.\d*.\w*\W*(?P<data_sent>\d*)",
-        }
-        metric_regex_map.update(LOAD_RESULTS_PATTERNS[self.load_params.load_type])
-        metric_values = {}
-        for metric_name, metric_regex in metric_regex_map.items():
-            match = re.search(metric_regex, output)
-            if match:
-                metric_values[metric_name] = float(match.group(metric_name))
-                continue
-            metric_values[metric_name] = 0.0
-        load_result = LoadResults(**metric_values)
-        return load_result
+        terminal = self.shell.exec(
+            f"cat {self.process_dir}/{K6_SUMMARY_FILE}", CommandOptions(check=False)
+        )
+        if terminal.return_code != 0:
+            logger.warning(f"K6 summary is not available: {terminal.stderr}")
+            return LoadResults()
+        allure.attach(terminal.stdout, "K6 summary", allure.attachment_type.JSON)
+        return LoadResults.from_summary(json.loads(terminal.stdout), self.load_params.load_type)
+
+    @allure.step("Aggregate K6 metrics on load node")
+    def get_metrics_summary(self) -> K6MetricsSummary:
+        operations = LOAD_OPERATIONS_METRICS.get(self.load_params.load_type, {})
+        trends = ",".join(metrics.duration for metrics in operations.values())
+        terminal = self.shell.exec(
+            f"zcat -f {self.process_dir}/{K6_METRICS_FILE} | "
+            f"awk -F, -v trends={trends or '-'} -v base={LATENCY_BUCKET_BASE} "
+            f"'{K6_METRICS_AGGREGATION_SCRIPT}'"
+        )
+        return K6MetricsSummary.parse(terminal.stdout)
+
+    @allure.step("Remove raw K6 metrics from load node")
+    def clear_metrics(self) -> None:
+        if self._k6_process is None:
+            return
+        self.shell.exec(f"rm -f {self.process_dir}/{K6_METRICS_FILE}", CommandOptions(check=False))
 
     @allure.step("Try to stop K6 with SIGTERM")
     def _stop_k6(self) -> None:
@@ -234,3 +674,87 @@ class K6:
     @allure.step("Log K6 output")
     def __log_k6_output(self) -> None:
         allure.attach(self._k6_process.stdout(full=True), "K6 output", allure.attachment_type.TEXT)
+
+
+class K6LiveMetrics:
+    """
+    Follows raw metrics of a running k6 process.
+
+    Every update processes only metrics written since the previous one; they are aggregated by
+    seconds on load node, so tests can check throughput, error rate and latency of any time
+    window while the load is still running (e.g. while a storage node is down).
+    Timestamps are taken on load node, so its clock is expected to be in sync with test runner.
+    """
+
+    def __init__(self, k6_instance: K6):
+        self.k6_instance = k6_instance
+        self.offset = 0
+        self.seconds: dict[int, K6MetricsSummary] = {}
+
+    @allure.step("Read fresh K6 metrics")
+    def update(self) -> None:
+        operations = LOAD_OPERATIONS_METRICS.get(self.k6_instance.load_params.load_type, {})
+        trends = ",".join(metrics.duration for metrics in operations.values())
+        metrics_file = f"{self.k6_instance.process_dir}/{K6_METRICS_FILE}"
+        # Compressed file can't be read from the middle, so it is decompressed from the beginning
+        # on load node and only the fresh part is aggregated; zcat complains about the end of
+        # stream that k6 has not written yet, so its errors are ignored
+        terminal = self.k6_instance.shell.exec(
+            f"stat -c %s {metrics_file} >/dev/null && "
+            f"{{ zcat -f {metrics_file} 2>/dev/null | tail -c +{self.offset + 1}; "
+            f"printf '\\001'; }} | "
+            f"LC_ALL=C awk -v trends={trends or '-'} "
+            f"-v base={LATENCY_BUCKET_BASE} '{K6_LIVE_METRICS_SCRIPT}'"
+        )
+        for line in terminal.stdout.splitlines():
+            kind, *values = line.split()
+            if kind == "O":
+                self.offset += int(values[0])
+            elif kind == "H":
+                timestamp, metric, bucket, count = values
+                self._second(int(timestamp)).histograms.setdefault(metric, LatencyHistogram()).add(
+                    int(bucket), int(count)
+                )
+            elif kind == "S":
+                timestamp, metric, value = values
+                summary = self._second(int(timestamp))
+                summary.sums[metric] = summary.sums.get(metric, 0.0) + float(value)
+
+    def window(self, start: float, end: float) -> dict[str, OperationLoadResults]:
+        """
+        Returns results of load operations within the time window; metrics have one second
+        resolution, so the window is aligned to whole seconds.
+
+        Args:
+            start: unix timestamp of the window beginning (inclusive)
+            end: unix timestamp of the window end (exclusive)
+
+        Returns:
+            Results of operations executed within the window.
+        """
+        first, last = int(start), int(end) - 1
+        summary = K6MetricsSummary(started_at=first, finished_at=last)
+        for timestamp in range(first, last + 1):
+            if timestamp in self.seconds:
+                summary.merge(self.seconds[timestamp])
+        return summarize_operations(self.k6_instance.load_params, [summary])
+
+    def latest(self, duration: int = 10) -> dict[str, OperationLoadResults]:
+        """
+        Reads fresh metrics and returns results of load operations for the last seconds.
+        The most recent second is not included, as its metrics may be not written yet.
+
+        Args:
+            duration: length of the window in seconds
+
+        Returns:
+            Results of operations executed within the window.
+        """
+        self.update()
+        if not self.seconds:
+            return {}
+        end = max(self.seconds)
+        return self.window(end - duration, end)
+
+    def _second(self, timestamp: int) -> K6MetricsSummary:
+        return self.seconds.setdefault(timestamp, K6MetricsSummary(timestamp, timestamp))
@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import statistics
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+logger = logging.getLogger("NeoLogger")
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_HISTORY_SIZE = 10
+# Metrics with these suffixes are latencies, so for them lower values are better;
+# for all other metrics (throughput) higher values are better
+LATENCY_METRIC_SUFFIXES = ("_p50", "_p95", "_p99")
+
+
+@dataclass
+class BaselineRun:
+    """
+    Results of a single load run together with parameters of the load and versions
+    of binaries it was executed against
+    """
+
+    params: dict[str, str]
+    metrics: dict[str, float]
+    versions: dict[str, str] = field(default_factory=dict)
+    timestamp: str = ""
+
+
+class LoadBaselineStore:
+    """
+    History of load runs kept in a JSON file.
+
+    Runs are matched by load parameters, so that results of a new run can be compared with
+    previous runs of the same load. Versions of binaries are stored with every run to tell
+    which release the baseline comes from.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def get_history(
+        self, params: dict[str, str], size: int = DEFAULT_HISTORY_SIZE
+    ) -> list[BaselineRun]:
+        """
+        Returns the most recent runs with the given load parameters, oldest first.
+        """
+        params = _normalize_params(params)
+        runs = [run for run in self._read() if run.params == params]
+        return runs[-size:]
+
+    def add_run(self, run: BaselineRun) -> None:
+        run.params = _normalize_params(run.params)
+        runs = self._read()
+        runs.append(run)
+        self._write(runs)
+
+    def _read(self) -> list[BaselineRun]:
+        if not os.path.exists(self.file_path):
+            return []
+        with open(self.file_path, "r") as file:
+            content = json.load(file)
+        return [BaselineRun(**run) for run in content.get("runs", [])]
+
+    def _write(self, runs: list[BaselineRun]) -> None:
+        # File is written to a temporary one first, so that it is never left partially written
+        tmp_file_path = f"{self.file_path}.{os.getpid()}"
+        with open(tmp_file_path, "w") as file:
+            json.dump({"runs": [asdict(run) for run in runs]}, file, indent=2)
+        os.replace(tmp_file_path, self.file_path)
+
+
+def find_regressions(
+    metrics: dict[str, float],
+    history: list[BaselineRun],
+    tolerances: Optional[dict[str, float]] = None,
+    default_tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """
+    Compares metrics of a load run with medians of the same metrics in previous runs.
+
+    Args:
+        metrics: metrics of the run to check
+        history: previous runs of the same load
+        tolerances: maximum allowed relative deviation from the median by metric name
+        default_tolerance: tolerance for metrics that are not listed in tolerances
+
+    Returns:
+        Descriptions of metrics that are worse than the baseline more than allowed.
+    """
+    tolerances = tolerances or {}
+    regressions = []
+    for metric, value in metrics.items():
+        baseline_values = [run.metrics[metric] for run in history if metric in run.metrics]
+        if not baseline_values:
+            continue
+        median = statistics.median(baseline_values)
+        if not median:
+            continue
+
+        tolerance = tolerances.get(metric, default_tolerance)
+        deviation = (value - median) / median
+        if metric.endswith(LATENCY_METRIC_SUFFIXES):
+            regressed = deviation > tolerance
+        else:
+            regressed = deviation < -tolerance
+        description = (
+            f"{metric}: {value:.2f} against median {median:.2f} of {len(baseline_values)} runs "
+            f"({deviation:+.0%}, tolerance {tolerance:.0%})"
+        )
+        logger.info(description)
+        if regressed:
+            regressions.append(description)
+    return regressions
+
+
+def parse_tolerances(tolerances: str) -> dict[str, float]:
+    """
+    Parses per-metric tolerances from string in form of "metric=tolerance,...".
+    """
+    parsed = {}
+    for item in filter(None, tolerances.split(",")):
+        metric, tolerance = item.split("=")
+        parsed[metric.strip()] = float(tolerance)
+    return parsed
+
+
+def _normalize_params(params: dict) -> dict[str, str]:
+    # Parameters come both from env (as strings) and from code, JSON keeps strings only
+    return {name: str(value) for name, value in params.items()}
@@ -0,0 +1,97 @@
+import concurrent.futures
+import logging
+from dataclasses import dataclass
+from time import time
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+logger = logging.getLogger("NeoLogger")
+
+DEFAULT_MAX_WORKERS = 16
+# How often (in seconds) the engine wakes up to look for tasks that exceeded their timeout
+TIMEOUT_CHECK_INTERVAL = 0.5
+
+
+@dataclass
+class TaskResult:
+    """
+    Outcome of a single task executed by fan_out
+    """
+
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fan_out(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: Optional[float] = None,
+) -> Iterator[TaskResult]:
+    """
+    Runs func for every item in a bounded thread pool and yields results as they complete.
+
+    Exceptions raised by func are not propagated, they are returned in TaskResult.error instead.
+    If caller stops iteration early (e.g. with break), tasks that have not been started yet are
+    cancelled; already running tasks are left to finish in background.
+
+    Args:
+        func: callable to run for every item; it receives item as a single argument
+        items: items to process
+        max_workers: maximum number of tasks running at the same time
+        timeout: how long (in seconds) a single task may run before it is reported
+            with TimeoutError; None means no limit
+
+    Returns:
+        Iterator over TaskResult objects in order of completion.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    started_at: dict[int, float] = {}
+
+    def run(index: int) -> Any:
+        started_at[index] = time()
+        return func(items[index])
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    pending = {executor.submit(run, index): index for index in range(len(items))}
+    try:
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending,
+                timeout=TIMEOUT_CHECK_INTERVAL if timeout else None,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                index = pending.pop(future)
+                duration = time() - started_at.get(index, time())
+                error = future.exception()
+                yield TaskResult(
+                    items[index],
+                    result=None if error else future.result(),
+                    error=error,
+                    duration=duration,
+                )
+
+            if not timeout:
+                continue
+            now = time()
+            for future, index in list(pending.items()):
+                started = started_at.get(index)
+                if started is not None and now - started > timeout:
+                    pending.pop(future)
+                    logger.info(f"Task for {items[index]} has not finished in {timeout}s")
+                    yield TaskResult(
+                        items[index],
+                        error=TimeoutError(f"Task for {items[index]} timed out after {timeout}s"),
+                        duration=now - started,
+                    )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
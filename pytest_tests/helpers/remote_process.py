@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import base64
+import codecs
+import threading
 import uuid
 from typing import Optional
 
@@ -13,17 +16,22 @@ class RemoteProcess:
     def __init__(self, cmd: str, process_dir: str, shell: Shell):
         self.process_dir = process_dir
         self.cmd = cmd
-        self.stdout_last_line_number = 0
-        self.stderr_last_line_number = 0
+        self.stdout_offset = 0
+        self.stderr_offset = 0
         self.pid: Optional[str] = None
         self.proc_rc: Optional[int] = None
         self.saved_stdout: Optional[str] = None
         self.saved_stderr: Optional[str] = None
         self.shell = shell
+        # Decoders keep incomplete multibyte character at the end of a read until the next one
+        self._stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stderr_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
     @classmethod
     @allure.step("Create remote process")
-    def create(cls, command: str, shell: Shell) -> RemoteProcess:
+    def create(
+        cls, command: str, shell: Shell, start_barrier: Optional[threading.Barrier] = None
+    ) -> RemoteProcess:
         """
         Create a process on a remote host.
 
@@ -37,6 +45,8 @@ class RemoteProcess:
         Args:
             shell: Shell instance
             command: command to be run on a remote host
+            start_barrier: if set, process is started only when all parties of the barrier
+                are ready, which allows to start processes on several hosts at the same moment
 
         Returns:
             RemoteProcess instance for further examination
@@ -44,6 +54,8 @@ class RemoteProcess:
         remote_process = cls(cmd=command, process_dir=f"/tmp/proc_{uuid.uuid4()}", shell=shell)
         remote_process._create_process_dir()
         remote_process._generate_command_script(command)
+        if start_barrier:
+            start_barrier.wait()
         remote_process._start_process()
         remote_process.pid = remote_process._get_pid()
         return remote_process
@@ -57,25 +69,21 @@ class RemoteProcess:
             full: returns full stdout that we have to this moment
 
         Returns:
-            Fresh stdout. By means of stdout_last_line_number only new stdout lines are returned.
-            If process is finished (proc_rc is not None) saved stdout is returned
+            Fresh stdout. By means of stdout_offset only bytes written after the previous call
+            are read from remote host.
+            If full and process is finished (proc_rc is not None) saved stdout is returned
         """
-        if self.saved_stdout is not None:
-            cur_stdout = self.saved_stdout
-        else:
+        if full:
+            if self.saved_stdout is not None:
+                return self.saved_stdout
             terminal = self.shell.exec(f"cat {self.process_dir}/stdout")
             if self.proc_rc is not None:
                 self.saved_stdout = terminal.stdout
-            cur_stdout = terminal.stdout
+            return terminal.stdout
 
-        if full:
-            return cur_stdout
-        whole_stdout = cur_stdout.split("\n")
-        if len(whole_stdout) > self.stdout_last_line_number:
-            resulted_stdout = "\n".join(whole_stdout[self.stdout_last_line_number :])
-            self.stdout_last_line_number = len(whole_stdout)
-            return resulted_stdout
-        return ""
+        fresh_stdout = self._read_from_offset("stdout", self.stdout_offset)
+        self.stdout_offset += len(fresh_stdout)
+        return self._stdout_decoder.decode(fresh_stdout)
 
     @allure.step("Get process stderr")
     def stderr(self, full: bool = False) -> str:
@@ -86,24 +94,21 @@ class RemoteProcess:
             full: returns full stderr that we have to this moment
 
         Returns:
-            Fresh stderr. By means of stderr_last_line_number only new stderr lines are returned.
-            If process is finished (proc_rc is not None) saved stderr is returned
+            Fresh stderr. By means of stderr_offset only bytes written after the previous call
+            are read from remote host.
+            If full and process is finished (proc_rc is not None) saved stderr is returned
         """
-        if self.saved_stderr is not None:
-            cur_stderr = self.saved_stderr
-        else:
+        if full:
+            if self.saved_stderr is not None:
+                return self.saved_stderr
             terminal = self.shell.exec(f"cat {self.process_dir}/stderr")
             if self.proc_rc is not None:
                 self.saved_stderr = terminal.stdout
-            cur_stderr = terminal.stdout
-        if full:
-            return cur_stderr
-        whole_stderr = cur_stderr.split("\n")
-        if len(whole_stderr) > self.stderr_last_line_number:
-            resulted_stderr = "\n".join(whole_stderr[self.stderr_last_line_number :])
-            self.stderr_last_line_number = len(whole_stderr)
-            return resulted_stderr
-        return ""
+            return terminal.stdout
+
+        fresh_stderr = self._read_from_offset("stderr", self.stderr_offset)
+        self.stderr_offset += len(fresh_stderr)
+        return self._stderr_decoder.decode(fresh_stderr)
 
     @allure.step("Get process rc")
     def rc(self) -> Optional[int]:
@@ -147,6 +152,19 @@ class RemoteProcess:
             raise AssertionError(f"Invalid path to delete: {self.process_dir}")
         self.shell.exec(f"rm -rf {self.process_dir}")
 
+    def _read_from_offset(self, file_name: str, offset: int) -> bytes:
+        # Shell drops bytes it can not decode, so output is transferred in base64 to get exactly
+        # the bytes written after the offset. Exit code of the pipeline is the one of base64, so
+        # missing or truncated file is checked beforehand, otherwise it would be read as empty
+        path = f"{self.process_dir}/{file_name}"
+        terminal = self.shell.exec(
+            f"size=$(stat -c %s {path}) || exit 1; "
+            f"if [ $size -lt {offset} ]; then echo '{path} is shorter than {offset} bytes' >&2; "
+            f"exit 1; fi; "
+            f"tail -c +{offset + 1} {path} | base64 -w 0"
+        )
+        return base64.b64decode(terminal.stdout)
+
     @allure.step("Start remote process")
     def _start_process(self) -> None:
         self.shell.exec(
@@ -1,12 +1,38 @@
 import logging
+import random
+import threading
+from dataclasses import dataclass
 from functools import wraps
 from time import sleep, time
+from typing import Any, Callable, Optional
 
 from _pytest.outcomes import Failed
 from pytest import fail
 
 logger = logging.getLogger("NeoLogger")
 
+# Delay before the first retry; conditions we wait for are often met almost immediately
+FIRST_RETRY_DELAY = 0.2
+DEFAULT_BACKOFF_FACTOR = 2.0
+DEFAULT_JITTER = 0.1
+
+
+@dataclass
+class PollStats:
+    """
+    Statistics of a single poll call
+    """
+
+    name: str
+    attempts: int = 0
+    total_wait: float = 0.0
+    duration: float = 0.0
+    succeeded: bool = False
+
+
+poll_stats: list[PollStats] = []
+_poll_stats_lock = threading.Lock()
+
 
 class expect_not_raises:
     """
@@ -46,34 +72,109 @@ class expect_not_raises:
         return impl
 
 
+def poll(
+    check: Callable[[], Any],
+    timeout: float = 60,
+    max_interval: float = 1,
+    first_retry: float = FIRST_RETRY_DELAY,
+    backoff: float = DEFAULT_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_JITTER,
+    event: Optional[threading.Event] = None,
+    name: Optional[str] = None,
+) -> Any:
+    """
+    Calls check until it passes (returns without exception) and returns its result.
+
+    Delay between attempts starts from first_retry and grows by backoff factor up to
+    max_interval; every delay is randomized by jitter to avoid polling in lockstep.
+    If check does not pass within timeout, the last exception raised by check is re-raised.
+
+    Be careful though, check should only check the state of something, not change it.
+
+    Args:
+        check: callable that raises an exception while condition is not met
+        timeout: time budget (in seconds) for all attempts
+        max_interval: maximum delay (in seconds) between attempts
+        first_retry: delay (in seconds) before the second attempt
+        backoff: multiplier applied to the delay after each attempt
+        jitter: relative random deviation of the delay, e.g. 0.1 means +/- 10%
+        event: if set by some other thread, the next attempt is made immediately
+        name: name of the poll in statistics (name of check function by default)
+    Returns:
+        Result returned by check.
+    """
+    stats = PollStats(name or getattr(check, "__qualname__", repr(check)))
+    start = time()
+    deadline = start + timeout
+    delay = min(first_retry, max_interval)
+    try:
+        while True:
+            stats.attempts += 1
+            try:
+                result = check()
+                stats.succeeded = True
+                return result
+            except (Exception, Failed) as ex:
+                logger.debug(ex)
+                remaining = deadline - time()
+                if remaining <= 0:
+                    # timeout exceeded with no success, raise last exception
+                    raise
+
+            wait_time = min(delay * random.uniform(1 - jitter, 1 + jitter), remaining)
+            wait_start = time()
+            if event:
+                if event.wait(wait_time):
+                    event.clear()
+            else:
+                sleep(wait_time)
+            stats.total_wait += time() - wait_start
+            delay = min(delay * backoff, max_interval)
+    finally:
+        stats.duration = time() - start
+        with _poll_stats_lock:
+            poll_stats.append(stats)
+        logger.debug(
+            f"Poll {stats.name}: succeeded={stats.succeeded}, attempts={stats.attempts}, "
+            f"waited {stats.total_wait:.2f}s of {stats.duration:.2f}s"
+        )
+
+
+def get_poll_summary() -> dict[str, PollStats]:
+    """
+    Aggregates statistics of all poll calls made so far by poll name.
+    """
+    summary = {}
+    with _poll_stats_lock:
+        for stats in poll_stats:
+            total = summary.setdefault(stats.name, PollStats(stats.name, succeeded=True))
+            total.attempts += stats.attempts
+            total.total_wait += stats.total_wait
+            total.duration += stats.duration
+            total.succeeded = total.succeeded and stats.succeeded
+    return summary
+
+
 def wait_for_success(max_wait_time: int = 60, interval: int = 1):
     """
     Decorator to wait for some conditions/functions to pass successfully.
     This is useful if you don't know exact time when something should pass successfully and do not
     want to use sleep(X) with too big X.
 
+    Function is retried with backoff that starts from a short delay and grows up to interval.
+
     Be careful though, wrapped function should only check the state of something, not change it.
     """
 
     def wrapper(func):
         @wraps(func)
         def impl(*a, **kw):
-            start = int(round(time()))
-            last_exception = None
-            while start + max_wait_time >= int(round(time())):
-                try:
-                    return func(*a, **kw)
-                except Exception as ex:
-                    logger.debug(ex)
-                    last_exception = ex
-                    sleep(interval)
-                except Failed as ex:
-                    logger.debug(ex)
-                    last_exception = ex
-                    sleep(interval)
-
-            # timeout exceeded with no success, raise last_exception
-            raise last_exception
+            return poll(
+                lambda: func(*a, **kw),
+                timeout=max_wait_time,
+                max_interval=interval,
+                name=func.__qualname__,
+            )
 
         return impl
 
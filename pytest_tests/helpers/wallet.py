@@ -1,12 +1,21 @@
+import logging
 import os
+import threading
 import uuid
 from dataclasses import dataclass
+from typing import Callable
 
 from cluster import Cluster, NodeBase
 from common import FREE_STORAGE, WALLET_CONFIG, WALLET_PASS
+from data_formatters import get_wallet_address
 from neofs_testlib.shell import Shell
-from neofs_testlib.utils.wallet import get_last_address_from_wallet, init_wallet
-from python_keywords.payment_neogo import deposit_gas, transfer_gas
+from neofs_testlib.utils.wallet import init_wallet
+from python_keywords.payment_neogo import deposit_gas_from_many, transfer_gas_to_many
+
+logger = logging.getLogger("NeoLogger")
+
+# Amount of GAS deposited to NeoFS for every new wallet
+WALLET_DEPOSIT = 30
 
 
 @dataclass
@@ -28,14 +37,59 @@ class WalletFile:
         Returns:
             The address of the wallet.
         """
-        return get_last_address_from_wallet(self.path, self.password)
+        return get_wallet_address(self.path, self.password)
+
+
+class WalletPool:
+    """
+    Pool of ready-to-use wallets.
+
+    Wallets are created and funded in batches of the pool size when the pool runs out of them,
+    so that funding transactions of the whole batch are sent and confirmed together instead of
+    one wallet at a time.
+    """
+
+    def __init__(self, create_wallets: Callable[[int], list[WalletFile]], size: int) -> None:
+        """
+        Args:
+            create_wallets: callable that creates and funds the given number of wallets
+            size: number of wallets that are created at once when the pool is empty
+        """
+        self.create_wallets = create_wallets
+        self.size = size
+        self._wallets: list[WalletFile] = []
+        self._lock = threading.Lock()
+
+    def get_wallet(self) -> WalletFile:
+        """
+        Takes a funded wallet from the pool, refilling the pool if it is empty.
+
+        Returns:
+            WalletFile object of the wallet.
+        """
+        with self._lock:
+            if not self._wallets:
+                logger.info(f"Fill wallet pool with {self.size} wallets")
+                self._wallets = self.create_wallets(self.size)
+            return self._wallets.pop()
 
 
 class WalletFactory:
-    def __init__(self, wallets_dir: str, shell: Shell, cluster: Cluster) -> None:
+    def __init__(
+        self, wallets_dir: str, shell: Shell, cluster: Cluster, pool_size: int = 0
+    ) -> None:
+        """
+        Args:
+            wallets_dir: directory to store wallet files in
+            shell: shell to run funding commands with
+            cluster: cluster instance under test
+            pool_size: number of wallets with default password that are created and funded
+                together; 0 means that wallets are created one by one on demand
+        """
         self.shell = shell
         self.wallets_dir = wallets_dir
         self.cluster = cluster
+        self.pool = WalletPool(self.create_wallets, pool_size) if pool_size else None
 
     def create_wallet(self, password: str = WALLET_PASS) -> WalletFile:
         """
@@ -46,25 +100,41 @@ class WalletFactory:
         Returns:
             WalletFile object of new wallet
         """
-        wallet_path = os.path.join(self.wallets_dir, f"{str(uuid.uuid4())}.json")
-        init_wallet(wallet_path, password)
+        if self.pool and password == WALLET_PASS:
+            return self.pool.get_wallet()
+        return self.create_wallets(1, password)[0]
+
+    def create_wallets(self, count: int, password: str = WALLET_PASS) -> list[WalletFile]:
+        """
+        Creates several new default wallets bypassing the pool
+        Args:
+            count: number of wallets to create
+            password: wallets password
+
+        Returns:
+            List of WalletFile objects of new wallets
+        """
+        wallets = []
+        for _ in range(count):
+            wallet_path = os.path.join(self.wallets_dir, f"{str(uuid.uuid4())}.json")
+            init_wallet(wallet_path, password)
+            wallets.append(WalletFile(wallet_path, password))
 
         if not FREE_STORAGE:
-            main_chain = self.cluster.main_chain_nodes[0]
-            deposit = 30
-            transfer_gas(
-                shell=self.shell,
-                amount=deposit + 1,
-                main_chain=main_chain,
-                wallet_to_path=wallet_path,
-                wallet_to_password=password,
-            )
-            deposit_gas(
-                shell=self.shell,
-                amount=deposit,
-                main_chain=main_chain,
-                wallet_from_path=wallet_path,
-                wallet_from_password=password,
-            )
-
-        return WalletFile(wallet_path, password)
+            self._fund_wallets(wallets)
+        return wallets
+
+    def _fund_wallets(self, wallets: list[WalletFile]) -> None:
+        main_chain = self.cluster.main_chain_nodes[0]
+        transfer_gas_to_many(
+            shell=self.shell,
+            main_chain=main_chain,
+            amounts={wallet.get_address(): WALLET_DEPOSIT + 1 for wallet in wallets},
+        )
+        deposit_gas_from_many(
+            shell=self.shell,
+            main_chain=main_chain,
+            morph_chain=self.cluster.morph_chain_nodes[0],
+            amount=WALLET_DEPOSIT,
+            wallets=[(wallet.path, wallet.password) for wallet in wallets],
+        )
@@ -25,3 +25,14 @@ STORAGE_NODE_COUNT = os.getenv("STORAGE_NODE_COUNT", "4").split(",")
 CONTAINER_PLACEMENT_POLICY = os.getenv(
     "CONTAINER_PLACEMENT_POLICY", "REP 1 IN X CBF 1 SELECT 1  FROM * AS X"
 )
+
+# Load results baseline parameters
+# Results of load runs are stored in this JSON file and compared with previous runs;
+# comparison is disabled if the file is not set
+LOAD_BASELINE_FILE = os.getenv("LOAD_BASELINE_FILE")
+# Number of the most recent runs with the same load parameters used to calculate the baseline
+LOAD_BASELINE_HISTORY_SIZE = int(os.getenv("LOAD_BASELINE_HISTORY_SIZE", "10"))
+# Maximum allowed deviation from the baseline median, e.g. 0.25 allows 25% worse results
+LOAD_BASELINE_TOLERANCE = float(os.getenv("LOAD_BASELINE_TOLERANCE", "0.25"))
+# Per-metric tolerances in form of "metric=tolerance,...", e.g. "write_ops=0.1,put_p99=0.5"
+LOAD_BASELINE_TOLERANCES = os.getenv("LOAD_BASELINE_TOLERANCES", "")
@@ -1,7 +1,7 @@
 import allure
 import epoch
 import pytest
-from cluster import Cluster
+from cluster import Cluster, StorageNode
 from neofs_testlib.shell import Shell
 
 
@@ -21,8 +21,8 @@ class ClusterTestBase:
         for _ in range(epochs_to_tick):
             self.tick_epoch()
 
-    def tick_epoch(self):
-        epoch.tick_epoch(self.shell, self.cluster)
+    def tick_epoch(self, wait: bool = False):
+        epoch.tick_epoch(self.shell, self.cluster, wait=wait)
 
     def wait_for_epochs_align(self):
         epoch.wait_for_epochs_align(self.shell, self.cluster)
@@ -30,5 +30,8 @@ class ClusterTestBase:
     def get_epoch(self):
         return epoch.get_epoch(self.shell, self.cluster)
 
+    def get_epochs(self) -> dict[StorageNode, int]:
+        return epoch.get_epochs(self.shell, self.cluster)
+
     def ensure_fresh_epoch(self):
         return epoch.ensure_fresh_epoch(self.shell, self.cluster)
@@ -1,18 +1,52 @@
-import concurrent.futures
+import base64
+import io
+import json
+import logging
 import re
-from dataclasses import asdict
+import threading
+from datetime import datetime
+from typing import Optional
 
 import allure
 from common import STORAGE_NODE_SERVICE_NAME_REGEX
-from k6 import K6, LoadParams, LoadResults
+from k6 import (
+    K6,
+    ClusterLoadResults,
+    LoadParams,
+    LoadResults,
+    aggregate_load_results,
+    merge_pregen_jsons,
+)
+from load_baseline import (
+    DEFAULT_TOLERANCE,
+    BaselineRun,
+    LoadBaselineStore,
+    find_regressions,
+    parse_tolerances,
+)
+from load_params import (
+    LOAD_BASELINE_FILE,
+    LOAD_BASELINE_HISTORY_SIZE,
+    LOAD_BASELINE_TOLERANCE,
+    LOAD_BASELINE_TOLERANCES,
+)
 from neofs_testlib.cli.neofs_authmate import NeofsAuthmate
 from neofs_testlib.cli.neogo import NeoGo
 from neofs_testlib.hosting import Hosting
-from neofs_testlib.shell import CommandOptions, SSHShell
+from neofs_testlib.shell import CommandOptions, Shell, SSHShell
 from neofs_testlib.shell.interfaces import InteractiveInput
+from parallel import fan_out
+
+logger = logging.getLogger("NeoLogger")
+
+# Size of base64-encoded file chunk that is passed in a single command when file is uploaded
+# through the shell; it stays well below the limit of a single command line argument
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 NEOFS_AUTHMATE_PATH = "neofs-s3-authmate"
 STOPPED_HOSTS = []
+# Maximum time (in seconds) load nodes wait for each other to be ready to start the load
+K6_START_BARRIER_TIMEOUT = 300
 
 
 @allure.title("Get services endpoints")
@@ -33,9 +67,9 @@ def stop_unused_nodes(storage_nodes: list, used_nodes_count: int):
 
 @allure.title("Start nodes")
 def start_stopped_nodes():
-    for host in STOPPED_HOSTS:
+    while STOPPED_HOSTS:
+        host = STOPPED_HOSTS.pop()
         host.start_host()
-        STOPPED_HOSTS.remove(host)
 
 
 @allure.title("Init s3 client")
@@ -98,11 +132,6 @@ def clear_cache_and_data(hosting: Hosting):
         host.start_service(service_config.name)
 
 
-@allure.title("Prepare objects")
-def prepare_objects(k6_instance: K6):
-    k6_instance.prepare()
-
-
 @allure.title("Prepare K6 instances and objects")
 def prepare_k6_instances(
     load_nodes: list, login: str, pkey: str, load_params: LoadParams, prepare: bool = True
@@ -112,17 +141,78 @@ def prepare_k6_instances(
         ssh_client = SSHShell(host=load_node, login=login, private_key_path=pkey)
         k6_load_object = K6(load_params, ssh_client)
         k6_load_objects.append(k6_load_object)
-    for k6_load_object in k6_load_objects:
-        if prepare:
-            with allure.step("Prepare objects"):
-                prepare_objects(k6_load_object)
+    if prepare:
+        with allure.step("Prepare objects"):
+            prepare_objects_in_parallel(k6_load_objects)
     return k6_load_objects
 
 
+@allure.title("Prepare objects on load nodes in parallel")
+def prepare_objects_in_parallel(k6_instances: list[K6]) -> None:
+    """
+    Preloads a single dataset for all load nodes.
+
+    Containers are split between load nodes, every node creates its share of containers and
+    preloads objects into them at the same time as the others. Pregen JSONs of all nodes are
+    then merged and the merged one is uploaded to every load node.
+
+    Args:
+        k6_instances: k6 instances of load nodes
+    """
+    nodes_count = len(k6_instances)
+    containers_count = int(k6_instances[0].load_params.containers_count or 1)
+    shares = [
+        containers_count // nodes_count + (1 if index < containers_count % nodes_count else 0)
+        for index in range(nodes_count)
+    ]
+    presets = [(k6_instance, share) for k6_instance, share in zip(k6_instances, shares) if share]
+
+    def preset_share(preset: tuple[K6, int]) -> dict:
+        k6_instance, share = preset
+        part_file = f"{k6_instance.pregen_json}.part"
+        k6_instance.prepare(containers_count=share, out_file=part_file)
+        return json.loads(k6_instance.shell.exec(f"cat {part_file}").stdout)
+
+    def upload_pregen_json(k6_instance: K6) -> None:
+        _upload_file(k6_instance.shell, pregen_json, k6_instance.pregen_json)
+
+    parts = []
+    errors = []
+    for task in fan_out(preset_share, presets, max_workers=len(presets)):
+        if task.ok:
+            parts.append(task.result)
+        else:
+            errors.append(f"{getattr(task.item[0].shell, 'host', task.item[0])}: {task.error}")
+    assert not errors, "Preset failed on load nodes:\n" + "\n".join(errors)
+
+    pregen_json = json.dumps(merge_pregen_jsons(parts)).encode()
+    for task in fan_out(upload_pregen_json, k6_instances, max_workers=nodes_count):
+        if not task.ok:
+            errors.append(f"{getattr(task.item.shell, 'host', task.item)}: {task.error}")
+    assert not errors, "Pregen JSON upload failed on load nodes:\n" + "\n".join(errors)
+
+
+def _upload_file(shell: Shell, content: bytes, remote_path: str) -> None:
+    # Pregen JSON of a large dataset does not fit into command line. Testlib has no API to
+    # transfer files, so SSH shell uploads it over SFTP within its own connection (same
+    # credentials and host key handling); any other shell gets it in base64-encoded chunks
+    if isinstance(shell, SSHShell):
+        with shell._connection.open_sftp() as sftp:
+            sftp.putfo(io.BytesIO(content), remote_path)
+        return
+
+    encoded = base64.b64encode(content).decode()
+    encoded_path = f"{remote_path}.b64"
+    shell.exec(f"rm -f {encoded_path}")
+    for start in range(0, len(encoded), UPLOAD_CHUNK_SIZE):
+        shell.exec(f"printf %s '{encoded[start:start + UPLOAD_CHUNK_SIZE]}' >> {encoded_path}")
+    shell.exec(f"base64 -d {encoded_path} > {remote_path} && rm -f {encoded_path}")
+
+
 @allure.title("Run K6")
-def run_k6_load(k6_instance: K6) -> LoadResults:
+def run_k6_load(k6_instance: K6, start_barrier: Optional[threading.Barrier] = None) -> LoadResults:
     with allure.step("Executing load"):
-        k6_instance.start()
+        k6_instance.start(start_barrier)
         k6_instance.wait_until_finished(k6_instance.load_params.load_time * 2)
     with allure.step("Printing results"):
         k6_instance.get_k6_results()
@@ -130,33 +220,91 @@ def run_k6_load(k6_instance: K6) -> LoadResults:
 
 
 @allure.title("MultiNode K6 Run")
-def multi_node_k6_run(k6_instances: list) -> dict:
-    results = []
-    avg_results = {}
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = []
-        for k6_instance in k6_instances:
-            futures.append(executor.submit(run_k6_load, k6_instance))
-        for future in concurrent.futures.as_completed(futures):
-            results.append(asdict(future.result()))
-    for k6_result in results:
-        for key in k6_result:
-            try:
-                avg_results[key] += k6_result[key] / len(results)
-            except KeyError:
-                avg_results[key] = k6_result[key] / len(results)
-    return avg_results
+def multi_node_k6_run(k6_instances: list[K6]) -> ClusterLoadResults:
+    """
+    Runs the same load on all load nodes at once and combines their results.
+
+    Load nodes are prepared concurrently and k6 is started on all of them only when every node
+    is ready. Throughput is summed over load nodes and latency percentiles are calculated from
+    merged latency histograms.
+
+    Args:
+        k6_instances: k6 instances of load nodes
+
+    Returns:
+        Cluster-wide load results.
+    """
+    start_barrier = threading.Barrier(len(k6_instances), timeout=K6_START_BARRIER_TIMEOUT)
+
+    def run_on_load_node(k6_instance: K6):
+        try:
+            load_results = run_k6_load(k6_instance, start_barrier)
+            return load_results, k6_instance.get_metrics_summary()
+        finally:
+            k6_instance.clear_metrics()
+
+    node_results = []
+    errors = []
+    for task in fan_out(run_on_load_node, k6_instances, max_workers=len(k6_instances)):
+        if task.ok:
+            node_results.append(task.result)
+            continue
+        # Do not let other load nodes wait for the failed one
+        start_barrier.abort()
+        errors.append(f"{getattr(task.item.shell, 'host', task.item)}: {task.error}")
+    assert not errors, "K6 failed on load nodes:\n" + "\n".join(errors)
+
+    load_results = aggregate_load_results(k6_instances[0].load_params, node_results)
+    allure.attach(load_results.report(), "Cluster load results", allure.attachment_type.TEXT)
+    return load_results
 
 
 @allure.title("Compare results")
-def compare_load_results(result: dict, result_new: dict):
+def compare_load_results(result: dict, result_new: dict, tolerance: float = DEFAULT_TOLERANCE):
     for key in result:
         if result[key] != 0 and result_new[key] != 0:
-            if (abs(result[key] - result_new[key]) / min(result[key], result_new[key])) < 0.25:
+            if (abs(result[key] - result_new[key]) / min(result[key], result_new[key])) < tolerance:
                 continue
             else:
-                raise AssertionError(f"Difference in {key} values more than 25%")
+                raise AssertionError(f"Difference in {key} values more than {tolerance:.0%}")
         elif result[key] == 0 and result_new[key] == 0:
             continue
         else:
             raise AssertionError(f"Unexpected zero value in {key}")
+
+
+@allure.title("Compare results with baseline")
+def check_load_baseline(
+    load_results: ClusterLoadResults, params: dict, versions: dict[str, str]
+) -> None:
+    """
+    Compares load results with medians of previous runs of the same load and stores
+    the results as a new run of the baseline.
+
+    Args:
+        load_results: results of the load run
+        params: parameters that identify the load (load type, object size, etc.)
+        versions: versions of binaries the load was executed against
+    """
+    if not LOAD_BASELINE_FILE:
+        logger.info("Load baseline file is not set, comparison with baseline is skipped")
+        return
+
+    store = LoadBaselineStore(LOAD_BASELINE_FILE)
+    history = store.get_history(params, LOAD_BASELINE_HISTORY_SIZE)
+    metrics = load_results.metrics()
+    regressions = find_regressions(
+        metrics,
+        history,
+        tolerances=parse_tolerances(LOAD_BASELINE_TOLERANCES),
+        default_tolerance=LOAD_BASELINE_TOLERANCE,
+    )
+    store.add_run(
+        BaselineRun(
+            params=params,
+            metrics=metrics,
+            versions=versions,
+            timestamp=datetime.utcnow().isoformat(),
+        )
+    )
+    assert not regressions, "Load results are worse than baseline:\n" + "\n".join(regressions)
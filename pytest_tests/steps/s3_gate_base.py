@@ -11,13 +11,13 @@ import pytest
 import s3_gate_bucket
 import s3_gate_object
 import urllib3
-from aws_cli_client import AwsCliClient
+from aws_cli_client import AwsCliClient, AwsCliPersistentClient
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from cli_helpers import _cmd_run, _configure_aws_cli, _run_with_passwd
 from cluster import Cluster
 from cluster_test_base import ClusterTestBase
-from common import NEOFS_AUTHMATE_EXEC
+from common import AWS_CLI_PERSISTENT, NEOFS_AUTHMATE_EXEC
 from neofs_testlib.shell import Shell
 from pytest import FixtureRequest
 from python_keywords.container import list_containers
@@ -194,7 +194,10 @@ def configure_boto3_client(access_key_id: str, secret_access_key: str, s3gate_en
 @allure.step("Configure S3 client (aws cli)")
 def configure_cli_client(access_key_id: str, secret_access_key: str, s3gate_endpoint: str):
     try:
-        client = AwsCliClient(s3gate_endpoint)
+        if AWS_CLI_PERSISTENT:
+            client = AwsCliPersistentClient(s3gate_endpoint)
+        else:
+            client = AwsCliClient(s3gate_endpoint)
         _configure_aws_cli("aws configure", access_key_id, secret_access_key)
         _cmd_run(f"aws configure set max_attempts {MAX_REQUEST_ATTEMPTS}")
         _cmd_run(f"aws configure set retry_mode {RETRY_MODE}")
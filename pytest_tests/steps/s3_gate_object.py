@@ -1,7 +1,8 @@
 import logging
 import os
 import uuid
-from time import sleep
+from dataclasses import dataclass
+from time import sleep, time
 from typing import Optional
 
 import allure
@@ -10,6 +11,9 @@ import urllib3
 from aws_cli_client import AwsCliClient
 from botocore.exceptions import ClientError
 from cli_helpers import log_command_execution
+from common import ASSETS_DIR
+from file_helper import StreamDigest, get_file_hash, save_stream
+from parallel import fan_out
 from s3_gate_bucket import S3_SYNC_WAIT_TIME
 
 ##########################################################
@@ -19,6 +23,12 @@ urllib3.disable_warnings()
 ##########################################################
 logger = logging.getLogger("NeoLogger")
 
+# S3 requires every part except the last one to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 8
+MULTIPART_PART_ATTEMPTS = 3
+MULTIPART_RETRY_DELAY = 1
+
 ACL_COPY = [
     "private",
     "public-read",
@@ -29,8 +39,6 @@ ACL_COPY = [
     "bucket-owner-full-control",
 ]
 
-ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
-
 
 @allure.step("List objects S3 v2")
 def list_objects_s3_v2(s3_client, bucket: str, full_output: bool = False) -> list:
@@ -328,11 +336,7 @@ def get_object_s3(
         log_command_execution("S3 Get objects result", response)
 
         if not isinstance(s3_client, AwsCliClient):
-            with open(f"{filename}", "wb") as get_file:
-                chunk = response["Body"].read(1024)
-                while chunk:
-                    get_file.write(chunk)
-                    chunk = response["Body"].read(1024)
+            save_stream(response["Body"], filename)
         return response if full_output else filename
 
     except ClientError as err:
@@ -342,6 +346,45 @@ def get_object_s3(
         ) from err
 
 
+@allure.step("Get object S3 and hash on the fly")
+def get_object_s3_digest(
+    s3_client,
+    bucket: str,
+    object_key: str,
+    version_id: Optional[str] = None,
+    range: Optional[list] = None,
+    save_to_file: bool = False,
+) -> StreamDigest:
+    """
+    Gets object and computes its hash while reading the response body, so that payload
+    does not have to be read again to verify it. By default payload is not written to disk.
+
+    AWS CLI can only save object to file, so for AwsCliClient the file is always written
+    and hashed afterwards.
+    """
+    if isinstance(s3_client, AwsCliClient):
+        filename = get_object_s3(s3_client, bucket, object_key, version_id, range)
+        return StreamDigest(get_file_hash(filename), os.path.getsize(filename), filename)
+
+    filename = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4())) if save_to_file else None
+    try:
+        params = {"Bucket": bucket, "Key": object_key}
+        if version_id:
+            params["VersionId"] = version_id
+        if range:
+            params["Range"] = f"bytes={range[0]}-{range[1]}"
+
+        response = s3_client.get_object(**params)
+        log_command_execution("S3 Get objects result", response)
+        return save_stream(response["Body"], filename)
+
+    except ClientError as err:
+        raise Exception(
+            f'Error Message: {err.response["Error"]["Message"]}\n'
+            f'Http status code: {err.response["ResponseMetadata"]["HTTPStatusCode"]}'
+        ) from err
+
+
 @allure.step("Create multipart upload S3")
 def create_multipart_upload_s3(s3_client, bucket_name: str, object_key: str) -> str:
     try:
@@ -474,6 +517,185 @@ def complete_multipart_upload_s3(
         ) from err
 
 
+@dataclass
+class PartUploadResult:
+    part_num: int
+    etag: str
+    size: int
+    latency: float
+    attempts: int
+
+
+@dataclass
+class MultipartUploadResult:
+    upload_id: str
+    parts: list[PartUploadResult]
+    duration: float
+
+
+@allure.step("Upload object via parallel multipart upload S3")
+def multipart_upload_s3(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    filepath: str,
+    part_size: int = MULTIPART_PART_SIZE,
+    max_workers: int = MULTIPART_MAX_WORKERS,
+    attempts: int = MULTIPART_PART_ATTEMPTS,
+) -> MultipartUploadResult:
+    """
+    Uploads file with multipart upload: parts are read as byte ranges straight from the source
+    file and uploaded concurrently; every part is retried independently. If some part can not
+    be uploaded, the multipart upload is aborted.
+
+    Args:
+        s3_client: boto3 or AWS CLI client
+        bucket_name: bucket to upload object to
+        object_key: key of the object
+        filepath: path to the file to upload
+        part_size: size of every part except the last one
+        max_workers: maximum number of parts uploaded at the same time
+        attempts: how many times every part is tried to be uploaded
+    Returns:
+        Upload ID and ETag, size, latency and number of attempts of every part.
+    """
+    start = time()
+    upload_id = create_multipart_upload_s3(s3_client, bucket_name, object_key)
+    try:
+        parts = upload_file_parts_s3(
+            s3_client,
+            bucket_name,
+            object_key,
+            upload_id,
+            filepath,
+            part_size=part_size,
+            max_workers=max_workers,
+            attempts=attempts,
+        )
+    except Exception:
+        abort_multipart_uploads_s3(s3_client, bucket_name, object_key, upload_id)
+        raise
+
+    complete_multipart_upload_s3(
+        s3_client,
+        bucket_name,
+        object_key,
+        upload_id,
+        [(part.part_num, part.etag) for part in parts],
+    )
+    return MultipartUploadResult(upload_id, parts, time() - start)
+
+
+@allure.step("Upload parts of file concurrently S3")
+def upload_file_parts_s3(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    upload_id: str,
+    filepath: str,
+    part_size: int = MULTIPART_PART_SIZE,
+    part_nums: Optional[list[int]] = None,
+    max_workers: int = MULTIPART_MAX_WORKERS,
+    attempts: int = MULTIPART_PART_ATTEMPTS,
+) -> list[PartUploadResult]:
+    """
+    Uploads parts of file to the existing multipart upload: parts are read as byte ranges
+    straight from the source file, so it is not split on disk, and uploaded concurrently;
+    every part is retried independently.
+
+    Args:
+        s3_client: boto3 or AWS CLI client
+        bucket_name: bucket of the multipart upload
+        object_key: key of the object
+        upload_id: ID of the multipart upload
+        filepath: path to the file to upload
+        part_size: size of every part except the last one
+        part_nums: numbers of parts to upload (all parts of the file by default)
+        max_workers: maximum number of parts uploaded at the same time
+        attempts: how many times every part is tried to be uploaded
+    Returns:
+        ETag, size, latency and number of attempts of every uploaded part, ordered by part number.
+    """
+    file_size = os.path.getsize(filepath)
+    part_ranges = [
+        (part_num, offset, min(part_size, file_size - offset))
+        for part_num, offset in enumerate(range(0, max(file_size, 1), part_size), start=1)
+        if part_nums is None or part_num in part_nums
+    ]
+
+    def upload(part_range: tuple[int, int, int]) -> PartUploadResult:
+        part_num, offset, size = part_range
+        for attempt in range(1, attempts + 1):
+            part_start = time()
+            try:
+                etag = _upload_file_range(
+                    s3_client, bucket_name, object_key, upload_id, part_num, filepath, offset, size
+                )
+                return PartUploadResult(part_num, etag, size, time() - part_start, attempt)
+            except Exception as err:
+                if attempt == attempts:
+                    raise
+                logger.info(f"Upload of part {part_num} failed (attempt {attempt}): {err}")
+                sleep(MULTIPART_RETRY_DELAY * attempt)
+
+    parts, errors = [], []
+    for task in fan_out(upload, part_ranges, max_workers=max_workers):
+        if task.ok:
+            parts.append(task.result)
+        else:
+            errors.append(task.error)
+    if errors:
+        raise AssertionError(f"Failed to upload {len(errors)} parts of {object_key}") from errors[0]
+
+    parts.sort(key=lambda part: part.part_num)
+    log_command_execution(
+        "S3 Parallel upload parts",
+        {
+            "UploadId": upload_id,
+            "Parts": [
+                {"PartNumber": part.part_num, "Latency": part.latency, "Attempts": part.attempts}
+                for part in parts
+            ],
+        },
+    )
+    return parts
+
+
+def _upload_file_range(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    upload_id: str,
+    part_num: int,
+    filepath: str,
+    offset: int,
+    size: int,
+) -> str:
+    with open(filepath, "rb") as file:
+        file.seek(offset)
+        content = file.read(size)
+
+    if not isinstance(s3_client, AwsCliClient):
+        response = s3_client.upload_part(
+            UploadId=upload_id,
+            Bucket=bucket_name,
+            Key=object_key,
+            PartNumber=part_num,
+            Body=content,
+        )
+        assert response.get("ETag"), f"Expected ETag in response:\n{response}"
+        return response.get("ETag")
+
+    # AWS CLI can upload part only from file, so the range is written to a temporary file
+    part_path = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
+    with open(part_path, "wb") as part_file:
+        part_file.write(content)
+    try:
+        return upload_part_s3(s3_client, bucket_name, object_key, upload_id, part_num, part_path)
+    finally:
+        os.remove(part_path)
+
+
 @allure.step("Put object retention")
 def put_object_retention(
     s3_client,
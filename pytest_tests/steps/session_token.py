@@ -9,10 +9,10 @@ from typing import Any, Optional
 
 import allure
 import json_transformers
-from common import ASSETS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
+from cli_helpers import get_neofs_cli
+from common import ASSETS_DIR
 from data_formatters import get_wallet_public_key
 from json_transformers import encode_for_json
-from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
 from storage_object_info import StorageObjectInfo
 from wallet import WalletFile
@@ -249,7 +249,7 @@ def create_session_token(
         The path to the generated session token file.
     """
     session_token = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC)
+    neofscli = get_neofs_cli(shell, None)
     neofscli.session.create(
         rpc_endpoint=rpc_endpoint,
         address=owner,
@@ -274,7 +274,7 @@ def sign_session_token(shell: Shell, session_token_file: str, wlt: WalletFile) -
         The path to the signed token.
     """
     signed_token_file = os.path.join(os.getcwd(), ASSETS_DIR, str(uuid.uuid4()))
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=WALLET_CONFIG)
+    neofscli = get_neofs_cli(shell)
     neofscli.util.sign_session_token(
         wallet=wlt.path, from_file=session_token_file, to_file=signed_token_file
     )
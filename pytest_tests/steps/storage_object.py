@@ -1,19 +1,21 @@
 import logging
-from time import sleep
+import re
 
 import allure
-import pytest
 from cluster import Cluster
 from epoch import tick_epoch
 from grpc_responses import OBJECT_ALREADY_REMOVED
 from neofs_testlib.shell import Shell
+from parallel import fan_out
 from python_keywords.neofs_verbs import delete_object, get_object
 from storage_object_info import StorageObjectInfo
+from test_control import poll
 from tombstone import verify_head_tombstone
 
 logger = logging.getLogger("NeoLogger")
 
 CLEANUP_TIMEOUT = 10
+DELETE_MAX_WORKERS = 8
 
 
 @allure.step("Delete Objects")
@@ -23,39 +25,82 @@ def delete_objects(
     """
     Deletes given storage objects.
 
+    Objects are deleted and their tombstones are verified concurrently; then we wait until
+    all objects are reported as removed. All failures are collected into a single error.
+
     Args:
         storage_objects: list of objects to delete
         shell: executor for cli command
     """
+    endpoint = cluster.default_rpc_endpoint
+    failures = []
+
+    def delete(storage_object: StorageObjectInfo) -> str:
+        tombstone = delete_object(
+            storage_object.wallet_file_path,
+            storage_object.cid,
+            storage_object.oid,
+            shell=shell,
+            endpoint=endpoint,
+        )
+        verify_head_tombstone(
+            wallet_path=storage_object.wallet_file_path,
+            cid=storage_object.cid,
+            oid_ts=tombstone,
+            oid=storage_object.oid,
+            shell=shell,
+            endpoint=endpoint,
+        )
+        return tombstone
 
+    deleted_objects = []
     with allure.step("Delete objects"):
-        for storage_object in storage_objects:
-            storage_object.tombstone = delete_object(
+        for task in fan_out(delete, storage_objects, max_workers=DELETE_MAX_WORKERS):
+            if task.ok:
+                task.item.tombstone = task.result
+                deleted_objects.append(task.item)
+            else:
+                failures.append(f"{task.item.cid}/{task.item.oid}: delete failed: {task.error}")
+
+    tick_epoch(shell, cluster)
+
+    def check_object_removed(storage_object: StorageObjectInfo) -> None:
+        try:
+            get_object(
                 storage_object.wallet_file_path,
                 storage_object.cid,
                 storage_object.oid,
                 shell=shell,
-                endpoint=cluster.default_rpc_endpoint,
-            )
-            verify_head_tombstone(
-                wallet_path=storage_object.wallet_file_path,
-                cid=storage_object.cid,
-                oid_ts=storage_object.tombstone,
-                oid=storage_object.oid,
-                shell=shell,
-                endpoint=cluster.default_rpc_endpoint,
+                endpoint=endpoint,
             )
+        except Exception as err:
+            if re.search(OBJECT_ALREADY_REMOVED, str(err)):
+                return
+            raise AssertionError(f"expected {OBJECT_ALREADY_REMOVED}, got: {err}") from err
+        raise AssertionError(f"object is still available, expected {OBJECT_ALREADY_REMOVED}")
 
-    tick_epoch(shell, cluster)
-    sleep(CLEANUP_TIMEOUT)
+    pending_objects = deleted_objects
+    not_removed_errors = []
+
+    def check_objects_removed() -> None:
+        nonlocal pending_objects, not_removed_errors
+        tasks = list(fan_out(check_object_removed, pending_objects, max_workers=DELETE_MAX_WORKERS))
+        pending_objects = [task.item for task in tasks if not task.ok]
+        not_removed_errors = [(task.item, task.error) for task in tasks if not task.ok]
+        if pending_objects:
+            raise AssertionError(f"{len(pending_objects)} objects have not been removed yet")
 
     with allure.step("Get objects and check errors"):
-        for storage_object in storage_objects:
-            with pytest.raises(Exception, match=OBJECT_ALREADY_REMOVED):
-                get_object(
-                    storage_object.wallet_file_path,
-                    storage_object.cid,
-                    storage_object.oid,
-                    shell=shell,
-                    endpoint=cluster.default_rpc_endpoint,
-                )
+        try:
+            poll(check_objects_removed, timeout=CLEANUP_TIMEOUT)
+        except AssertionError:
+            failures += [
+                f"{storage_object.cid}/{storage_object.oid}: {error}"
+                for storage_object, error in not_removed_errors
+            ]
+
+    if failures:
+        raise AssertionError(
+            f"Failed to delete {len(failures)} of {len(storage_objects)} objects:\n"
+            + "\n".join(failures)
+        )
@@ -232,6 +232,7 @@ class TestStorageGroup(ClusterTestBase):
             bearer=bearer_file,
         )
 
+    @pytest.mark.epoch_tick
     @allure.title("Test to check Storage Group lifetime")
     def test_storagegroup_lifetime(self, object_size):
         cid = create_container(
@@ -3,24 +3,31 @@ import os
 import re
 import shutil
 import uuid
+from contextlib import ExitStack
 from datetime import datetime
+from typing import Optional
 
 import allure
 import pytest
 import yaml
 from binary_version_helper import get_local_binaries_versions, get_remote_binaries_versions
 from cluster import Cluster
+from cluster_lock import ClusterLock
 from common import (
     ASSETS_DIR,
+    CLUSTER_LOCK_FILE,
     COMPLEX_OBJECT_CHUNKS_COUNT,
     COMPLEX_OBJECT_TAIL_SIZE,
-    FREE_STORAGE,
     HOSTING_CONFIG_FILE,
     SIMPLE_OBJECT_SIZE,
     STORAGE_NODE_SERVICE_NAME_REGEX,
-    WALLET_PASS,
+    WALLET_POOL_SIZE,
+    XDIST_WORKER,
+    XDIST_WORKERS_DIR,
+    XDIST_WORKERS_FINISH_TIMEOUT,
 )
 from env_properties import save_env_properties
+from file_helper import PayloadPool
 from k6 import LoadParams
 from load import get_services_endpoints, prepare_k6_instances
 from load_params import (
@@ -35,15 +42,21 @@ from load_params import (
 from neofs_testlib.hosting import Hosting
 from neofs_testlib.reporter import AllureHandler, get_reporter
 from neofs_testlib.shell import LocalShell, Shell
-from neofs_testlib.utils.wallet import init_wallet
-from payment_neogo import deposit_gas, transfer_gas
 from python_keywords.neofs_verbs import get_netmap_netinfo
 from python_keywords.node_management import storage_node_healthcheck
+from test_control import get_poll_summary, poll
 
 from helpers.wallet import WalletFactory
 
 logger = logging.getLogger("NeoLogger")
 
+# Tests with these marks stop nodes, change network map or tick epochs, so they can't run in
+# parallel with others
+CLUSTER_MUTATING_MARKS = ("node_mgmt", "failover", "load", "epoch_tick")
+
+# Cluster lock held by this worker for the module that is being executed
+_module_lock: Optional[ExitStack] = None
+
 
 def pytest_collection_modifyitems(items):
     # Make network tests last based on @pytest.mark.node_mgmt
@@ -54,6 +67,42 @@ def pytest_collection_modifyitems(items):
     items.sort(key=lambda item: priority(item))
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]):
+    # When tests are running in parallel (pytest-xdist), tests that mutate the cluster are
+    # executed exclusively. Module and class fixtures (e.g. objects that expire in a few epochs)
+    # live between tests, so the lock is held from setup of the first test of a module until
+    # teardown of its last test, and modules with any mutating test are executed exclusively
+    global _module_lock
+    if not XDIST_WORKER:
+        yield
+        return
+
+    if _module_lock is None:
+        cluster_lock = ClusterLock(CLUSTER_LOCK_FILE)
+        is_mutating_module = any(
+            test.get_closest_marker(mark)
+            for test in item.session.items
+            if test.module is item.module
+            for mark in CLUSTER_MUTATING_MARKS
+        )
+        _module_lock = ExitStack()
+        _module_lock.enter_context(
+            cluster_lock.exclusive() if is_mutating_module else cluster_lock.shared()
+        )
+    try:
+        yield
+    finally:
+        if nextitem is None or nextitem.module is not item.module:
+            _module_lock.close()
+            _module_lock = None
+
+
+def is_first_worker() -> bool:
+    # Checks of the whole cluster are done once per run, by the first pytest-xdist worker
+    return XDIST_WORKER in ("", "gw0")
+
+
 @pytest.fixture(scope="session")
 def configure_testlib():
     get_reporter().register_handler(AllureHandler())
@@ -109,9 +158,14 @@ def complex_object_size(max_object_size: int) -> int:
     return max_object_size * int(COMPLEX_OBJECT_CHUNKS_COUNT) + int(COMPLEX_OBJECT_TAIL_SIZE)
 
 
+@pytest.fixture(scope="session")
+def payload_pool(temp_directory: str) -> PayloadPool:
+    return PayloadPool(os.path.join(temp_directory, "payload_pool"))
+
+
 @pytest.fixture(scope="session")
 def wallet_factory(temp_directory: str, client_shell: Shell, cluster: Cluster) -> WalletFactory:
-    return WalletFactory(temp_directory, client_shell, cluster)
+    return WalletFactory(temp_directory, client_shell, cluster, pool_size=WALLET_POOL_SIZE)
 
 
 @pytest.fixture(scope="session")
@@ -146,11 +200,31 @@ def temp_directory():
         shutil.rmtree(full_path)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def register_worker():
+    if not XDIST_WORKER:
+        yield
+        return
+
+    os.makedirs(XDIST_WORKERS_DIR, exist_ok=True)
+    worker_file_path = os.path.join(XDIST_WORKERS_DIR, XDIST_WORKER)
+    with open(worker_file_path, "w") as worker_file:
+        worker_file.write(str(os.getpid()))
+    yield
+    os.remove(worker_file_path)
+
+
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Collect logs")
-def collect_logs(temp_directory, hosting: Hosting):
+def collect_logs(temp_directory, hosting: Hosting, register_worker):
+    if not is_first_worker():
+        yield
+        return
+
     start_time = datetime.utcnow()
     yield
+    if XDIST_WORKER:
+        wait_for_other_workers()
     end_time = datetime.utcnow()
 
     # Dump logs to temp directory (because they might be too large to keep in RAM)
@@ -160,9 +234,26 @@ def collect_logs(temp_directory, hosting: Hosting):
     check_logs(logs_dir)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def log_poll_statistics():
+    yield
+
+    summary = sorted(get_poll_summary().values(), key=lambda stats: stats.duration, reverse=True)
+    lines = [
+        f"{stats.name}: attempts={stats.attempts}, waited={stats.total_wait:.1f}s, "
+        f"total={stats.duration:.1f}s, all succeeded={stats.succeeded}"
+        for stats in summary
+    ]
+    logger.info("Polling statistics:\n" + "\n".join(lines))
+    allure.attach("\n".join(lines), "Polling statistics", allure.attachment_type.TEXT)
+
+
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Run health check for all storage nodes")
 def run_health_check(collect_logs, cluster: Cluster):
+    if not is_first_worker():
+        return
+
     failed_nodes = []
     for node in cluster.storage_nodes:
         health_check = storage_node_healthcheck(node)
@@ -216,7 +307,10 @@ def background_grpc_load(client_shell: Shell, hosting: Hosting):
     yield
     with allure.step("Stop background load"):
         for k6_load_instance in k6_load_instances:
-            k6_load_instance.stop()
+            try:
+                k6_load_instance.stop()
+            finally:
+                k6_load_instance.clear_metrics()
     with allure.step("Verify background load data"):
         verify_params = LoadParams(
             endpoint=endpoints,
@@ -234,35 +328,18 @@ def background_grpc_load(client_shell: Shell, hosting: Hosting):
         )
         with allure.step("Run verify background load data"):
             for k6_verify_instance in k6_verify_instances:
-                k6_verify_instance.start()
-                k6_verify_instance.wait_until_finished(BACKGROUND_LOAD_MAX_TIME)
+                try:
+                    k6_verify_instance.start()
+                    k6_verify_instance.wait_until_finished(BACKGROUND_LOAD_MAX_TIME)
+                finally:
+                    k6_verify_instance.clear_metrics()
 
 
 @pytest.fixture(scope="session")
 @allure.title("Prepare wallet and deposit")
-def default_wallet(client_shell: Shell, temp_directory: str, cluster: Cluster):
-    wallet_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{str(uuid.uuid4())}.json")
-    init_wallet(wallet_path, WALLET_PASS)
+def default_wallet(wallet_factory: WalletFactory) -> str:
+    wallet_path = wallet_factory.create_wallet().path
     allure.attach.file(wallet_path, os.path.basename(wallet_path), allure.attachment_type.JSON)
-
-    if not FREE_STORAGE:
-        main_chain = cluster.main_chain_nodes[0]
-        deposit = 30
-        transfer_gas(
-            shell=client_shell,
-            amount=deposit + 1,
-            main_chain=main_chain,
-            wallet_to_path=wallet_path,
-            wallet_to_password=WALLET_PASS,
-        )
-        deposit_gas(
-            shell=client_shell,
-            main_chain=main_chain,
-            amount=deposit,
-            wallet_from_path=wallet_path,
-            wallet_from_password=WALLET_PASS,
-        )
-
     return wallet_path
 
 
@@ -288,6 +365,33 @@ def check_logs(logs_dir: str):
         raise pytest.fail(f"System logs {', '.join(logs_with_problem)} contain critical errors")
 
 
+@allure.step("Wait for other pytest-xdist workers to finish")
+def wait_for_other_workers() -> None:
+    def check_workers_finished() -> None:
+        running_workers = [
+            worker
+            for worker in os.listdir(XDIST_WORKERS_DIR)
+            if worker != XDIST_WORKER and _is_worker_running(worker)
+        ]
+        if running_workers:
+            raise AssertionError(f"Workers {running_workers} are still running")
+
+    try:
+        poll(check_workers_finished, timeout=XDIST_WORKERS_FINISH_TIMEOUT, max_interval=10)
+    except AssertionError as err:
+        logger.warning(f"Logs are collected before all workers finished: {err}")
+
+
+def _is_worker_running(worker: str) -> bool:
+    try:
+        with open(os.path.join(XDIST_WORKERS_DIR, worker), "r") as worker_file:
+            os.kill(int(worker_file.read()), 0)
+    except (OSError, ValueError):
+        # Worker has finished or died without removing its file
+        return False
+    return True
+
+
 def dump_logs(hosting: Hosting, logs_dir: str, since: datetime, until: datetime) -> None:
     # Dump logs to temp directory (because they might be too large to keep in RAM)
     os.makedirs(logs_dir)
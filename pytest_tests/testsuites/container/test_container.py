@@ -20,6 +20,7 @@ from steps.cluster_test_base import ClusterTestBase
 @pytest.mark.container
 @pytest.mark.sanity
 @pytest.mark.container
+@pytest.mark.epoch_tick
 class TestContainer(ClusterTestBase):
     @pytest.mark.parametrize("name", ["", "test-container"], ids=["No name", "Set particular name"])
     @pytest.mark.smoke
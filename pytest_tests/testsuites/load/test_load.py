@@ -1,5 +1,6 @@
 import allure
 import pytest
+from binary_version_helper import get_remote_binaries_versions
 from cluster_test_base import ClusterTestBase
 from common import (
     HTTP_GATE_SERVICE_NAME_REGEX,
@@ -8,6 +9,7 @@ from common import (
 )
 from k6 import LoadParams
 from load import (
+    check_load_baseline,
     clear_cache_and_data,
     get_services_endpoints,
     init_s3_client,
@@ -61,6 +63,10 @@ class TestLoad(ClusterTestBase):
                 container_placement_policy=CONTAINER_PLACEMENT_POLICY,
             )
 
+    @pytest.fixture(scope="session")
+    def binary_versions(self, hosting: Hosting) -> dict[str, str]:
+        return get_remote_binaries_versions(hosting)
+
     @pytest.mark.parametrize("obj_size, out_file", list(zip(OBJ_SIZE, OUT_FILE)))
     @pytest.mark.parametrize("writers, readers, deleters", list(zip(WRITERS, READERS, DELETERS)))
     @pytest.mark.parametrize("load_time", LOAD_TIME)
@@ -85,6 +91,7 @@ class TestLoad(ClusterTestBase):
         load_nodes_count,
         containers_count,
         hosting: Hosting,
+        binary_versions: dict[str, str],
     ):
         allure.dynamic.title(
             f"Load test - node_count = {node_count}, "
@@ -120,4 +127,18 @@ class TestLoad(ClusterTestBase):
             load_params=load_params,
         )
         with allure.step("Run load"):
-            multi_node_k6_run(k6_load_instances)
+            load_results = multi_node_k6_run(k6_load_instances)
+        check_load_baseline(
+            load_results,
+            params={
+                "load_type": load_type,
+                "obj_size": obj_size,
+                "writers": writers,
+                "readers": readers,
+                "deleters": deleters,
+                "containers_count": containers_count,
+                "storage_nodes": node_count,
+                "load_nodes": load_nodes_count,
+            },
+            versions=binary_versions,
+        )
@@ -470,10 +470,10 @@ class TestNodeManagement(ClusterTestBase):
     ) -> None:
         nodes = self.cluster.storage_nodes
         for _ in range(2):
-            copies = get_simple_object_copies(wallet, cid, oid, self.shell, nodes)
+            copies = get_simple_object_copies(wallet, cid, oid, self.shell, nodes, expected_copies)
             if copies == expected_copies:
                 break
-            tick_epoch(self.shell, self.cluster)
+            tick_epoch(self.shell, self.cluster, wait=True)
             sleep(parse_time(NEOFS_CONTRACT_CACHE_TIMEOUT))
         else:
             raise AssertionError(f"There are no {expected_copies} copies during time")
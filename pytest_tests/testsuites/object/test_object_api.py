@@ -6,7 +6,7 @@ import allure
 import pytest
 from cluster import Cluster
 from complex_object_actions import get_complex_object_split_ranges
-from file_helper import generate_file, get_file_content, get_file_hash
+from file_helper import PayloadPool, generate_file_and_hash, get_file_content, get_file_hash
 from grpc_responses import (
     INVALID_LENGTH_SPECIFIER,
     INVALID_OFFSET_SPECIFIER,
@@ -96,14 +96,17 @@ def generate_ranges(
     scope="module",
 )
 def storage_objects(
-    default_wallet: str, client_shell: Shell, cluster: Cluster, request: FixtureRequest
+    default_wallet: str,
+    client_shell: Shell,
+    cluster: Cluster,
+    payload_pool: PayloadPool,
+    request: FixtureRequest,
 ) -> list[StorageObjectInfo]:
     wallet = default_wallet
     # Separate containers for complex/simple objects to avoid side-effects
     cid = create_container(wallet, shell=client_shell, endpoint=cluster.default_rpc_endpoint)
 
-    file_path = generate_file(request.param)
-    file_hash = get_file_hash(file_path)
+    file_path, file_hash = payload_pool.get(request.param)
 
     storage_objects = []
 
@@ -136,6 +139,7 @@ def storage_objects(
 
 @pytest.mark.sanity
 @pytest.mark.grpc_api
+@pytest.mark.epoch_tick
 class TestObjectApi(ClusterTestBase):
     @allure.title("Validate object storage policy by native API")
     def test_object_storage_policies(
@@ -157,6 +161,7 @@ class TestObjectApi(ClusterTestBase):
                         storage_object.oid,
                         shell=self.shell,
                         nodes=self.cluster.storage_nodes,
+                        expected_copies=2,
                     )
                 else:
                     copies = get_complex_object_copies(
@@ -165,6 +170,7 @@ class TestObjectApi(ClusterTestBase):
                         storage_object.oid,
                         shell=self.shell,
                         nodes=self.cluster.storage_nodes,
+                        expected_copies=2,
                     )
                 assert copies == 2, "Expected 2 copies"
 
@@ -282,8 +288,7 @@ class TestObjectApi(ClusterTestBase):
         cid = create_container(wallet, self.shell, self.cluster.default_rpc_endpoint)
 
         with allure.step("Upload file"):
-            file_path = generate_file(object_size)
-            file_hash = get_file_hash(file_path)
+            file_path, file_hash = generate_file_and_hash(object_size)
 
             storage_object = StorageObjectInfo(
                 cid=cid,
@@ -63,17 +63,13 @@ def storage_objects(
     cluster: Cluster,
 ) -> list[StorageObjectInfo]:
     epoch = get_epoch(client_shell, cluster)
-    storage_objects: list[StorageObjectInfo] = []
-    for node in cluster.storage_nodes:
-        storage_objects.append(
-            user_container.generate_object(
-                request.param,
-                epoch + 3,
-                bearer_token=bearer_token_file_all_allow,
-                endpoint=node.get_rpc_endpoint(),
-            )
-        )
-    return storage_objects
+    # One object is put through every storage node
+    return user_container.generate_objects(
+        len(cluster.storage_nodes),
+        request.param,
+        expire_at=epoch + 3,
+        bearer_token=bearer_token_file_all_allow,
+    )
 
 
 @pytest.mark.smoke
@@ -3,7 +3,7 @@ import logging
 import allure
 import pytest
 from epoch import get_epoch, tick_epoch
-from file_helper import generate_file, get_file_hash
+from file_helper import generate_file_and_hash, get_file_hash
 from grpc_responses import OBJECT_NOT_FOUND
 from pytest import FixtureRequest
 from python_keywords.container import create_container
@@ -17,6 +17,7 @@ logger = logging.getLogger("NeoLogger")
 
 @pytest.mark.sanity
 @pytest.mark.grpc_api
+@pytest.mark.epoch_tick
 class TestObjectApiLifetime(ClusterTestBase):
     @allure.title("Test object life time")
     @pytest.mark.parametrize(
@@ -37,8 +38,7 @@ class TestObjectApiLifetime(ClusterTestBase):
         endpoint = self.cluster.default_rpc_endpoint
         cid = create_container(wallet, self.shell, endpoint)
 
-        file_path = generate_file(object_size)
-        file_hash = get_file_hash(file_path)
+        file_path, file_hash = generate_file_and_hash(object_size)
         epoch = get_epoch(self.shell, self.cluster)
 
         oid = put_object_to_random_node(
@@ -49,7 +49,7 @@ class TestObjectApiLifetime(ClusterTestBase):
 
         with allure.step("Tick two epochs"):
             for _ in range(2):
-                self.tick_epoch()
+                self.tick_epoch(wait=True)
 
         # Wait for GC, because object with expiration is counted as alive until GC removes it
         wait_for_gc_pass_on_storage_nodes()
@@ -119,6 +119,7 @@ def locked_storage_object(
 
 @pytest.mark.sanity
 @pytest.mark.grpc_object_lock
+@pytest.mark.epoch_tick
 class TestObjectLockWithGrpc(ClusterTestBase):
     @pytest.fixture()
     def new_locked_storage_object(
@@ -356,13 +357,11 @@ class TestObjectLockWithGrpc(ClusterTestBase):
         )
 
         current_epoch = ensure_fresh_epoch(self.shell, self.cluster)
-        storage_objects: list[StorageObjectInfo] = []
 
         with allure.step("Generate three objects"):
-            for _ in range(3):
-                storage_objects.append(
-                    user_container.generate_object(object_size, expire_at=current_epoch + 5)
-                )
+            storage_objects = user_container.generate_objects(
+                3, object_size, expire_at=current_epoch + 5
+            )
 
         lock_object(
             storage_objects[0].wallet_file_path,
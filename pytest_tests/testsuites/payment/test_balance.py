@@ -4,8 +4,9 @@ import os
 import allure
 import pytest
 import yaml
+from cli_helpers import get_neofs_cli
 from cluster_test_base import ClusterTestBase
-from common import FREE_STORAGE, NEOFS_CLI_EXEC, WALLET_CONFIG
+from common import FREE_STORAGE, WALLET_CONFIG
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import CommandResult, Shell
 from wallet import WalletFactory, WalletFile
@@ -28,7 +29,7 @@ class TestBalanceAccounting(ClusterTestBase):
 
     @pytest.fixture(scope="class")
     def cli(self, client_shell: Shell) -> NeofsCli:
-        return NeofsCli(client_shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+        return get_neofs_cli(client_shell)
 
     @allure.step("Check deposit amount")
     def check_amount(self, result: CommandResult) -> None:
@@ -95,7 +96,7 @@ class TestBalanceAccounting(ClusterTestBase):
         )
         logger.info(f"Config with API endpoint: {config_file}")
 
-        cli = NeofsCli(client_shell, NEOFS_CLI_EXEC, config_file=config_file)
+        cli = get_neofs_cli(client_shell, config_file)
         result = cli.accounting.balance()
 
         self.check_amount(result)
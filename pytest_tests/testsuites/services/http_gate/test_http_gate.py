@@ -11,11 +11,12 @@ from python_keywords.http_gate import (
     get_object_and_verify_hashes,
     get_object_by_attr_and_verify_hashes,
     get_via_http_curl,
-    get_via_http_gate,
+    get_via_http_gate_many,
     get_via_zip_http_gate,
     try_to_get_object_and_expect_error,
     upload_via_http_gate,
     upload_via_http_gate_curl,
+    upload_via_http_gate_many,
 )
 from python_keywords.neofs_verbs import put_object_to_random_node
 from utility import wait_for_gc_pass_on_storage_nodes
@@ -196,6 +197,7 @@ class TestHttpGate(ClusterTestBase):
             endpoint=self.cluster.default_http_gate_endpoint,
         )
 
+    @pytest.mark.epoch_tick
     @allure.title("Test Expiration-Epoch in HTTP header")
     def test_expiration_epoch_in_http(self, simple_object_size):
         endpoint = self.cluster.default_rpc_endpoint
@@ -209,26 +211,24 @@ class TestHttpGate(ClusterTestBase):
             basic_acl=PUBLIC_ACL,
         )
         file_path = generate_file(simple_object_size)
-        oids = []
 
         curr_epoch = get_epoch(self.shell, self.cluster)
         epochs = (curr_epoch, curr_epoch + 1, curr_epoch + 2, curr_epoch + 100)
 
-        for epoch in epochs:
-            headers = {"X-Attribute-Neofs-Expiration-Epoch": str(epoch)}
-
-            with allure.step("Put objects using HTTP with attribute Expiration-Epoch"):
-                oids.append(
-                    upload_via_http_gate(
-                        cid=cid, path=file_path, headers=headers, endpoint=http_endpoint
-                    )
-                )
+        with allure.step("Put objects using HTTP with attribute Expiration-Epoch"):
+            oids = upload_via_http_gate_many(
+                cid=cid,
+                uploads=[
+                    (file_path, {"X-Attribute-Neofs-Expiration-Epoch": str(epoch)})
+                    for epoch in epochs
+                ],
+                endpoint=http_endpoint,
+            )
 
         assert len(oids) == len(epochs), "Expected all objects have been put successfully"
 
         with allure.step("All objects can be get"):
-            for oid in oids:
-                get_via_http_gate(cid=cid, oid=oid, endpoint=http_endpoint)
+            get_via_http_gate_many(cid=cid, oids=oids, endpoint=http_endpoint)
 
         for expired_objects, not_expired_objects in [(oids[:1], oids[1:]), (oids[:2], oids[2:])]:
             self.tick_epoch()
@@ -245,8 +245,7 @@ class TestHttpGate(ClusterTestBase):
                 )
 
             with allure.step("Other objects can be get"):
-                for oid in not_expired_objects:
-                    get_via_http_gate(cid=cid, oid=oid, endpoint=http_endpoint)
+                get_via_http_gate_many(cid=cid, oids=not_expired_objects, endpoint=http_endpoint)
 
     @allure.title("Test Zip in HTTP header")
     def test_zip_in_http(self, complex_object_size, simple_object_size):
@@ -10,7 +10,7 @@ from container import (
     wait_for_container_deletion,
 )
 from epoch import tick_epoch
-from file_helper import generate_file
+from file_helper import PayloadPool, generate_file
 from http_gate import (
     attr_into_str_header_curl,
     get_object_by_attr_and_verify_hashes,
@@ -54,7 +54,9 @@ class Test_http_headers(ClusterTestBase):
         ids=["simple object", "complex object"],
         scope="class",
     )
-    def storage_objects_with_attributes(self, request: FixtureRequest) -> list[StorageObjectInfo]:
+    def storage_objects_with_attributes(
+        self, payload_pool: PayloadPool, request: FixtureRequest
+    ) -> list[StorageObjectInfo]:
         storage_objects = []
         wallet = self.wallet
         cid = create_container(
@@ -64,7 +66,7 @@ class Test_http_headers(ClusterTestBase):
             rule=self.PLACEMENT_RULE,
             basic_acl=PUBLIC_ACL,
         )
-        file_path = generate_file(request.param)
+        file_path, _ = payload_pool.get(request.param)
         for attributes in self.OBJECT_ATTRIBUTES:
             storage_object_id = upload_via_http_gate_curl(
                 cid=cid,
@@ -166,6 +168,7 @@ class Test_http_headers(ClusterTestBase):
                 endpoint=self.cluster.default_http_gate_endpoint,
             )
 
+    @pytest.mark.epoch_tick
     @allure.title("[Negative] Try to put object and get right after container is deleted")
     def test_negative_put_and_get_object3(
         self, storage_objects_with_attributes: list[StorageObjectInfo]
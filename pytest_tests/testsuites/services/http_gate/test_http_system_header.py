@@ -33,6 +33,7 @@ NEOFS_EXIPRATION_RFC3339 = "Neofs-Expiration-RFC3339"
 
 @pytest.mark.sanity
 @pytest.mark.http_gate
+@pytest.mark.epoch_tick
 class Test_http_system_header(ClusterTestBase):
     PLACEMENT_RULE = "REP 2 IN X CBF 1 SELECT 2 FROM * AS X"
 
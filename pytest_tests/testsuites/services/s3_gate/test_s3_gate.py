@@ -9,10 +9,10 @@ from common import ASSETS_DIR
 from epoch import tick_epoch
 from file_helper import (
     generate_file,
+    generate_file_and_hash,
     generate_file_with_content,
     get_file_content,
     get_file_hash,
-    split_file,
 )
 from s3_helper import (
     check_objects_in_bucket,
@@ -38,6 +38,7 @@ def pytest_generate_tests(metafunc):
 @pytest.mark.s3_gate
 @pytest.mark.s3_gate_base
 class TestS3Gate(TestS3GateBase):
+    @pytest.mark.epoch_tick
     @allure.title("Test S3 Bucket API")
     def test_s3_buckets(self, simple_object_size):
         """
@@ -162,8 +163,8 @@ class TestS3Gate(TestS3GateBase):
                 objects
             ), f"Expected all objects saved. Got {objects}"
             for obj_key in objects:
-                got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, obj_key)
-                assert get_file_hash(got_object) == get_file_hash(
+                got_object = s3_gate_object.get_object_s3_digest(self.s3_client, bucket, obj_key)
+                assert got_object.hash == get_file_hash(
                     key_to_path.get(obj_key)
                 ), "Expected hashes are the same"
 
@@ -256,12 +257,9 @@ class TestS3Gate(TestS3GateBase):
         Upload part/List parts/Complete multipart upload).
         """
         parts_count = 3
-        file_name_large = generate_file(
-            simple_object_size * 1024 * 6 * parts_count
-        )  # 5Mb - min part
+        part_size = simple_object_size * 1024 * 6  # 5Mb - min part
+        file_name_large, file_hash = generate_file_and_hash(part_size * parts_count)
         object_key = self.object_key_from_file_path(file_name_large)
-        part_files = split_file(file_name_large, parts_count)
-        parts = []
 
         uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
         assert not uploads, f"Expected there is no uploads in bucket {bucket}"
@@ -287,28 +285,28 @@ class TestS3Gate(TestS3GateBase):
             upload_id = s3_gate_object.create_multipart_upload_s3(
                 self.s3_client, bucket, object_key
             )
-            for part_id, file_path in enumerate(part_files, start=1):
-                etag = s3_gate_object.upload_part_s3(
-                    self.s3_client, bucket, object_key, upload_id, part_id, file_path
-                )
-                parts.append((part_id, etag))
+            parts = s3_gate_object.upload_file_parts_s3(
+                self.s3_client, bucket, object_key, upload_id, file_name_large, part_size
+            )
 
         with allure.step("Check all parts are visible in bucket"):
             got_parts = s3_gate_object.list_parts_s3(self.s3_client, bucket, object_key, upload_id)
-            assert len(got_parts) == len(
-                part_files
-            ), f"Expected {parts_count} parts, got\n{got_parts}"
+            assert len(got_parts) == parts_count, f"Expected {parts_count} parts, got\n{got_parts}"
 
         s3_gate_object.complete_multipart_upload_s3(
-            self.s3_client, bucket, object_key, upload_id, parts
+            self.s3_client,
+            bucket,
+            object_key,
+            upload_id,
+            [(part.part_num, part.etag) for part in parts],
         )
 
         uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
         assert not uploads, f"Expected there is no uploads in bucket {bucket}"
 
         with allure.step("Check we can get whole object from bucket"):
-            got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, object_key)
-            assert get_file_hash(got_object) == get_file_hash(file_name_large)
+            got_object = s3_gate_object.get_object_s3_digest(self.s3_client, bucket, object_key)
+            assert got_object.hash == file_hash
 
         self.check_object_attributes(bucket, object_key, parts_count)
 
@@ -439,9 +437,11 @@ class TestS3Gate(TestS3GateBase):
         check_objects_in_bucket(self.s3_client, bucket, bucket_objects)
 
         with allure.step("Check copied object has the same content"):
-            got_copied_file = s3_gate_object.get_object_s3(self.s3_client, bucket, copy_obj_path)
-            assert get_file_hash(file_path_simple) == get_file_hash(
-                got_copied_file
+            got_copied_file = s3_gate_object.get_object_s3_digest(
+                self.s3_client, bucket, copy_obj_path
+            )
+            assert (
+                get_file_hash(file_path_simple) == got_copied_file.hash
             ), "Hashes must be the same"
 
         with allure.step("Delete one object from bucket"):
@@ -1,6 +1,6 @@
 import allure
 import pytest
-from file_helper import generate_file, get_file_hash, split_file
+from file_helper import generate_file, generate_file_and_hash, split_file
 from s3_helper import check_objects_in_bucket, object_key_from_file_path, set_bucket_versioning
 
 from steps import s3_gate_bucket, s3_gate_object
@@ -23,44 +23,49 @@ class TestS3GateMultipart(TestS3GateBase):
         bucket = s3_gate_bucket.create_bucket_s3(self.s3_client)
         set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
         parts_count = 5
-        file_name_large = generate_file(PART_SIZE * parts_count)  # 5Mb - min part
+        file_name_large, file_hash = generate_file_and_hash(
+            PART_SIZE * parts_count
+        )  # 5Mb - min part
         object_key = object_key_from_file_path(file_name_large)
-        part_files = split_file(file_name_large, parts_count)
-        parts = []
 
         with allure.step("Upload first part"):
             upload_id = s3_gate_object.create_multipart_upload_s3(
                 self.s3_client, bucket, object_key
             )
             uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
-            etag = s3_gate_object.upload_part_s3(
-                self.s3_client, bucket, object_key, upload_id, 1, part_files[0]
+            parts = s3_gate_object.upload_file_parts_s3(
+                self.s3_client, bucket, object_key, upload_id, file_name_large, PART_SIZE, [1]
             )
-            parts.append((1, etag))
             got_parts = s3_gate_object.list_parts_s3(self.s3_client, bucket, object_key, upload_id)
             assert len(got_parts) == 1, f"Expected {1} parts, got\n{got_parts}"
 
         with allure.step("Upload last parts"):
-            for part_id, file_path in enumerate(part_files[1:], start=2):
-                etag = s3_gate_object.upload_part_s3(
-                    self.s3_client, bucket, object_key, upload_id, part_id, file_path
-                )
-                parts.append((part_id, etag))
+            parts += s3_gate_object.upload_file_parts_s3(
+                self.s3_client,
+                bucket,
+                object_key,
+                upload_id,
+                file_name_large,
+                PART_SIZE,
+                list(range(2, parts_count + 1)),
+            )
             got_parts = s3_gate_object.list_parts_s3(self.s3_client, bucket, object_key, upload_id)
             s3_gate_object.complete_multipart_upload_s3(
-                self.s3_client, bucket, object_key, upload_id, parts
+                self.s3_client,
+                bucket,
+                object_key,
+                upload_id,
+                [(part.part_num, part.etag) for part in parts],
             )
-            assert len(got_parts) == len(
-                part_files
-            ), f"Expected {parts_count} parts, got\n{got_parts}"
+            assert len(got_parts) == parts_count, f"Expected {parts_count} parts, got\n{got_parts}"
 
         with allure.step("Check upload list is empty"):
             uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
             assert not uploads, f"Expected there is no uploads in bucket {bucket}"
 
         with allure.step("Check we can get whole object from bucket"):
-            got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, object_key)
-            assert get_file_hash(got_object) == get_file_hash(file_name_large)
+            got_object = s3_gate_object.get_object_s3_digest(self.s3_client, bucket, object_key)
+            assert got_object.hash == file_hash
 
     @allure.title("Test S3 Multipart abord")
     def test_s3_abort_multipart(self):
@@ -69,18 +74,15 @@ class TestS3GateMultipart(TestS3GateBase):
         parts_count = 5
         file_name_large = generate_file(PART_SIZE * parts_count)  # 5Mb - min part
         object_key = object_key_from_file_path(file_name_large)
-        part_files = split_file(file_name_large, parts_count)
-        parts = []
 
         with allure.step("Upload first part"):
             upload_id = s3_gate_object.create_multipart_upload_s3(
                 self.s3_client, bucket, object_key
             )
             uploads = s3_gate_object.list_multipart_uploads_s3(self.s3_client, bucket)
-            etag = s3_gate_object.upload_part_s3(
-                self.s3_client, bucket, object_key, upload_id, 1, part_files[0]
+            s3_gate_object.upload_file_parts_s3(
+                self.s3_client, bucket, object_key, upload_id, file_name_large, PART_SIZE, [1]
             )
-            parts.append((1, etag))
             got_parts = s3_gate_object.list_parts_s3(self.s3_client, bucket, object_key, upload_id)
             assert len(got_parts) == 1, f"Expected {1} parts, got\n{got_parts}"
 
@@ -94,7 +96,9 @@ class TestS3GateMultipart(TestS3GateBase):
         bucket = s3_gate_bucket.create_bucket_s3(self.s3_client)
         set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
         parts_count = 3
-        file_name_large = generate_file(PART_SIZE * parts_count)  # 5Mb - min part
+        file_name_large, file_hash = generate_file_and_hash(
+            PART_SIZE * parts_count
+        )  # 5Mb - min part
         object_key = object_key_from_file_path(file_name_large)
         part_files = split_file(file_name_large, parts_count)
         parts = []
@@ -128,5 +132,5 @@ class TestS3GateMultipart(TestS3GateBase):
             ), f"Expected {parts_count} parts, got\n{got_parts}"
 
         with allure.step("Check we can get whole object from bucket"):
-            got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, object_key)
-            assert get_file_hash(got_object) == get_file_hash(file_name_large)
+            got_object = s3_gate_object.get_object_s3_digest(self.s3_client, bucket, object_key)
+            assert got_object.hash == file_hash
@@ -9,7 +9,13 @@ import pytest
 from aws_cli_client import AwsCliClient
 from common import ASSETS_DIR, FREE_STORAGE, WALLET_PASS
 from data_formatters import get_wallet_public_key
-from file_helper import concat_files, generate_file, generate_file_with_content, get_file_hash
+from file_helper import (
+    concat_files,
+    generate_file,
+    generate_file_and_hash,
+    generate_file_with_content,
+    get_file_hash,
+)
 from neofs_testlib.utils.wallet import init_wallet
 from python_keywords.payment_neogo import deposit_gas, transfer_gas
 from s3_helper import assert_object_lock_mode, check_objects_in_bucket, set_bucket_versioning
@@ -389,9 +395,8 @@ class TestS3GateObject(TestS3GateBase):
 
     @allure.title("Test S3: Get range")
     def test_s3_get_range(self, bucket, complex_object_size: int, simple_object_size: int):
-        file_path = generate_file(complex_object_size)
+        file_path, file_hash = generate_file_and_hash(complex_object_size)
         file_name = self.object_key_from_file_path(file_path)
-        file_hash = get_file_hash(file_path)
         set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
         with allure.step("Put several versions of object into bucket"):
             version_id_1 = s3_gate_object.put_object_s3(self.s3_client, bucket, file_path)
@@ -587,8 +592,7 @@ class TestS3GateObject(TestS3GateBase):
 
         set_bucket_versioning(self.s3_client, bucket, s3_gate_bucket.VersioningStatus.ENABLED)
 
-        file_path_3 = generate_file(complex_object_size)
-        file_hash = get_file_hash(file_path_3)
+        file_path_3, file_hash = generate_file_and_hash(complex_object_size)
         file_name_3 = self.object_key_from_file_path(file_path_3)
         object_3_metadata = {f"{uuid.uuid4()}": f"{uuid.uuid4()}"}
         tag_key_3 = "tag3"
@@ -905,8 +909,8 @@ class TestS3GateObject(TestS3GateBase):
 
         with allure.step("Check these are the same objects"):
             for obj_key in objects:
-                got_object = s3_gate_object.get_object_s3(self.s3_client, bucket, obj_key)
-                assert get_file_hash(got_object) == get_file_hash(
+                got_object = s3_gate_object.get_object_s3_digest(self.s3_client, bucket, obj_key)
+                assert got_object.hash == get_file_hash(
                     key_to_path.get(obj_key)
                 ), "Expected hashes are the same"
                 obj_head = s3_gate_object.head_object_s3(self.s3_client, bucket, obj_key)
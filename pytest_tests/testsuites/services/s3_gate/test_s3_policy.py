@@ -71,6 +71,7 @@ class TestS3GatePolicy(TestS3GateBase):
                 oid=version_id_1,
                 shell=self.shell,
                 nodes=self.cluster.storage_nodes,
+                expected_copies=1,
             )
             assert copies_1 == 1
             cid_2 = search_container_by_name(
@@ -82,6 +83,7 @@ class TestS3GatePolicy(TestS3GateBase):
                 oid=version_id_2,
                 shell=self.shell,
                 nodes=self.cluster.storage_nodes,
+                expected_copies=3,
             )
             assert copies_2 == 3
 
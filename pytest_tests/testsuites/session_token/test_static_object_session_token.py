@@ -5,7 +5,7 @@ import pytest
 from cluster import Cluster
 from cluster_test_base import ClusterTestBase
 from epoch import ensure_fresh_epoch
-from file_helper import generate_file
+from file_helper import PayloadPool
 from grpc_responses import (
     EXPIRED_SESSION_TOKEN,
     MALFORMED_REQUEST,
@@ -72,10 +72,11 @@ def storage_objects(
     client_shell: Shell,
     storage_containers: list[str],
     cluster: Cluster,
+    payload_pool: PayloadPool,
     request: FixtureRequest,
 ) -> list[StorageObjectInfo]:
 
-    file_path = generate_file(request.param)
+    file_path, _ = payload_pool.get(request.param)
     storage_objects = []
 
     with allure.step("Put objects"):
@@ -150,6 +151,7 @@ def static_sessions(
 
 
 @pytest.mark.static_session
+@pytest.mark.epoch_tick
 class TestObjectStaticSession(ClusterTestBase):
     @allure.title("Validate static session with read operations")
     @pytest.mark.parametrize(
@@ -7,10 +7,10 @@ from io import StringIO
 import allure
 import pytest
 import yaml
+from cli_helpers import get_neofs_cli
 from cluster import Cluster, StorageNode
 from common import WALLET_CONFIG
 from configobj import ConfigObj
-from neofs_testlib.cli import NeofsCli
 
 SHARD_PREFIX = "NEOFS_STORAGE_SHARD_"
 BLOBSTOR_PREFIX = "_BLOBSTOR_"
@@ -136,7 +136,7 @@ class TestControlShard:
 
         cli_config = node.host.get_cli_config("neofs-cli")
 
-        cli = NeofsCli(node.host.get_shell(), cli_config.exec_path, WALLET_CONFIG)
+        cli = get_neofs_cli(node.host.get_shell(), WALLET_CONFIG, cli_config.exec_path)
         result = cli.shards.list(
             endpoint=control_endpoint,
             wallet=wallet_path,
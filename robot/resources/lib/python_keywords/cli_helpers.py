@@ -9,11 +9,15 @@ import subprocess
 import sys
 from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from textwrap import shorten
-from typing import Union
+from typing import Optional, Union
 
 import allure
 import pexpect
+from common import NEOFS_CLI_EXEC, WALLET_CONFIG
+from neofs_testlib.cli import NeofsCli
+from neofs_testlib.shell import Shell
 
 logger = logging.getLogger("NeoLogger")
 COLOR_GREEN = "\033[92m"
@@ -71,6 +75,27 @@ def _cmd_run(cmd: str, timeout: int = 30) -> str:
         raise
 
 
+@lru_cache(maxsize=None)
+def get_neofs_cli(
+    shell: Shell, config_file: Optional[str] = WALLET_CONFIG, exec_path: str = NEOFS_CLI_EXEC
+) -> NeofsCli:
+    """
+    Returns neofs-cli wrapper bound to the given shell and config file.
+
+    Wrappers are created once per (shell, config file, executable) and shared by all keywords,
+    so this is the single place where the way neofs-cli verbs are executed can be changed.
+
+    Args:
+        shell: shell to execute neofs-cli commands in
+        config_file: path to neofs-cli config file (usually contains wallet password)
+        exec_path: path to neofs-cli executable
+
+    Returns:
+        NeofsCli instance.
+    """
+    return NeofsCli(shell, exec_path, config_file)
+
+
 def _run_with_passwd(cmd: str) -> str:
     child = pexpect.spawn(cmd)
     child.delaybeforesend = 1
@@ -17,12 +17,130 @@ import allure
 import neofs_verbs
 from cluster import Cluster, StorageNode
 from common import WALLET_CONFIG
+from complex_object_layout import ComplexObjectLayout, get_layout
 from neofs_testlib.shell import Shell
 from neofs_verbs import head_object
+from parallel import fan_out
 from storage_object import StorageObjectInfo
 
 logger = logging.getLogger("NeoLogger")
 
+# Maximum time (in seconds) we wait for a raw HEAD response from a single node
+NODE_PROBE_TIMEOUT = 30
+# Maximum number of children headers that are requested at the same time
+CHILDREN_HEAD_MAX_WORKERS = 8
+
+
+@allure.step("Get Complex Object Layout")
+def get_complex_object_layout(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    cluster: Cluster,
+    bearer: str = "",
+    wallet_config: str = WALLET_CONFIG,
+    is_direct: bool = True,
+    with_lengths: bool = True,
+) -> ComplexObjectLayout:
+    """
+    Returns layout (link object, last part, children and their lengths) of a complex object.
+    Children are taken from the link object; their headers are requested concurrently and only
+    when lengths are needed. Resolved layout is cached per (cid, oid) and shared by all helpers.
+
+    Args:
+        wallet: path to the wallet on whose behalf the Storage Nodes are requested
+        cid: Container ID which stores the Large Object
+        oid: Large Object ID
+        shell: executor for cli command
+        cluster: cluster object under test
+        bearer: path to Bearer token file
+        wallet_config: path to the neofs-cli config file
+        is_direct: look for the link object with direct requests to the nodes or not
+        with_lengths: resolve payload lengths of the children or not
+    Returns:
+        (ComplexObjectLayout): layout of the object
+    """
+    layout = get_layout(cid, oid)
+    if layout.children is None:
+        _resolve_children(
+            layout, wallet, cid, oid, shell, cluster, bearer, wallet_config, is_direct
+        )
+    if with_lengths and layout.lengths is None:
+        _resolve_lengths(layout, wallet, cid, shell, cluster, bearer, wallet_config)
+    return layout
+
+
+def _resolve_children(
+    layout: ComplexObjectLayout,
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    cluster: Cluster,
+    bearer: str,
+    wallet_config: str,
+    is_direct: bool,
+) -> None:
+    link_oid = get_link_object(
+        wallet,
+        cid,
+        oid,
+        shell,
+        cluster.storage_nodes,
+        bearer=bearer,
+        wallet_config=wallet_config,
+        is_direct=is_direct,
+    )
+    assert link_oid, f"No Link Object for {cid}/{oid} found among all Storage Nodes"
+    head = head_object(
+        wallet,
+        cid,
+        link_oid,
+        shell,
+        cluster.default_rpc_endpoint,
+        is_raw=True,
+        bearer=bearer,
+        wallet_config=wallet_config,
+    )
+
+    children = []
+    if "split" in head["header"] and "children" in head["header"]["split"]:
+        children = head["header"]["split"]["children"]
+    # Children are listed in payload order, so the last one is the last part of the object
+    if children and layout.last is None:
+        layout.last = children[-1]
+    layout.children = children
+
+
+def _resolve_lengths(
+    layout: ComplexObjectLayout,
+    wallet: str,
+    cid: str,
+    shell: Shell,
+    cluster: Cluster,
+    bearer: str,
+    wallet_config: str,
+) -> None:
+    def get_child_length(child_oid: str) -> int:
+        head = head_object(
+            wallet,
+            cid,
+            child_oid,
+            shell,
+            cluster.default_rpc_endpoint,
+            bearer=bearer,
+            wallet_config=wallet_config,
+        )
+        return int(head["header"]["payloadLength"])
+
+    lengths: dict[str, int] = {}
+    for task in fan_out(get_child_length, layout.children, max_workers=CHILDREN_HEAD_MAX_WORKERS):
+        if not task.ok:
+            raise task.error
+        lengths[task.item] = task.result
+    layout.lengths = [lengths[child_oid] for child_oid in layout.children]
+
 
 def get_storage_object_chunks(
     storage_object: StorageObjectInfo, shell: Shell, cluster: Cluster
@@ -39,28 +157,17 @@ def get_storage_object_chunks(
     list of object ids of complex object chunks
     """
 
-    with allure.step(f"Get complex object chunks (f{storage_object.oid})"):
-        split_object_id = get_link_object(
+    with allure.step(f"Get complex object chunks ({storage_object.oid})"):
+        layout = get_complex_object_layout(
             storage_object.wallet_file_path,
             storage_object.cid,
             storage_object.oid,
             shell,
-            cluster.storage_nodes,
+            cluster,
             is_direct=False,
+            with_lengths=False,
         )
-        head = head_object(
-            storage_object.wallet_file_path,
-            storage_object.cid,
-            split_object_id,
-            shell,
-            cluster.default_rpc_endpoint,
-        )
-
-        chunks_object_ids = []
-        if "split" in head["header"] and "children" in head["header"]["split"]:
-            chunks_object_ids = head["header"]["split"]["children"]
-
-        return chunks_object_ids
+        return list(layout.children)
 
 
 def get_complex_object_split_ranges(
@@ -82,24 +189,15 @@ def get_complex_object_split_ranges(
     list of object ids of complex object chunks
     """
 
-    ranges: list = []
-    offset = 0
-    chunks_ids = get_storage_object_chunks(storage_object, shell, cluster)
-    for chunk_id in chunks_ids:
-        head = head_object(
-            storage_object.wallet_file_path,
-            storage_object.cid,
-            chunk_id,
-            shell,
-            cluster.default_rpc_endpoint,
-        )
-
-        length = int(head["header"]["payloadLength"])
-        ranges.append((offset, length))
-
-        offset = offset + length
-
-    return ranges
+    layout = get_complex_object_layout(
+        storage_object.wallet_file_path,
+        storage_object.cid,
+        storage_object.oid,
+        shell,
+        cluster,
+        is_direct=False,
+    )
+    return layout.ranges
 
 
 @allure.step("Get Link Object")
@@ -130,26 +228,9 @@ def get_link_object(
         When no Link Object ID is found after all Storage Nodes polling,
         the function throws an error.
     """
-    for node in nodes:
-        endpoint = node.get_rpc_endpoint()
-        try:
-            resp = neofs_verbs.head_object(
-                wallet,
-                cid,
-                oid,
-                shell=shell,
-                endpoint=endpoint,
-                is_raw=True,
-                is_direct=is_direct,
-                bearer=bearer,
-                wallet_config=wallet_config,
-            )
-            if resp["link"]:
-                return resp["link"]
-        except Exception:
-            logger.info(f"No Link Object found on {endpoint}; continue")
-    logger.error(f"No Link Object for {cid}/{oid} found among all Storage Nodes")
-    return None
+    return _find_split_member(
+        "link", wallet, cid, oid, shell, nodes, bearer, wallet_config, is_direct
+    )
 
 
 @allure.step("Get Last Object")
@@ -169,15 +250,65 @@ def get_last_object(
         When no Last Object ID is found after all Storage Nodes polling,
         the function throws an error.
     """
-    for node in nodes:
-        endpoint = node.get_rpc_endpoint()
-        try:
-            resp = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=endpoint, is_raw=True, is_direct=True
-            )
-            if resp["lastPart"]:
-                return resp["lastPart"]
-        except Exception:
-            logger.info(f"No Last Object found on {endpoint}; continue")
-    logger.error(f"No Last Object for {cid}/{oid} found among all Storage Nodes")
+    return _find_split_member("lastPart", wallet, cid, oid, shell, nodes)
+
+
+def _find_split_member(
+    field: str,
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str = "",
+    wallet_config: str = WALLET_CONFIG,
+    is_direct: bool = True,
+) -> Optional[str]:
+    """
+    Sends raw HEAD request to all nodes at once and returns the value of the given split
+    info field from the first node that knows it; probes that have not started yet are cancelled.
+    Found value is cached in the layout of the object.
+    Args:
+        field: split info field to look for ("link" or "lastPart")
+        wallet: path to the wallet on whose behalf the Storage Nodes are requested
+        cid: Container ID which stores the Large Object
+        oid: Large Object ID
+        shell: executor for cli command
+        nodes: list of nodes to do search on
+        bearer: path to Bearer token file
+        wallet_config: path to the neofs-cli config file
+        is_direct: send request directly to the node or not
+    Returns:
+        (str): ID of the found object or None if no node knows it
+    """
+    layout = get_layout(cid, oid)
+    attribute = {"link": "link", "lastPart": "last"}[field]
+    if getattr(layout, attribute):
+        return getattr(layout, attribute)
+
+    def head_on_node(node: StorageNode) -> dict:
+        return neofs_verbs.head_object(
+            wallet,
+            cid,
+            oid,
+            shell=shell,
+            endpoint=node.get_rpc_endpoint(),
+            is_raw=True,
+            is_direct=is_direct,
+            bearer=bearer,
+            wallet_config=wallet_config,
+        )
+
+    for probe in fan_out(head_on_node, nodes, timeout=NODE_PROBE_TIMEOUT):
+        endpoint = probe.item.get_rpc_endpoint()
+        if not probe.ok:
+            logger.info(f"No {field} object found on {endpoint}: {probe.error}; continue")
+            continue
+
+        if probe.result.get(field):
+            setattr(layout, attribute, probe.result[field])
+            return probe.result[field]
+        logger.info(f"No {field} object found on {endpoint}; continue")
+
+    logger.error(f"No {field} object for {cid}/{oid} found among all Storage Nodes")
     return None
@@ -0,0 +1,71 @@
+"""
+    This module keeps layout of complex objects (link object, last part and children with their
+    payload lengths) that has already been discovered. Split structure of an object never changes
+    while the object exists, so it is resolved once per (cid, oid) and shared by all helpers that
+    need it. Entries are dropped when the object or its container is deleted.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass
+class ComplexObjectLayout:
+    """
+    Split structure of a complex object: link object, last part and children with their
+    payload lengths. Fields are filled as soon as they are discovered and stay None until then.
+    """
+
+    link: Optional[str] = None
+    last: Optional[str] = None
+    children: Optional[list[str]] = None
+    lengths: Optional[list[int]] = None
+
+    @property
+    def offsets(self) -> Optional[list[int]]:
+        if self.lengths is None:
+            return None
+        offsets = []
+        offset = 0
+        for length in self.lengths:
+            offsets.append(offset)
+            offset += length
+        return offsets
+
+    @property
+    def ranges(self) -> Optional[list[Tuple[int, int]]]:
+        if self.lengths is None:
+            return None
+        return list(zip(self.offsets, self.lengths))
+
+
+# Only discovered values are kept, failed lookups are repeated on the next call
+_layouts: dict[Tuple[str, str], ComplexObjectLayout] = {}
+_layouts_lock = threading.Lock()
+
+
+def get_layout(cid: str, oid: str) -> ComplexObjectLayout:
+    """
+    Returns cached layout of the object, creating an empty one if object was not seen yet.
+    """
+    with _layouts_lock:
+        return _layouts.setdefault((cid, oid), ComplexObjectLayout())
+
+
+def invalidate_layout(cid: str, oid: str) -> None:
+    """
+    Drops cached layout of the object, must be called when the object is deleted.
+    """
+    with _layouts_lock:
+        _layouts.pop((cid, oid), None)
+
+
+def invalidate_container_layouts(cid: str) -> None:
+    """
+    Drops cached layouts of all objects in the container, must be called when the container
+    is deleted.
+    """
+    with _layouts_lock:
+        for key in [key for key in _layouts if key[0] == cid]:
+            del _layouts[key]
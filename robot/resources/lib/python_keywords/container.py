@@ -6,14 +6,14 @@
 
 import json
 import logging
-from time import sleep
 from typing import Optional, Union
 
 import allure
 import json_transformers
-from common import NEOFS_CLI_EXEC, WALLET_CONFIG
-from neofs_testlib.cli import NeofsCli
+from cli_helpers import get_neofs_cli
+from complex_object_layout import invalidate_container_layouts
 from neofs_testlib.shell import Shell
+from test_control import poll
 
 logger = logging.getLogger("NeoLogger")
 
@@ -62,7 +62,7 @@ def create_container(
         (str): CID of the created container
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    cli = get_neofs_cli(shell)
     result = cli.container.create(
         rpc_endpoint=endpoint,
         wallet=session_wallet if session_wallet else wallet,
@@ -88,30 +88,33 @@ def create_container(
 def wait_for_container_creation(
     wallet: str, cid: str, shell: Shell, endpoint: str, attempts: int = 15, sleep_interval: int = 1
 ):
-    for _ in range(attempts):
+    def check_container_created() -> None:
         containers = list_containers(wallet, shell, endpoint)
-        if cid in containers:
-            return
-        logger.info(f"There is no {cid} in {containers} yet; sleep {sleep_interval} and continue")
-        sleep(sleep_interval)
-    raise RuntimeError(
-        f"After {attempts * sleep_interval} seconds container {cid} hasn't been persisted; exiting"
-    )
+        if cid not in containers:
+            logger.info(f"There is no {cid} in {containers} yet")
+            raise RuntimeError(
+                f"After {attempts * sleep_interval} seconds container {cid} hasn't been persisted; "
+                "exiting"
+            )
+
+    poll(check_container_created, timeout=attempts * sleep_interval, max_interval=sleep_interval)
 
 
 def wait_for_container_deletion(
     wallet: str, cid: str, shell: Shell, endpoint: str, attempts: int = 30, sleep_interval: int = 1
 ):
-    for _ in range(attempts):
+    def check_container_deleted() -> Exception:
         try:
             get_container(wallet, cid, shell=shell, endpoint=endpoint)
-            sleep(sleep_interval)
-            continue
         except Exception as err:
-            if "container not found" not in str(err):
-                raise AssertionError(f'Expected "container not found" in error, got\n{err}')
-            return
-    raise AssertionError(f"Expected container deleted during {attempts * sleep_interval} sec.")
+            return err
+        raise AssertionError(f"Expected container deleted during {attempts * sleep_interval} sec.")
+
+    err = poll(
+        check_container_deleted, timeout=attempts * sleep_interval, max_interval=sleep_interval
+    )
+    if "container not found" not in str(err):
+        raise AssertionError(f'Expected "container not found" in error, got\n{err}')
 
 
 @allure.step("List Containers")
@@ -126,7 +129,7 @@ def list_containers(wallet: str, shell: Shell, endpoint: str) -> list[str]:
     Returns:
         (list): list of containers
     """
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    cli = get_neofs_cli(shell)
     result = cli.container.list(rpc_endpoint=endpoint, wallet=wallet)
     logger.info(f"Containers: \n{result}")
     return result.stdout.split()
@@ -153,7 +156,7 @@ def get_container(
         (dict, str): dict of container attributes
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    cli = get_neofs_cli(shell)
     result = cli.container.get(rpc_endpoint=endpoint, wallet=wallet, cid=cid, json_mode=json_mode)
 
     if not json_mode:
@@ -192,7 +195,7 @@ def delete_container(
     This function doesn't return anything.
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
+    cli = get_neofs_cli(shell)
     cli.container.delete(
         wallet=wallet,
         cid=cid,
@@ -201,6 +204,7 @@ def delete_container(
         session=session_token,
         await_mode=await_mode,
     )
+    invalidate_container_layouts(cid)
 
 
 def _parse_cid(output: str) -> str:
@@ -1,5 +1,7 @@
 import base64
 import json
+import os
+import threading
 
 import base58
 from neo3 import wallet
@@ -29,14 +31,67 @@ def __fix_wallet_schema(wallet: dict) -> None:
             account["extra"] = None
 
 
-def get_wallet_public_key(wallet_path: str, wallet_password: str, format: str = "hex") -> str:
-    #  Get public key from wallet file
+def _read_wallet_accounts(wallet_path: str, wallet_password: str) -> list[tuple[str, str]]:
     with open(wallet_path, "r") as file:
         wallet_content = json.load(file)
     __fix_wallet_schema(wallet_content)
 
     wallet_from_json = wallet.Wallet.from_json(wallet_content, password=wallet_password)
-    public_key_hex = str(wallet_from_json.accounts[0].public_key)
+    return [(str(account.public_key), account.address) for account in wallet_from_json.accounts]
+
+
+class WalletKeysCache:
+    """
+    Keeps public keys and addresses of wallet accounts, so that expensive (scrypt-based)
+    decryption of a wallet file happens only once per test session.
+
+    Entries are keyed by wallet path, password and file modification time, hence a wallet
+    that has been re-written on disk is decrypted again.
+    """
+
+    def __init__(self) -> None:
+        self._accounts: dict[tuple, list[tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_accounts(self, wallet_path: str, wallet_password: str) -> list[tuple[str, str]]:
+        """
+        Returns (public key in hex, address) pairs for all accounts of the wallet.
+        """
+        key = (os.path.abspath(wallet_path), wallet_password, os.path.getmtime(wallet_path))
+        with self._lock:
+            accounts = self._accounts.get(key)
+            if accounts is not None:
+                self.hits += 1
+                return accounts
+            self.misses += 1
+
+        accounts = _read_wallet_accounts(wallet_path, wallet_password)
+        with self._lock:
+            self._accounts[key] = accounts
+        return accounts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accounts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+wallet_keys_cache = WalletKeysCache()
+
+
+def get_wallet_address(wallet_path: str, wallet_password: str) -> str:
+    """
+    Returns the last address from wallet (the same address neofs-cli and neo-go use by default).
+    """
+    return wallet_keys_cache.get_accounts(wallet_path, wallet_password)[-1][1]
+
+
+def get_wallet_public_key(wallet_path: str, wallet_password: str, format: str = "hex") -> str:
+    #  Get public key from wallet file
+    public_key_hex = wallet_keys_cache.get_accounts(wallet_path, wallet_password)[0][0]
 
     # Convert public key to specified format
     if format == "hex":
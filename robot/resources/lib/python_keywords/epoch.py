@@ -1,25 +1,42 @@
 import logging
-from time import sleep
+import threading
+from functools import lru_cache
+from time import sleep, time
 from typing import Optional
 
 import allure
-from cluster import Cluster, StorageNode
+from cli_helpers import get_neofs_cli
+from cluster import Cluster, MorphChain, StorageNode
 from common import (
     MAINNET_BLOCK_TIME,
+    MORPH_BLOCK_TIME,
     NEOFS_ADM_CONFIG_PATH,
     NEOFS_ADM_EXEC,
-    NEOFS_CLI_EXEC,
     NEOGO_EXECUTABLE,
 )
-from neofs_testlib.cli import NeofsAdm, NeofsCli, NeoGo
+from data_formatters import get_wallet_address
+from neofs_testlib.cli import NeofsAdm, NeoGo
 from neofs_testlib.shell import Shell
-from neofs_testlib.utils.wallet import get_last_address_from_wallet
-from payment_neogo import get_contract_hash
-from test_control import wait_for_success
+from parallel import fan_out
+from payment_neogo import get_block_count, get_contract_hash
+from test_control import poll, wait_for_success
 from utility import parse_time
 
 logger = logging.getLogger("NeoLogger")
 
+# How many morph chain blocks we are ready to wait for an epoch to be switched in netmap contract:
+# the tick transaction gets into the next block or into one of the following ones
+CHAIN_EPOCH_TIMEOUT_BLOCKS = 5
+# How many morph chain blocks we are ready to wait for storage nodes to report an epoch once it is
+# switched in netmap contract: nodes process the new epoch notification in the following blocks
+NODES_EPOCH_TIMEOUT_BLOCKS = 10
+# How long (in seconds) we wait for a single node to report its epoch
+NODE_EPOCH_TIMEOUT = 30
+
+# Epochs reported by storage nodes: node -> (block height, epoch)
+_epochs_cache: dict[StorageNode, tuple[int, int]] = {}
+_epochs_cache_lock = threading.Lock()
+
 
 @allure.step("Ensure fresh epoch")
 def ensure_fresh_epoch(
@@ -28,7 +45,7 @@ def ensure_fresh_epoch(
     # ensure new fresh epoch to avoid epoch switch during test session
     alive_node = alive_node if alive_node else cluster.storage_nodes[0]
     current_epoch = get_epoch(shell, cluster, alive_node)
-    tick_epoch(shell, cluster, alive_node)
+    tick_epoch(shell, cluster, alive_node, wait=True)
     epoch = get_epoch(shell, cluster, alive_node)
     assert epoch > current_epoch, "Epoch wasn't ticked"
     return epoch
@@ -37,13 +54,12 @@ def ensure_fresh_epoch(
 @allure.step("Wait for epochs align in whole cluster")
 @wait_for_success(60, 5)
 def wait_for_epochs_align(shell: Shell, cluster: Cluster) -> bool:
-    epochs = []
-    for node in cluster.storage_nodes:
-        epochs.append(get_epoch(shell, cluster, node))
-    unique_epochs = list(set(epochs))
-    assert (
-        len(unique_epochs) == 1
-    ), f"unaligned epochs found,  {epochs}, count of unique epochs {len(unique_epochs)}"
+    epochs = get_epochs(shell, cluster)
+    unique_epochs = set(epochs.values())
+    assert len(unique_epochs) == 1, (
+        f"unaligned epochs found, {list(epochs.values())}, "
+        f"count of unique epochs {len(unique_epochs)}"
+    )
 
 
 @allure.step("Get Epoch")
@@ -53,20 +69,151 @@ def get_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode]
     wallet_path = alive_node.get_wallet_path()
     wallet_config = alive_node.get_wallet_config_path()
 
-    cli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
+    cli = get_neofs_cli(shell, wallet_config)
 
     epoch = cli.netmap.epoch(endpoint, wallet_path)
     return int(epoch.stdout)
 
 
+@allure.step("Get Epochs from storage nodes")
+def get_epochs(
+    shell: Shell, cluster: Cluster, nodes: Optional[list[StorageNode]] = None
+) -> dict[StorageNode, int]:
+    """
+    Concurrently queries epoch from every storage node.
+
+    Results are cached for the current block of morph chain: epoch cannot be switched without
+    a new block, so nodes that have already reported the latest epoch at this height are not
+    queried again.
+    Args:
+        shell: local shell to make queries about current epoch
+        cluster: cluster instance under test
+        nodes: nodes to query (all storage nodes of the cluster by default)
+    Returns:
+        Mapping from storage node to the epoch it reports, in the order of nodes.
+    """
+    nodes = nodes if nodes is not None else cluster.storage_nodes
+    try:
+        height = get_block_height(cluster)
+    except Exception as err:
+        logger.info(f"Could not get morph chain height, epochs will not be cached: {err}")
+        height = None
+
+    epochs = {}
+    with _epochs_cache_lock:
+        for node in nodes:
+            cached_height, epoch = _epochs_cache.get(node, (None, None))
+            if height is not None and cached_height == height:
+                epochs[node] = epoch
+
+    queried_epochs, errors = _query_epochs(
+        shell, cluster, [node for node in nodes if node not in epochs]
+    )
+    if errors:
+        node, error = next(iter(errors.items()))
+        raise RuntimeError(f"Could not get epoch from node {node}") from error
+
+    epochs.update(queried_epochs)
+    if height is not None and epochs:
+        # Node that reports older epoch may not have processed the latest block yet, so we
+        # cache only the newest epoch and query lagging nodes again on the next call
+        latest_epoch = max(epochs.values())
+        with _epochs_cache_lock:
+            for node, epoch in queried_epochs.items():
+                if epoch == latest_epoch:
+                    _epochs_cache[node] = (height, epoch)
+    return {node: epochs[node] for node in nodes}
+
+
+@allure.step("Get Epoch from morph chain")
+def get_chain_epoch(shell: Shell, cluster: Cluster) -> int:
+    """
+    Returns current epoch as it is stored in the netmap contract.
+    """
+    morph_chain = cluster.morph_chain_nodes[0]
+    resp = morph_chain.rpc_client.invoke_function(
+        _get_netmap_contract_hash(morph_chain, shell), "epoch"
+    )
+    return int(resp["stack"][0]["value"])
+
+
+def get_block_height(cluster: Cluster) -> int:
+    """
+    Returns current height of morph chain.
+    """
+    return get_block_count(cluster.morph_chain_nodes[0])
+
+
+@allure.step("Wait for {blocks_count} new blocks in morph chain")
+def wait_for_blocks(cluster: Cluster, blocks_count: int = 1) -> None:
+    """
+    Waits until morph chain produces the given number of new blocks.
+    Args:
+        cluster: cluster instance under test
+        blocks_count: number of blocks to wait for
+    """
+    block_time = parse_time(MORPH_BLOCK_TIME)
+    target_height = get_block_height(cluster) + blocks_count
+
+    def check_height() -> None:
+        if get_block_height(cluster) < target_height:
+            raise TimeoutError(f"Morph chain has not reached height {target_height} in time")
+
+    poll(check_height, timeout=block_time * blocks_count * 5, max_interval=block_time / 4)
+
+
+@allure.step("Wait for epoch {epoch} in the whole cluster")
+def wait_for_epoch(shell: Shell, cluster: Cluster, epoch: int) -> None:
+    """
+    Waits until netmap contract switches to the given epoch and then until every storage node
+    reports it. Nodes that do not respond (e.g. are stopped by the test) are not waited for.
+    Args:
+        shell: local shell to make queries about current epoch
+        cluster: cluster instance under test
+        epoch: epoch to wait for
+    """
+    block_time = parse_time(MORPH_BLOCK_TIME)
+
+    def check_chain_epoch() -> None:
+        if get_chain_epoch(shell, cluster) < epoch:
+            raise TimeoutError(f"Epoch {epoch} has not been switched in netmap contract in time")
+
+    poll(
+        check_chain_epoch,
+        timeout=block_time * CHAIN_EPOCH_TIMEOUT_BLOCKS,
+        max_interval=block_time / 4,
+    )
+
+    # Nodes get their own budget, so that a slow chain check does not eat into it
+    deadline = time() + block_time * NODES_EPOCH_TIMEOUT_BLOCKS
+    lagging_nodes = cluster.storage_nodes
+
+    def check_nodes_epoch() -> None:
+        nonlocal lagging_nodes
+        epochs, errors = _query_epochs(
+            shell, cluster, lagging_nodes, timeout=max(deadline - time(), block_time)
+        )
+        for node, error in errors.items():
+            logger.info(f"Could not get epoch from {node}, skip it: {error}")
+        lagging_nodes = [node for node, node_epoch in epochs.items() if node_epoch < epoch]
+        if lagging_nodes:
+            raise TimeoutError(f"Nodes {lagging_nodes} have not switched to epoch {epoch} in time")
+
+    poll(check_nodes_epoch, timeout=deadline - time(), max_interval=block_time / 4)
+
+
 @allure.step("Tick Epoch")
-def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode] = None):
+def tick_epoch(
+    shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode] = None, wait: bool = False
+):
     """
     Tick epoch using neofs-adm or NeoGo if neofs-adm is not available (DevEnv)
     Args:
         shell: local shell to make queries about current epoch. Remote shell will be used to tick new one
         cluster: cluster instance under test
         alive_node: node to send requests to (first node in cluster by default)
+        wait: wait until new epoch is reported by storage nodes; raises if it is not reported
+            within CHAIN_EPOCH_TIMEOUT_BLOCKS + NODES_EPOCH_TIMEOUT_BLOCKS blocks
     """
 
     alive_node = alive_node if alive_node else cluster.storage_nodes[0]
@@ -74,12 +221,15 @@ def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode]
 
     if NEOFS_ADM_EXEC and NEOFS_ADM_CONFIG_PATH:
         # If neofs-adm is available, then we tick epoch with it (to be consistent with UAT tests)
+        next_epoch = get_chain_epoch(shell, cluster) + 1 if wait else None
         neofsadm = NeofsAdm(
             shell=remote_shell,
             neofs_adm_exec_path=NEOFS_ADM_EXEC,
             config_file=NEOFS_ADM_CONFIG_PATH,
         )
         neofsadm.morph.force_new_epoch()
+        if wait:
+            wait_for_epoch(shell, cluster, next_epoch)
         return
 
     # Otherwise we tick epoch using transaction
@@ -90,7 +240,7 @@ def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode]
     # In case if no local_wallet_path is provided, we use wallet_path
     ir_wallet_path = ir_node.get_wallet_path()
     ir_wallet_pass = ir_node.get_wallet_password()
-    ir_address = get_last_address_from_wallet(ir_wallet_path, ir_wallet_pass)
+    ir_address = get_wallet_address(ir_wallet_path, ir_wallet_pass)
 
     morph_chain = cluster.morph_chain_nodes[0]
     morph_endpoint = morph_chain.get_endpoint()
@@ -99,7 +249,7 @@ def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode]
     neogo.contract.invokefunction(
         wallet=ir_wallet_path,
         wallet_password=ir_wallet_pass,
-        scripthash=get_contract_hash(morph_chain, "netmap.neofs", shell=shell),
+        scripthash=_get_netmap_contract_hash(morph_chain, shell),
         method="newEpoch",
         arguments=f"int:{cur_epoch + 1}",
         multisig_hash=f"{ir_address}:Global",
@@ -108,4 +258,27 @@ def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode]
         force=True,
         gas=1,
     )
-    sleep(parse_time(MAINNET_BLOCK_TIME))
+    if wait:
+        wait_for_epoch(shell, cluster, cur_epoch + 1)
+    else:
+        sleep(parse_time(MAINNET_BLOCK_TIME))
+
+
+@lru_cache(maxsize=None)
+def _get_netmap_contract_hash(morph_chain: MorphChain, shell: Shell) -> str:
+    return get_contract_hash(morph_chain, "netmap.neofs", shell=shell)
+
+
+def _query_epochs(
+    shell: Shell,
+    cluster: Cluster,
+    nodes: list[StorageNode],
+    timeout: float = NODE_EPOCH_TIMEOUT,
+) -> tuple[dict[StorageNode, int], dict[StorageNode, BaseException]]:
+    epochs, errors = {}, {}
+    for probe in fan_out(lambda node: get_epoch(shell, cluster, node), nodes, timeout=timeout):
+        if probe.ok:
+            epochs[probe.item] = probe.result
+        else:
+            errors[probe.item] = probe.error
+    return {node: epochs[node] for node in nodes if node in epochs}, errors
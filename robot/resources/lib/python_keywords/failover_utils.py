@@ -1,14 +1,18 @@
 import logging
-from time import sleep
 
 import allure
 from cluster import Cluster, StorageNode
 from neofs_testlib.shell import Shell
 from python_keywords.node_management import storage_node_healthcheck
 from storage_policy import get_nodes_with_object
+from test_control import poll
 
 logger = logging.getLogger("NeoLogger")
 
+# Failover scenarios may take several minutes to recover from
+FAILOVER_WAIT_TIMEOUT = 300
+FAILOVER_POLL_MAX_INTERVAL = 15
+
 
 @allure.step("Wait for object replication")
 def wait_object_replication(
@@ -18,27 +22,33 @@ def wait_object_replication(
     shell: Shell,
     nodes: list[StorageNode],
 ) -> list[StorageNode]:
-    sleep_interval, attempts = 15, 20
-    nodes_with_object = []
-    for _ in range(attempts):
+    def check_replication() -> list[StorageNode]:
         nodes_with_object = get_nodes_with_object(cid, oid, shell=shell, nodes=nodes)
-        if len(nodes_with_object) >= expected_copies:
-            return nodes_with_object
-        sleep(sleep_interval)
-    raise AssertionError(
-        f"Expected {expected_copies} copies of object, but found {len(nodes_with_object)}. "
-        f"Waiting time {sleep_interval * attempts}"
+        if len(nodes_with_object) < expected_copies:
+            raise AssertionError(
+                f"Expected {expected_copies} copies of object, but found {len(nodes_with_object)}. "
+                f"Waiting time {FAILOVER_WAIT_TIMEOUT}"
+            )
+        return nodes_with_object
+
+    return poll(
+        check_replication,
+        timeout=FAILOVER_WAIT_TIMEOUT,
+        max_interval=FAILOVER_POLL_MAX_INTERVAL,
     )
 
 
 @allure.step("Wait for storage nodes returned to cluster")
 def wait_all_storage_nodes_returned(cluster: Cluster) -> None:
-    sleep_interval, attempts = 15, 20
-    for __attempt in range(attempts):
-        if is_all_storage_nodes_returned(cluster):
-            return
-        sleep(sleep_interval)
-    raise AssertionError("Storage node(s) is broken")
+    def check_nodes_returned() -> None:
+        if not is_all_storage_nodes_returned(cluster):
+            raise AssertionError("Storage node(s) is broken")
+
+    poll(
+        check_nodes_returned,
+        timeout=FAILOVER_WAIT_TIMEOUT,
+        max_interval=FAILOVER_POLL_MAX_INTERVAL,
+    )
 
 
 def is_all_storage_nodes_returned(cluster: Cluster) -> bool:
@@ -1,28 +1,162 @@
+import asyncio
 import base64
 import logging
 import os
 import random
 import re
-import shutil
 import uuid
 import zipfile
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote_plus
 
+import aiohttp
 import allure
 import requests
 from aws_cli_client import LONG_TIMEOUT
 from cli_helpers import _cmd_run
 from cluster import StorageNode
-from common import SIMPLE_OBJECT_SIZE
-from file_helper import get_file_hash
+from common import ASSETS_DIR, HTTP_POOL_SIZE, SIMPLE_OBJECT_SIZE
+from file_helper import FILE_CHUNK_SIZE, StreamDigest, get_file_hash, save_stream
 from neofs_testlib.shell import Shell
 from python_keywords.neofs_verbs import get_object
 from python_keywords.storage_policy import get_nodes_without_object
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("NeoLogger")
 
-ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
+
+@lru_cache(maxsize=None)
+def get_http_session(endpoint: str, pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Returns keep-alive session for the given HTTP gate endpoint. Session is shared by all
+    requests to the endpoint, so that connections are reused instead of being opened per request.
+    Args:
+        endpoint: http gate endpoint
+        pool_size: max number of connections kept open to the endpoint
+    Returns:
+        Session with connection pool for the endpoint.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class AsyncHttpGateClient:
+    """
+    Asynchronous client for HTTP gate that keeps a pool of connections to the endpoint.
+    Useful to issue many concurrent requests to gate, e.g.:
+
+        async with AsyncHttpGateClient(endpoint) as client:
+            oids = await asyncio.gather(*[client.upload(cid, path) for path in paths])
+    """
+
+    def __init__(self, endpoint: str, pool_size: int = HTTP_POOL_SIZE) -> None:
+        self.endpoint = endpoint
+        self.pool_size = pool_size
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncHttpGateClient":
+        connector = aiohttp.TCPConnector(limit=self.pool_size)
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+
+    async def get(self, cid: str, oid: str, request_path: Optional[str] = None) -> str:
+        """
+        Gets given object from HTTP gate and saves it to file.
+        Args:
+            cid: container id to get object from
+            oid: object ID
+            request_path: (optional) http request, if ommited - use default [/get/{cid}/{oid}]
+        Returns:
+            Path to downloaded file.
+        """
+        request = f"{self.endpoint}{request_path or f'/get/{cid}/{oid}'}"
+        file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{oid}_{str(uuid.uuid4())}")
+        async with self._session.get(request) as resp:
+            if resp.status != 200:
+                raise Exception(
+                    f"""Failed to get object via HTTP gate:
+                        request: {request},
+                        response: {await resp.text()},
+                        status code: {resp.status} {resp.reason}"""
+                )
+            with open(file_path, "wb") as file:
+                async for chunk in resp.content.iter_chunked(FILE_CHUNK_SIZE):
+                    file.write(chunk)
+        logger.info(f"Request: {request}")
+        return file_path
+
+    async def upload(self, cid: str, path: str, headers: Optional[dict] = None) -> str:
+        """
+        Uploads given object through HTTP gate.
+        Args:
+            cid: CID to upload object to
+            path: File path to upload
+            headers: Object header
+        Returns:
+            ID of uploaded object.
+        """
+        request = f"{self.endpoint}/upload/{cid}"
+        with open(path, "rb") as file:
+            form = aiohttp.FormData()
+            form.add_field("upload_file", file, filename=os.path.basename(path))
+            form.add_field("filename", path)
+            async with self._session.post(request, data=form, headers=headers) as resp:
+                if resp.status != 200:
+                    raise Exception(
+                        f"""Failed to upload object via HTTP gate:
+                            request: {request},
+                            response: {await resp.text()},
+                            status code: {resp.status} {resp.reason}"""
+                    )
+                body = await resp.json(content_type=None)
+        logger.info(f"Request: {request}")
+        assert body.get("object_id"), f"OID found in response {body}"
+        return body["object_id"]
+
+
+@allure.step("Upload objects via HTTP Gate concurrently")
+def upload_via_http_gate_many(
+    cid: str, uploads: list[tuple[str, Optional[dict]]], endpoint: str
+) -> list[str]:
+    """
+    This function uploads given objects through HTTP gate concurrently
+    cid:      CID to upload objects to
+    uploads:  list of (file path, object header) pairs to upload
+    endpoint: http gate endpoint
+    Returns IDs of uploaded objects in the order of uploads.
+    """
+
+    async def upload_all() -> list[str]:
+        async with AsyncHttpGateClient(endpoint) as client:
+            return await asyncio.gather(
+                *[client.upload(cid, path, headers) for path, headers in uploads]
+            )
+
+    return asyncio.run(upload_all())
+
+
+@allure.step("Get objects via HTTP Gate concurrently")
+def get_via_http_gate_many(cid: str, oids: list[str], endpoint: str) -> list[str]:
+    """
+    This function gets given objects from HTTP gate concurrently
+    cid:      container id to get objects from
+    oids:     IDs of objects to get
+    endpoint: http gate endpoint
+    Returns paths to downloaded files in the order of oids.
+    """
+
+    async def get_all() -> list[str]:
+        async with AsyncHttpGateClient(endpoint) as client:
+            return await asyncio.gather(*[client.get(cid, oid) for oid in oids])
+
+    return asyncio.run(get_all())
 
 
 @allure.step("Get via HTTP Gate")
@@ -35,31 +169,38 @@ def get_via_http_gate(cid: str, oid: str, endpoint: str, request_path: Optional[
     request_path: (optional) http request, if ommited - use default [{endpoint}/get/{cid}/{oid}]
     """
 
-    # if `request_path` parameter ommited, use default
-    if request_path is None:
-        request = f"{endpoint}/get/{cid}/{oid}"
-    else:
-        request = f"{endpoint}{request_path}"
-
-    resp = requests.get(request, stream=True)
-
-    if not resp.ok:
-        raise Exception(
-            f"""Failed to get object via HTTP gate:
-                request: {resp.request.path_url},
-                response: {resp.text},
-                status code: {resp.status_code} {resp.reason}"""
-        )
-
-    logger.info(f"Request: {request}")
-    _attach_allure_step(request, resp.status_code)
-
+    request = _get_request(cid, oid, endpoint, request_path)
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{oid}")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
+    _download(endpoint, request, file_path)
     return file_path
 
 
+@allure.step("Get via HTTP Gate and hash on the fly")
+def get_via_http_gate_digest(
+    cid: str,
+    oid: str,
+    endpoint: str,
+    request_path: Optional[str] = None,
+    save_to_file: bool = False,
+) -> StreamDigest:
+    """
+    This function gets given object from HTTP gate and computes its hash while reading
+    the response, so that payload does not have to be read again to verify it
+    cid:          container id to get object from
+    oid:          object ID
+    endpoint:     http gate endpoint
+    request_path: (optional) http request, if ommited - use default [{endpoint}/get/{cid}/{oid}]
+    save_to_file: (optional) save payload to file as well, by default it is not written to disk
+    """
+    request = _get_request(cid, oid, endpoint, request_path)
+    file_path = (
+        os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{oid}_{str(uuid.uuid4())}")
+        if save_to_file
+        else None
+    )
+    return _download(endpoint, request, file_path)
+
+
 @allure.step("Get via Zip HTTP Gate")
 def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
     """
@@ -69,22 +210,8 @@ def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
     endpoint: http gate endpoint
     """
     request = f"{endpoint}/zip/{cid}/{prefix}"
-    resp = requests.get(request, stream=True)
-
-    if not resp.ok:
-        raise Exception(
-            f"""Failed to get object via HTTP gate:
-                request: {resp.request.path_url},
-                response: {resp.text},
-                status code: {resp.status_code} {resp.reason}"""
-        )
-
-    logger.info(f"Request: {request}")
-    _attach_allure_step(request, resp.status_code)
-
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_archive.zip")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
+    _download(endpoint, request, file_path)
 
     with zipfile.ZipFile(file_path, "r") as zip_ref:
         zip_ref.extractall(ASSETS_DIR)
@@ -103,33 +230,38 @@ def get_via_http_gate_by_attribute(
     endpoint:     http gate endpoint
     request_path: (optional) http request path, if ommited - use default [{endpoint}/get_by_attribute/{Key}/{Value}]
     """
-    attr_name = list(attribute.keys())[0]
-    attr_value = quote_plus(str(attribute.get(attr_name)))
-    # if `request_path` parameter ommited, use default
-    if request_path is None:
-        request = f"{endpoint}/get_by_attribute/{cid}/{quote_plus(str(attr_name))}/{attr_value}"
-    else:
-        request = f"{endpoint}{request_path}"
-
-    resp = requests.get(request, stream=True)
-
-    if not resp.ok:
-        raise Exception(
-            f"""Failed to get object via HTTP gate:
-                request: {resp.request.path_url},
-                response: {resp.text},
-                status code: {resp.status_code} {resp.reason}"""
-        )
-
-    logger.info(f"Request: {request}")
-    _attach_allure_step(request, resp.status_code)
-
+    request = _get_by_attribute_request(cid, attribute, endpoint, request_path)
     file_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{str(uuid.uuid4())}")
-    with open(file_path, "wb") as file:
-        shutil.copyfileobj(resp.raw, file)
+    _download(endpoint, request, file_path)
     return file_path
 
 
+@allure.step("Get via HTTP Gate by attribute and hash on the fly")
+def get_via_http_gate_by_attribute_digest(
+    cid: str,
+    attribute: dict,
+    endpoint: str,
+    request_path: Optional[str] = None,
+    save_to_file: bool = False,
+) -> StreamDigest:
+    """
+    This function gets given object from HTTP gate and computes its hash while reading
+    the response, so that payload does not have to be read again to verify it
+    cid:          CID to get object from
+    attribute:    attribute {name: attribute} value pair
+    endpoint:     http gate endpoint
+    request_path: (optional) http request path, if ommited - use default [{endpoint}/get_by_attribute/{Key}/{Value}]
+    save_to_file: (optional) save payload to file as well, by default it is not written to disk
+    """
+    request = _get_by_attribute_request(cid, attribute, endpoint, request_path)
+    file_path = (
+        os.path.join(os.getcwd(), ASSETS_DIR, f"{cid}_{str(uuid.uuid4())}")
+        if save_to_file
+        else None
+    )
+    return _download(endpoint, request, file_path)
+
+
 @allure.step("Upload via HTTP Gate")
 def upload_via_http_gate(cid: str, path: str, endpoint: str, headers: dict = None) -> str:
     """
@@ -140,9 +272,10 @@ def upload_via_http_gate(cid: str, path: str, endpoint: str, headers: dict = Non
     headers:  Object header
     """
     request = f"{endpoint}/upload/{cid}"
-    files = {"upload_file": open(path, "rb")}
     body = {"filename": path}
-    resp = requests.post(request, files=files, data=body, headers=headers)
+    with open(path, "rb") as file:
+        files = {"upload_file": file}
+        resp = get_http_session(endpoint).post(request, files=files, data=body, headers=headers)
 
     if not resp.ok:
         raise Exception(
@@ -238,6 +371,40 @@ def get_via_http_curl(cid: str, oid: str, endpoint: str) -> str:
     return file_path
 
 
+def _get_request(cid: str, oid: str, endpoint: str, request_path: Optional[str] = None) -> str:
+    # if `request_path` parameter ommited, use default
+    if request_path is None:
+        return f"{endpoint}/get/{cid}/{oid}"
+    return f"{endpoint}{request_path}"
+
+
+def _get_by_attribute_request(
+    cid: str, attribute: dict, endpoint: str, request_path: Optional[str] = None
+) -> str:
+    # if `request_path` parameter ommited, use default
+    if request_path is not None:
+        return f"{endpoint}{request_path}"
+    attr_name = list(attribute.keys())[0]
+    attr_value = quote_plus(str(attribute.get(attr_name)))
+    return f"{endpoint}/get_by_attribute/{cid}/{quote_plus(str(attr_name))}/{attr_value}"
+
+
+def _download(endpoint: str, request: str, file_path: Optional[str]) -> StreamDigest:
+    with get_http_session(endpoint).get(request, stream=True) as resp:
+        if not resp.ok:
+            raise Exception(
+                f"""Failed to get object via HTTP gate:
+                    request: {resp.request.path_url},
+                    response: {resp.text},
+                    status code: {resp.status_code} {resp.reason}"""
+            )
+
+        logger.info(f"Request: {request}")
+        _attach_allure_step(request, resp.status_code)
+
+        return save_stream(resp.raw, file_path)
+
+
 def _attach_allure_step(request: str, status_code: int, req_type="GET"):
     command_attachment = f"REQUEST: '{request}'\n" f"RESPONSE:\n {status_code}\n"
     with allure.step(f"{req_type} Request"):
@@ -260,11 +427,16 @@ def try_to_get_object_and_expect_error(
 def get_object_by_attr_and_verify_hashes(
     oid: str, file_name: str, cid: str, attrs: dict, endpoint: str
 ) -> None:
-    got_file_path_http = get_via_http_gate(cid=cid, oid=oid, endpoint=endpoint)
-    got_file_path_http_attr = get_via_http_gate_by_attribute(
+    got_http = get_via_http_gate_digest(cid=cid, oid=oid, endpoint=endpoint)
+    got_http_attr = get_via_http_gate_by_attribute_digest(
         cid=cid, attribute=attrs, endpoint=endpoint
     )
-    assert_hashes_are_equal(file_name, got_file_path_http, got_file_path_http_attr)
+    assert (
+        got_http.hash == got_http_attr.hash
+    ), "Expected hashes are equal for object got by id and by attribute"
+    assert got_http.hash == get_file_hash(
+        file_name
+    ), f"Expected hashes are equal for file {file_name} and object got by id"
 
 
 def get_object_and_verify_hashes(
@@ -7,9 +7,10 @@ from typing import Any, Optional
 
 import allure
 import json_transformers
+from cli_helpers import get_neofs_cli
 from cluster import Cluster
-from common import ASSETS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
-from neofs_testlib.cli import NeofsCli
+from common import ASSETS_DIR, WALLET_CONFIG
+from complex_object_layout import invalidate_layout
 from neofs_testlib.shell import Shell
 
 logger = logging.getLogger("NeoLogger")
@@ -100,7 +101,7 @@ def get_object(
         write_object = str(uuid.uuid4())
     file_path = os.path.join(ASSETS_DIR, write_object)
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     cli.object.get(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -147,7 +148,7 @@ def get_range_hash(
     Returns:
         None
     """
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.hash(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -251,7 +252,7 @@ def put_object(
         (str): ID of uploaded Object
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.put(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -300,7 +301,7 @@ def delete_object(
         (str): Tombstone ID
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.delete(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -310,6 +311,7 @@ def delete_object(
         xhdr=xhdr,
         session=session,
     )
+    invalidate_layout(cid, oid)
 
     id_str = result.stdout.split("\n")[1]
     tombstone = id_str.split(":")[1]
@@ -348,7 +350,7 @@ def get_range(
     """
     range_file_path = os.path.join(ASSETS_DIR, str(uuid.uuid4()))
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     cli.object.range(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -403,7 +405,7 @@ def lock_object(
         Lock object ID
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.lock(
         rpc_endpoint=endpoint,
         lifetime=lifetime,
@@ -460,7 +462,7 @@ def search_object(
         list of found ObjectIDs
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.search(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -518,7 +520,7 @@ def get_netmap_netinfo(
         (dict): dict of parsed command output
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     output = cli.netmap.netinfo(
         wallet=wallet,
         rpc_endpoint=endpoint,
@@ -582,7 +584,7 @@ def head_object(
         (str): HEAD response as a plain text
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    cli = get_neofs_cli(shell, wallet_config or WALLET_CONFIG)
     result = cli.object.head(
         rpc_endpoint=endpoint,
         wallet=wallet,
@@ -6,10 +6,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 import allure
+from cli_helpers import get_neofs_cli
 from cluster import Cluster, StorageNode
-from common import MORPH_BLOCK_TIME, NEOFS_CLI_EXEC
-from epoch import tick_epoch
-from neofs_testlib.cli import NeofsCli
+from common import MORPH_BLOCK_TIME
+from epoch import tick_epoch, wait_for_blocks
 from neofs_testlib.shell import Shell
 from utility import parse_time
 
@@ -107,7 +107,7 @@ def get_netmap_snapshot(node: StorageNode, shell: Shell) -> str:
     storage_wallet_config = node.get_wallet_config_path()
     storage_wallet_path = node.get_wallet_path()
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, config_file=storage_wallet_config)
+    cli = get_neofs_cli(shell, storage_wallet_config)
     return cli.netmap.snapshot(
         rpc_endpoint=node.get_rpc_endpoint(),
         wallet=storage_wallet_path,
@@ -168,7 +168,7 @@ def exclude_node_from_network_map(
 
     storage_node_set_status(node_to_exclude, status="offline")
 
-    time.sleep(parse_time(MORPH_BLOCK_TIME))
+    wait_for_blocks(cluster)
     tick_epoch(shell, cluster)
 
     snapshot = get_netmap_snapshot(node=alive_node, shell=shell)
@@ -189,9 +189,9 @@ def include_node_to_network_map(
     # Per suggestion of @fyrchik we need to wait for 2 blocks after we set status and after tick epoch.
     # First sleep can be omitted after https://github.com/nspcc-dev/neofs-node/issues/1790 complete.
 
-    time.sleep(parse_time(MORPH_BLOCK_TIME) * 2)
+    wait_for_blocks(cluster, 2)
     tick_epoch(shell, cluster)
-    time.sleep(parse_time(MORPH_BLOCK_TIME) * 2)
+    wait_for_blocks(cluster, 2)
 
     check_node_in_map(node_to_include, shell, alive_node)
 
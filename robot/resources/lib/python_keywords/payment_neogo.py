@@ -3,22 +3,28 @@ import json
 import logging
 import re
 import time
-from typing import Optional
+from typing import Optional, Union
 
 import allure
 from cluster import MainChain, MorphChain
-from common import GAS_HASH, MAINNET_BLOCK_TIME, NEOFS_CONTRACT, NEOGO_EXECUTABLE
+from common import GAS_HASH, MAINNET_BLOCK_TIME, MORPH_BLOCK_TIME, NEOFS_CONTRACT, NEOGO_EXECUTABLE
+from data_formatters import get_wallet_address
 from neo3 import wallet as neo3_wallet
+from neofs_testlib.blockchain.rpc_client import NeoRPCException
 from neofs_testlib.cli import NeoGo
-from neofs_testlib.shell import Shell
+from neofs_testlib.shell import CommandOptions, InteractiveInput, Shell
 from neofs_testlib.utils.converters import contract_hash_to_address
-from neofs_testlib.utils.wallet import get_last_address_from_wallet
+from test_control import poll
 from utility import parse_time
 
 logger = logging.getLogger("NeoLogger")
 
 EMPTY_PASSWORD = ""
 TX_PERSIST_TIMEOUT = 15  # seconds
+# How many sidechain blocks we are ready to wait for inner ring to credit a confirmed deposit
+DEPOSIT_CREDIT_TIMEOUT_BLOCKS = 10
+# Maximum number of recipients in a single multitransfer transaction
+MULTITRANSFER_MAX_RECIPIENTS = 50
 ASSET_POWER_MAINCHAIN = 10**8
 ASSET_POWER_SIDECHAIN = 10**12
 
@@ -27,6 +33,20 @@ def get_nns_contract_hash(morph_chain: MorphChain) -> str:
     return morph_chain.rpc_client.get_contract_state(1)["hash"]
 
 
+def get_block_count(chain: Union[MainChain, MorphChain]) -> int:
+    """
+    Returns the number of blocks in the chain.
+    """
+    # RPCClient has no public wrapper for getblockcount method
+    resp = chain.rpc_client._call_endpoint("getblockcount")
+    # RPC errors are returned as response object instead of being raised
+    if isinstance(resp, dict) and "error" in resp:
+        raise NeoRPCException(
+            f"Could not get block count from {chain.get_endpoint()}: {resp['error']}"
+        )
+    return int(resp)
+
+
 def get_contract_hash(morph_chain: MorphChain, resolve_name: str, shell: Shell) -> str:
     nns_contract_hash = get_nns_contract_hash(morph_chain)
     neogo = NeoGo(shell=shell, neo_go_exec_path=NEOGO_EXECUTABLE)
@@ -42,7 +62,7 @@ def get_contract_hash(morph_chain: MorphChain, resolve_name: str, shell: Shell)
 
 @allure.step("Withdraw Mainnet Gas")
 def withdraw_mainnet_gas(shell: Shell, main_chain: MainChain, wlt: str, amount: int):
-    address = get_last_address_from_wallet(wlt, EMPTY_PASSWORD)
+    address = get_wallet_address(wlt, EMPTY_PASSWORD)
     scripthash = neo3_wallet.Account.address_to_script_hash(address)
 
     neogo = NeoGo(shell=shell, neo_go_exec_path=NEOGO_EXECUTABLE)
@@ -61,7 +81,7 @@ def withdraw_mainnet_gas(shell: Shell, main_chain: MainChain, wlt: str, amount:
     if m is None:
         raise Exception("Can not get Tx.")
     tx = m.group(1)
-    if not transaction_accepted(tx):
+    if not transaction_accepted(main_chain, tx):
         raise AssertionError(f"TX {tx} hasn't been processed")
 
 
@@ -73,17 +93,54 @@ def transaction_accepted(main_chain: MainChain, tx_id: str):
     Returns:
         (bool)
     """
-
     try:
-        for _ in range(0, TX_PERSIST_TIMEOUT):
-            time.sleep(1)
-            resp = main_chain.rpc_client.get_transaction_height(tx_id)
-            if resp is not None:
-                logger.info(f"TX is accepted in block: {resp}")
-                return True
-    except Exception as out:
-        logger.info(f"request failed with error: {out}")
-        raise out
+        wait_for_transactions(main_chain, [tx_id])
+    except AssertionError as err:
+        logger.info(err)
+        return False
+    return True
+
+
+@allure.step("Wait for transactions to be accepted")
+def wait_for_transactions(
+    main_chain: MainChain, tx_ids: list[str], timeout: int = TX_PERSIST_TIMEOUT
+) -> None:
+    """
+    Waits until all given transactions are persisted in main chain.
+
+    Transactions are checked only when a new block appears in the chain, so the number of RPC
+    requests does not depend on how long we wait.
+    Args:
+        main_chain: main chain node to send requests to
+        tx_ids: IDs of transactions to wait for
+        timeout: time (in seconds) to wait for all transactions
+    """
+    pending_tx_ids = list(tx_ids)
+    last_checked_height = None
+
+    def check_transactions() -> None:
+        nonlocal pending_tx_ids, last_checked_height
+        height = get_block_count(main_chain)
+        if height != last_checked_height:
+            last_checked_height = height
+            pending_tx_ids = [
+                tx_id
+                for tx_id in pending_tx_ids
+                if not _is_transaction_persisted(main_chain, tx_id)
+            ]
+        if pending_tx_ids:
+            raise AssertionError(f"TXs {pending_tx_ids} haven't been processed")
+
+    block_time = parse_time(MAINNET_BLOCK_TIME)
+    poll(check_transactions, timeout=timeout, max_interval=block_time / 2)
+
+
+def _is_transaction_persisted(main_chain: MainChain, tx_id: str) -> bool:
+    # RPC returns error object instead of height if transaction is not persisted yet
+    resp = main_chain.rpc_client.get_transaction_height(tx_id)
+    if isinstance(resp, int):
+        logger.info(f"TX {tx_id} is accepted in block: {resp}")
+        return True
     return False
 
 
@@ -141,11 +198,133 @@ def transfer_gas(
         if wallet_from_password is not None
         else main_chain.get_wallet_password()
     )
-    address_from = address_from or get_last_address_from_wallet(
-        wallet_from_path, wallet_from_password
+    address_from = address_from or get_wallet_address(wallet_from_path, wallet_from_password)
+    address_to = address_to or get_wallet_address(wallet_to_path, wallet_to_password)
+
+    txid = _send_gas(
+        shell, main_chain, amount, wallet_from_path, wallet_from_password, address_from, address_to
+    )
+    if not transaction_accepted(main_chain, txid):
+        raise AssertionError(f"TX {txid} hasn't been processed")
+    time.sleep(parse_time(MAINNET_BLOCK_TIME))
+
+
+@allure.title("Transfer Gas to multiple recipients")
+def transfer_gas_to_many(
+    shell: Shell,
+    main_chain: MainChain,
+    amounts: dict[str, int],
+    wallet_from_path: Optional[str] = None,
+    wallet_from_password: Optional[str] = None,
+    address_from: Optional[str] = None,
+) -> None:
+    """
+    This function transfers GAS in main chain from mainnet wallet to multiple addresses.
+    Recipients are grouped into multitransfer transactions that are sent one after another
+    without waiting; then all transactions are confirmed together.
+    Args:
+        shell: Shell instance.
+        main_chain: Main chain node to send transactions to.
+        amounts: Mapping from recipient address to amount of gas to transfer.
+        wallet_from_path: Path to chain node wallet.
+        wallet_from_password: Password of the wallet to transfer assets from.
+        address_from: The address of the wallet to transfer assets from.
+    """
+    wallet_from_path = wallet_from_path or main_chain.get_wallet_path()
+    wallet_from_password = (
+        wallet_from_password
+        if wallet_from_password is not None
+        else main_chain.get_wallet_password()
+    )
+    address_from = address_from or get_wallet_address(wallet_from_path, wallet_from_password)
+
+    recipients = [f"GAS:{address_to}:{amount}" for address_to, amount in amounts.items()]
+    tx_ids = []
+    for start in range(0, len(recipients), MULTITRANSFER_MAX_RECIPIENTS):
+        tx_ids.append(
+            _multitransfer_gas(
+                shell,
+                main_chain,
+                wallet_from_path,
+                wallet_from_password,
+                address_from,
+                recipients[start : start + MULTITRANSFER_MAX_RECIPIENTS],
+            )
+        )
+    wait_for_transactions(main_chain, tx_ids)
+
+
+@allure.step("NeoFS Deposit for multiple wallets")
+def deposit_gas_from_many(
+    shell: Shell,
+    main_chain: MainChain,
+    morph_chain: MorphChain,
+    amount: int,
+    wallets: list[tuple[str, str]],
+) -> None:
+    """
+    Transferring GAS from every given wallet to NeoFS contract address. Deposit transactions
+    are sent one after another without waiting; then all of them are confirmed together.
+    Confirmed deposit is credited to NeoFS balance by inner ring later, so the function returns
+    only when NeoFS balances of all wallets are increased.
+    Args:
+        shell: Shell instance.
+        main_chain: Main chain node to send transactions to.
+        morph_chain: Sidechain node to check NeoFS balances with.
+        amount: Amount of gas to deposit from every wallet.
+        wallets: List of (wallet path, wallet password) pairs.
+    """
+    deposit_addr = contract_hash_to_address(NEOFS_CONTRACT)
+    logger.info(f"NeoFS contract address: {deposit_addr}")
+    expected_balances = {
+        wallet_path: get_balance(shell, morph_chain, wallet_path, wallet_password) + amount
+        for wallet_path, wallet_password in wallets
+    }
+    tx_ids = [
+        _send_gas(
+            shell,
+            main_chain,
+            amount,
+            wallet_path,
+            wallet_password,
+            get_wallet_address(wallet_path, wallet_password),
+            deposit_addr,
+        )
+        for wallet_path, wallet_password in wallets
+    ]
+    wait_for_transactions(main_chain, tx_ids)
+
+    pending_wallets = list(wallets)
+
+    def check_balances() -> None:
+        nonlocal pending_wallets
+        pending_wallets = [
+            (wallet_path, wallet_password)
+            for wallet_path, wallet_password in pending_wallets
+            if get_balance(shell, morph_chain, wallet_path, wallet_password)
+            < expected_balances[wallet_path]
+        ]
+        if pending_wallets:
+            wallet_paths = [wallet_path for wallet_path, _ in pending_wallets]
+            raise AssertionError(f"Deposits to wallets {wallet_paths} haven't been credited")
+
+    block_time = parse_time(MORPH_BLOCK_TIME)
+    poll(
+        check_balances,
+        timeout=block_time * DEPOSIT_CREDIT_TIMEOUT_BLOCKS,
+        max_interval=block_time / 2,
     )
-    address_to = address_to or get_last_address_from_wallet(wallet_to_path, wallet_to_password)
 
+
+def _send_gas(
+    shell: Shell,
+    main_chain: MainChain,
+    amount: int,
+    wallet_from_path: str,
+    wallet_from_password: str,
+    address_from: str,
+    address_to: str,
+) -> str:
     neogo = NeoGo(shell, neo_go_exec_path=NEOGO_EXECUTABLE)
     out = neogo.nep17.transfer(
         rpc_endpoint=main_chain.get_endpoint(),
@@ -157,12 +336,44 @@ def transfer_gas(
         token="GAS",
         force=True,
     )
-    txid = out.stdout.strip().split("\n")[-1]
+    return _parse_txid(out.stdout)
+
+
+def _multitransfer_gas(
+    shell: Shell,
+    main_chain: MainChain,
+    wallet_from_path: str,
+    wallet_from_password: str,
+    address_from: str,
+    recipients: list[str],
+) -> str:
+    """
+    Sends single multitransfer transaction and returns its ID. Recipients are given in
+    "token:address:amount" form.
+    """
+    # NeoGo.nep17.multitransfer can't pass wallet password and passes recipients as --to flags,
+    # while neo-go expects them as positional arguments after all flags
+    command = (
+        f"{NEOGO_EXECUTABLE} wallet nep17 multitransfer "
+        f"--rpc-endpoint '{main_chain.get_endpoint()}' --wallet '{wallet_from_path}' "
+        f"--from '{address_from}' --force {' '.join(recipients)}"
+    )
+    out = shell.exec(
+        command,
+        CommandOptions(
+            interactive_inputs=[
+                InteractiveInput(prompt_pattern="assword", input=wallet_from_password)
+            ]
+        ),
+    )
+    return _parse_txid(out.stdout)
+
+
+def _parse_txid(output: str) -> str:
+    txid = output.strip().split("\n")[-1]
     if len(txid) != 64:
         raise Exception("Got no TXID after run the command")
-    if not transaction_accepted(main_chain, txid):
-        raise AssertionError(f"TX {txid} hasn't been processed")
-    time.sleep(parse_time(MAINNET_BLOCK_TIME))
+    return txid
 
 
 @allure.step("NeoFS Deposit")
@@ -179,7 +390,7 @@ def deposit_gas(
     # get NeoFS contract address
     deposit_addr = contract_hash_to_address(NEOFS_CONTRACT)
     logger.info(f"NeoFS contract address: {deposit_addr}")
-    address_from = get_last_address_from_wallet(
+    address_from = get_wallet_address(
         wallet_path=wallet_from_path, wallet_password=wallet_from_password
     )
     transfer_gas(
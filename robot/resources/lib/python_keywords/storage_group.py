@@ -6,12 +6,11 @@ import logging
 from typing import Optional
 
 import allure
+from cli_helpers import get_neofs_cli
 from cluster import Cluster
-from common import NEOFS_CLI_EXEC, WALLET_CONFIG
-from complex_object_actions import get_link_object
-from neofs_testlib.cli import NeofsCli
+from common import WALLET_CONFIG
+from complex_object_actions import get_complex_object_layout
 from neofs_testlib.shell import Shell
-from neofs_verbs import head_object
 
 logger = logging.getLogger("NeoLogger")
 
@@ -42,7 +41,7 @@ def put_storagegroup(
     Returns:
         Object ID of created Storage Group.
     """
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
+    neofscli = get_neofs_cli(shell, wallet_config)
     result = neofscli.storagegroup.put(
         wallet=wallet,
         cid=cid,
@@ -76,7 +75,7 @@ def list_storagegroup(
     Returns:
         Object IDs of found Storage Groups.
     """
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
+    neofscli = get_neofs_cli(shell, wallet_config)
     result = neofscli.storagegroup.list(
         wallet=wallet,
         cid=cid,
@@ -110,7 +109,7 @@ def get_storagegroup(
     Returns:
         Detailed information on the Storage Group.
     """
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
+    neofscli = get_neofs_cli(shell, wallet_config)
     result = neofscli.storagegroup.get(
         wallet=wallet,
         cid=cid,
@@ -159,7 +158,7 @@ def delete_storagegroup(
     Returns:
         Tombstone ID of the deleted Storage Group.
     """
-    neofscli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
+    neofscli = get_neofs_cli(shell, wallet_config)
     result = neofscli.storagegroup.delete(
         wallet=wallet,
         cid=cid,
@@ -209,26 +208,17 @@ def verify_get_storage_group(
     endpoint = cluster.default_rpc_endpoint
     if object_size > max_object_size:
         for obj in obj_list:
-            link_oid = get_link_object(
+            layout = get_complex_object_layout(
                 wallet,
                 cid,
                 obj,
                 shell=shell,
-                nodes=cluster.storage_nodes,
+                cluster=cluster,
                 bearer=bearer,
                 wallet_config=wallet_config,
+                with_lengths=False,
             )
-            obj_head = head_object(
-                wallet=wallet,
-                cid=cid,
-                oid=link_oid,
-                shell=shell,
-                endpoint=endpoint,
-                is_raw=True,
-                bearer=bearer,
-                wallet_config=wallet_config,
-            )
-            obj_parts = obj_head["header"]["split"]["children"]
+            obj_parts = layout.children
 
     obj_num = len(obj_list)
     storagegroup_data = get_storagegroup(
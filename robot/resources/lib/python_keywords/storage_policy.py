@@ -6,7 +6,7 @@
 """
 
 import logging
-from typing import List
+from typing import Iterator, Optional
 
 import allure
 import complex_object_actions
@@ -14,13 +14,23 @@ import neofs_verbs
 from cluster import StorageNode
 from grpc_responses import OBJECT_NOT_FOUND, error_matches_status
 from neofs_testlib.shell import Shell
+from parallel import TaskResult, fan_out
 
 logger = logging.getLogger("NeoLogger")
 
+# Maximum time (in seconds) we wait for a direct HEAD response from a single node
+NODE_PROBE_TIMEOUT = 30
+
 
 @allure.step("Get Object Copies")
 def get_object_copies(
-    complexity: str, wallet: str, cid: str, oid: str, shell: Shell, nodes: list[StorageNode]
+    complexity: str,
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    expected_copies: Optional[int] = None,
 ) -> int:
     """
     The function performs requests to all nodes of the container and
@@ -35,24 +45,32 @@ def get_object_copies(
         cid (str): ID of the container
         oid (str): ID of the Object
         shell: executor for cli command
+        expected_copies: if set, stop polling nodes as soon as it is known that
+                            the number of copies differs from this value
     Returns:
         (int): the number of object copies in the container
     """
     return (
-        get_simple_object_copies(wallet, cid, oid, shell, nodes)
+        get_simple_object_copies(wallet, cid, oid, shell, nodes, expected_copies)
         if complexity == "Simple"
-        else get_complex_object_copies(wallet, cid, oid, shell, nodes)
+        else get_complex_object_copies(wallet, cid, oid, shell, nodes, expected_copies)
     )
 
 
 @allure.step("Get Simple Object Copies")
 def get_simple_object_copies(
-    wallet: str, cid: str, oid: str, shell: Shell, nodes: list[StorageNode]
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    expected_copies: Optional[int] = None,
 ) -> int:
     """
     To figure out the number of a simple object copies, only direct
     HEAD requests should be made to the every node of the container.
     We consider non-empty HEAD response as a stored object copy.
+    Requests are sent to all nodes concurrently.
     Args:
         wallet (str): the path to the wallet on whose behalf the
                             copies are got
@@ -60,27 +78,37 @@ def get_simple_object_copies(
         oid (str): ID of the Object
         shell: executor for cli command
         nodes: nodes to search on
+        expected_copies: if set, stop polling nodes as soon as the number of found
+                            copies exceeds this value or can no longer reach it; in this
+                            case the returned number is not necessarily the total one
     Returns:
         (int): the number of object copies in the container
     """
     copies = 0
-    for node in nodes:
-        try:
-            response = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=node.get_rpc_endpoint(), is_direct=True
-            )
-            if response:
-                logger.info(f"Found object {oid} on node {node}")
-                copies += 1
-        except Exception:
-            logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
+    nodes_left = len(nodes)
+    for probe in _head_object_on_nodes(cid, oid, shell, nodes, wallet=wallet):
+        nodes_left -= 1
+        if probe.ok and probe.result:
+            logger.info(f"Found object {oid} on node {probe.item}")
+            copies += 1
+        else:
+            logger.info(f"No {oid} object copy found on {probe.item}, continue")
+
+        if expected_copies is not None and (
+            copies > expected_copies or copies + nodes_left < expected_copies
+        ):
+            break
     return copies
 
 
 @allure.step("Get Complex Object Copies")
 def get_complex_object_copies(
-    wallet: str, cid: str, oid: str, shell: Shell, nodes: list[StorageNode]
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    expected_copies: Optional[int] = None,
 ) -> int:
     """
     To figure out the number of a complex object copies, we firstly
@@ -94,12 +122,14 @@ def get_complex_object_copies(
         cid (str): ID of the container
         oid (str): ID of the Object
         shell: executor for cli command
+        expected_copies: if set, stop polling nodes as soon as it is known that
+                            the number of copies differs from this value
     Returns:
         (int): the number of object copies in the container
     """
     last_oid = complex_object_actions.get_last_object(wallet, cid, oid, shell, nodes)
     assert last_oid, f"No Last Object for {cid}/{oid} found among all Storage Nodes"
-    return get_simple_object_copies(wallet, cid, last_oid, shell, nodes)
+    return get_simple_object_copies(wallet, cid, last_oid, shell, nodes, expected_copies)
 
 
 @allure.step("Get Nodes With Object")
@@ -119,26 +149,14 @@ def get_nodes_with_object(
     """
 
     nodes_list = []
-    for node in nodes:
-        wallet = node.get_wallet_path()
-        wallet_config = node.get_wallet_config_path()
-        try:
-            res = neofs_verbs.head_object(
-                wallet,
-                cid,
-                oid,
-                shell=shell,
-                endpoint=node.get_rpc_endpoint(),
-                is_direct=True,
-                wallet_config=wallet_config,
-            )
-            if res is not None:
-                logger.info(f"Found object {oid} on node {node}")
-                nodes_list.append(node)
-        except Exception:
-            logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
-    return nodes_list
+    for probe in _head_object_on_nodes(cid, oid, shell, nodes):
+        if probe.ok and probe.result is not None:
+            logger.info(f"Found object {oid} on node {probe.item}")
+            nodes_list.append(probe.item)
+        else:
+            logger.info(f"No {oid} object copy found on {probe.item}, continue")
+    # Keep the order of the given nodes regardless of the order in which nodes responded
+    return [node for node in nodes if node in nodes_list]
 
 
 @allure.step("Get Nodes Without Object")
@@ -158,16 +176,42 @@ def get_nodes_without_object(
          (list): nodes which do not store the object
     """
     nodes_list = []
-    for node in nodes:
-        try:
-            res = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=node.get_rpc_endpoint(), is_direct=True
-            )
-            if res is None:
-                nodes_list.append(node)
-        except Exception as err:
-            if error_matches_status(err, OBJECT_NOT_FOUND):
-                nodes_list.append(node)
-            else:
-                raise Exception(f"Got error {err} on head object command") from err
-    return nodes_list
+    for probe in _head_object_on_nodes(cid, oid, shell, nodes, wallet=wallet):
+        if probe.ok:
+            if probe.result is None:
+                nodes_list.append(probe.item)
+        elif error_matches_status(probe.error, OBJECT_NOT_FOUND):
+            nodes_list.append(probe.item)
+        else:
+            raise Exception(f"Got error {probe.error} on head object command") from probe.error
+    return [node for node in nodes if node in nodes_list]
+
+
+def _head_object_on_nodes(
+    cid: str, oid: str, shell: Shell, nodes: list[StorageNode], wallet: Optional[str] = None
+) -> Iterator[TaskResult]:
+    """
+    Sends direct HEAD request for the object to all given nodes at once.
+    Args:
+         cid: ID of the container which stores the object
+         oid: object ID
+         shell: executor for cli command
+         nodes: nodes to send requests to
+         wallet: wallet on whose behalf requests are made; if not set, the own
+                 wallet of every node is used
+    Returns:
+         iterator over HEAD results (or errors) in order of node responses
+    """
+
+    def head_on_node(node: StorageNode):
+        return neofs_verbs.head_object(
+            wallet or node.get_wallet_path(),
+            cid,
+            oid,
+            shell=shell,
+            endpoint=node.get_rpc_endpoint(),
+            is_direct=True,
+            wallet_config=None if wallet else node.get_wallet_config_path(),
+        )
+
+    return fan_out(head_on_node, nodes, timeout=NODE_PROBE_TIMEOUT)
@@ -21,11 +21,21 @@ GAS_HASH = os.getenv("GAS_HASH", "0xd2a4cff31913016155e38e474a2c06d08be276cf")
 
 NEOFS_CONTRACT = os.getenv("NEOFS_IR_CONTRACTS_NEOFS")
 
+# When tests are running in parallel with pytest-xdist, every worker process gets its own assets
+# directory and wallet config, so that workers do not remove or overwrite each other's files
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "")
 ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir")
+if XDIST_WORKER:
+    ASSETS_DIR = f"{ASSETS_DIR}_{XDIST_WORKER}"
 DEVENV_PATH = os.getenv("DEVENV_PATH", os.path.join("..", "neofs-dev-env"))
 
 # Password of wallet owned by user on behalf of whom we are running tests
 WALLET_PASS = os.getenv("WALLET_PASS", "")
+# Number of wallets that are created and funded together; 0 disables batching.
+# Every pytest-xdist worker keeps its own pool, so with -n N up to N * WALLET_POOL_SIZE wallets
+# are funded. 4 covers wallets of a typical module (default, owner, user and stranger wallets)
+# with a single batch, while not wasting much GAS on wallets that remain unused
+WALLET_POOL_SIZE = int(os.getenv("WALLET_POOL_SIZE", "4"))
 
 
 # Paths to CLI executables on machine that runs tests
@@ -38,6 +48,8 @@ NEOFS_ADM_EXEC = os.getenv("NEOFS_ADM_EXEC", "neofs-adm")
 NEOFS_ADM_CONFIG_PATH = os.getenv("NEOFS_ADM_CONFIG_PATH")
 
 FREE_STORAGE = os.getenv("FREE_STORAGE", "false").lower() == "true"
+# Run AWS CLI commands in a single long-lived awscli process instead of spawning `aws` every time
+AWS_CLI_PERSISTENT = os.getenv("AWS_CLI_PERSISTENT", "false").lower() == "true"
 BIN_VERSIONS_FILE = os.getenv("BIN_VERSIONS_FILE")
 
 HOSTING_CONFIG_FILE = os.getenv("HOSTING_CONFIG_FILE", ".devenv.hosting.yaml")
@@ -45,8 +57,21 @@ STORAGE_NODE_SERVICE_NAME_REGEX = r"s\d\d"
 HTTP_GATE_SERVICE_NAME_REGEX = r"http-gate\d\d"
 S3_GATE_SERVICE_NAME_REGEX = r"s3-gate\d\d"
 
+# Max number of keep-alive connections to a single HTTP gate endpoint
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))
+
+# Lock file shared by all pytest-xdist workers to serialize tests that mutate the cluster
+CLUSTER_LOCK_FILE = os.getenv("CLUSTER_LOCK_FILE", os.path.join(os.getcwd(), ".cluster.lock"))
+# Directory where every pytest-xdist worker keeps a file with its pid while it is running
+XDIST_WORKERS_DIR = f"{CLUSTER_LOCK_FILE}.workers"
+# How long (in seconds) the first pytest-xdist worker waits for the others to finish, so that
+# it collects logs of the whole run
+XDIST_WORKERS_FINISH_TIMEOUT = int(os.getenv("XDIST_WORKERS_FINISH_TIMEOUT", "3600"))
+
 # Generate wallet configs
 # TODO: we should move all info about wallet configs to fixtures
-WALLET_CONFIG = os.path.join(os.getcwd(), "wallet_config.yml")
+WALLET_CONFIG = os.path.join(
+    os.getcwd(), f"wallet_config_{XDIST_WORKER}.yml" if XDIST_WORKER else "wallet_config.yml"
+)
 with open(WALLET_CONFIG, "w") as file:
     yaml.dump({"password": WALLET_PASS}, file)